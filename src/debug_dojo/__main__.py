@@ -1,6 +1,6 @@
 """Entry point for the debug_dojo package."""
 
 if __name__ == "__main__":
-    from debug_dojo._cli import main
+    from debug_dojo._entry import main
 
     main()
@@ -0,0 +1,405 @@
+"""Element-wise comparison of array-like and tabular objects.
+
+Arrays are detected by duck typing, without depending on any array library: objects
+exposing `__array__` (NumPy arrays, pandas and polars objects, tensors) are converted
+through that method, and objects supporting the buffer protocol (`array.array`,
+`memoryview`, `bytes`) are used directly. Elements are compared through C-level
+iterators (`map`, `itertools.compress`) over flat memory views, so no Python code runs
+per element and nothing is rendered beyond a summary. Tabular objects (exposing
+`columns`) are aligned by column name first.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from itertools import compress, count, filterfalse
+from operator import ne, sub
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+SAMPLE_SIZE = 5
+"""Default number of differing indices reported."""
+
+_CHUNK_BYTES = 1 << 16
+
+
+class _Flat(NamedTuple):
+    """An array flattened to one dimension, in C order."""
+
+    values: Sequence[object]
+    shape: tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True)
+class ArrayComparison:
+    """Summary of an element-wise comparison of two arrays or tables."""
+
+    left_shape: tuple[int, ...]
+    """Shape of the first object."""
+    right_shape: tuple[int, ...]
+    """Shape of the second object."""
+    left_dtype: str
+    """Element type of the first object (per column for tables)."""
+    right_dtype: str
+    """Element type of the second object (per column for tables)."""
+    size: int = 0
+    """Number of compared elements."""
+    differing: int | None = None
+    """Number of differing elements, or None if the objects are not comparable."""
+    max_abs_difference: float | None = None
+    """Largest absolute difference between numeric elements, if any differ."""
+    sample: tuple[tuple[int | str, ...], ...] = ()
+    """Indices of the first differing elements (row and column name for tables)."""
+    left_only: tuple[str, ...] = ()
+    """Columns found only in the first table."""
+    right_only: tuple[str, ...] = ()
+    """Columns found only in the second table."""
+
+    @property
+    def identical(self) -> bool:
+        """Whether the objects have the same shape, columns and elements."""
+        return self.differing == 0 and not self.left_only and not self.right_only
+
+
+def _has_array_interface(obj: object) -> bool:
+    return not isinstance(obj, type) and hasattr(type(obj), "__array__")
+
+
+def is_array_like(obj: object) -> bool:
+    """Check whether an object can be compared element-wise.
+
+    >>> from array import array
+    >>> is_array_like(array("d", [1.0])), is_array_like([1.0]), is_array_like("a")
+    (True, False, False)
+
+    Returns:
+        bool: True for objects exposing `__array__` or the buffer protocol.
+
+    """
+    if isinstance(obj, (str, type)):
+        return False
+    if _has_array_interface(obj):
+        return True
+    try:
+        _ = memoryview(obj)  # pyright: ignore[reportArgumentType]
+    except TypeError:
+        return False
+    return True
+
+
+def is_tabular(obj: object) -> bool:
+    """Check whether an object is a table with named columns, such as a DataFrame.
+
+    Returns:
+        bool: True for array-like objects exposing `columns`.
+
+    """
+    return _has_array_interface(obj) and hasattr(type(obj), "columns")
+
+
+def _flatten(values: object) -> list[object]:
+    """Flatten nested lists, as returned by `tolist()` on multi-dimensional arrays.
+
+    Returns:
+        list[object]: The leaves, in order.
+
+    """
+    if not isinstance(values, list):
+        return [values]
+    flat: list[object] = []
+    for value in cast("list[object]", values):
+        flat.extend(_flatten(value))
+    return flat
+
+
+def _flat_view(view: memoryview) -> Sequence[object]:
+    """Return a one-dimensional view of a buffer, copying only if it is strided.
+
+    Returns:
+        Sequence[object]: The elements, in C order.
+
+    """
+    if view.ndim == 1:
+        return view
+    try:
+        if view.c_contiguous:
+            return view.cast("B").cast(view.format)  # pyright: ignore[reportCallIssue, reportArgumentType, reportUnknownVariableType]
+        return memoryview(view.tobytes()).cast(view.format)  # pyright: ignore[reportCallIssue, reportArgumentType, reportUnknownVariableType]
+    except (TypeError, ValueError):
+        # Non-native formats cannot be cast; fall back to Python objects.
+        return _flatten(view.tolist())
+
+
+def as_flat(obj: object) -> _Flat | None:
+    """Flatten an array-like object for element-wise comparison.
+
+    Returns:
+        _Flat | None: The flat elements with the original shape and element type, or
+            None if the object cannot be converted.
+
+    """
+    source: object = obj
+    if _has_array_interface(obj):
+        try:
+            source = cast("object", obj.__array__())  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+        except Exception:  # noqa: BLE001
+            return None
+
+    dtype: object = getattr(obj, "dtype", None)
+    try:
+        view = memoryview(source)  # pyright: ignore[reportArgumentType]
+    except TypeError:
+        # Arrays of Python objects have no buffer, but can still be listed.
+        tolist: object = getattr(source, "tolist", None)
+        if not callable(tolist):
+            return None
+        shape = cast("tuple[int, ...]", tuple(getattr(source, "shape", ())))
+        return _Flat(_flatten(tolist()), shape, str(dtype))
+
+    shape = view.shape or ()
+    return _Flat(_flat_view(view), shape, view.format if dtype is None else str(dtype))
+
+
+def _unravel(index: int, shape: tuple[int, ...]) -> tuple[int, ...]:
+    """Convert a flat index into an index per dimension.
+
+    >>> _unravel(5, (2, 3))
+    (1, 2)
+
+    Returns:
+        tuple[int, ...]: The multi-dimensional index.
+
+    """
+    position: list[int] = []
+    for dimension in reversed(shape or (index + 1,)):
+        index, remainder = divmod(index, dimension)
+        position.append(remainder)
+    return tuple(reversed(position))
+
+
+class _ElementDifferences(NamedTuple):
+    """Differences between two flat sequences of equal length."""
+
+    differing: int
+    max_abs: float | None
+    indices: list[int]
+
+
+def _is_nan(value: object) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _differing_ranges(
+    left: Sequence[object], right: Sequence[object]
+) -> list[tuple[int, int]]:
+    """Find the element ranges that may differ by comparing raw memory in chunks.
+
+    Equal bytes mean equal elements (or NaNs with the same bits), so only chunks whose
+    bytes differ need an element-wise comparison.
+
+    Returns:
+        list[tuple[int, int]]: Start and stop indices of the ranges to compare.
+
+    """
+    size = len(left)
+    if not (
+        isinstance(left, memoryview)
+        and isinstance(right, memoryview)
+        and left.format == right.format
+    ):
+        return [(0, size)]
+
+    step = max(_CHUNK_BYTES // left.itemsize, 1)
+    return [
+        (start, min(start + step, size))
+        for start in range(0, size, step)
+        if left[start : start + step].tobytes() != right[start : start + step].tobytes()
+    ]
+
+
+def _chunk_differences(
+    left: Sequence[object], right: Sequence[object], sample_size: int
+) -> _ElementDifferences:
+    """Compare two flat sequences element by element.
+
+    NaNs in the same position are considered equal.
+
+    Returns:
+        _ElementDifferences: The number of differing elements, the largest absolute
+            difference and the first differing indices.
+
+    """
+    differing = sum(map(ne, left, right))
+    if not differing:
+        return _ElementDifferences(0, None, [])
+
+    # x != x only holds for NaN, so this counts positions where both sides are NaN.
+    both_nan = sum(compress(map(ne, right, right), map(ne, left, left)))
+    indices: list[int] = []
+    for index in compress(count(), map(ne, left, right)):
+        if len(indices) >= sample_size:
+            break
+        if not (_is_nan(left[index]) and _is_nan(right[index])):
+            indices.append(index)
+
+    try:
+        subtract = cast("Callable[[object, object], float]", sub)
+        deltas = map(abs, map(subtract, left, right))
+        max_abs = max(filterfalse(math.isnan, deltas), default=None)
+    except TypeError:
+        max_abs = None
+    return _ElementDifferences(differing - both_nan, max_abs, indices)
+
+
+def _element_differences(
+    left: Sequence[object], right: Sequence[object], sample_size: int
+) -> _ElementDifferences:
+    """Compare two flat sequences of equal length, skipping chunks with equal bytes.
+
+    Returns:
+        _ElementDifferences: The number of differing elements, the largest absolute
+            difference and the first differing flat indices.
+
+    """
+    differing = 0
+    max_abs: float | None = None
+    indices: list[int] = []
+    for start, stop in _differing_ranges(left, right):
+        whole = start == 0 and stop == len(left)
+        chunk = _chunk_differences(
+            left if whole else left[start:stop],
+            right if whole else right[start:stop],
+            sample_size - len(indices),
+        )
+        differing += chunk.differing
+        indices.extend(start + index for index in chunk.indices)
+        if chunk.max_abs is not None:
+            max_abs = chunk.max_abs if max_abs is None else max(max_abs, chunk.max_abs)
+    return _ElementDifferences(differing, max_abs, indices)
+
+
+def _compare_flat(left: _Flat, right: _Flat, sample_size: int) -> ArrayComparison:
+    comparison = ArrayComparison(left.shape, right.shape, left.dtype, right.dtype)
+    if left.shape != right.shape or len(left.values) != len(right.values):
+        return comparison
+
+    differences = _element_differences(left.values, right.values, sample_size)
+    return ArrayComparison(
+        left.shape,
+        right.shape,
+        left.dtype,
+        right.dtype,
+        size=len(left.values),
+        differing=differences.differing,
+        max_abs_difference=differences.max_abs,
+        sample=tuple(_unravel(index, left.shape) for index in differences.indices),
+    )
+
+
+def _columns(table: object) -> list[object]:
+    return list(cast("Iterable[object]", table.columns))  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def _column(table: object, label: object) -> _Flat | None:
+    try:
+        column = cast("object", table[label])  # pyright: ignore[reportIndexIssue]
+    except Exception:  # noqa: BLE001
+        return None
+    return as_flat(column)
+
+
+def _table_shape(table: object) -> tuple[int, ...]:
+    return cast("tuple[int, ...]", tuple(getattr(table, "shape", ())))
+
+
+def _compare_tables(left: object, right: object, sample_size: int) -> ArrayComparison:
+    """Compare two tables column by column, aligning columns by label.
+
+    Columns are looked up by their original labels, which need not be strings (e.g.
+    the integer labels of a default DataFrame); labels are turned into strings only
+    for display.
+
+    Returns:
+        ArrayComparison: The comparison, with indices as (row, column name).
+
+    """
+    left_columns, right_columns = _columns(left), _columns(right)
+    common = [label for label in left_columns if label in right_columns]
+    left_dtypes: list[str] = []
+    right_dtypes: list[str] = []
+    size = differing = 0
+    max_abs: float | None = None
+    sample: list[tuple[int | str, ...]] = []
+    comparable = True
+
+    for label in common:
+        name = str(label)
+        left_column, right_column = _column(left, label), _column(right, label)
+        if left_column is None or right_column is None:
+            comparable = False
+            continue
+        if left_column.dtype != right_column.dtype:
+            left_dtypes.append(f"{name}: {left_column.dtype}")
+            right_dtypes.append(f"{name}: {right_column.dtype}")
+        column = _compare_flat(left_column, right_column, sample_size - len(sample))
+        if column.differing is None:
+            comparable = False
+            continue
+        size += column.size
+        differing += column.differing
+        if column.max_abs_difference is not None:
+            max_abs = max(max_abs or 0.0, column.max_abs_difference)
+        sample.extend((index[0], name) for index in column.sample)
+
+    return ArrayComparison(
+        _table_shape(left),
+        _table_shape(right),
+        ", ".join(left_dtypes) or "same",
+        ", ".join(right_dtypes) or "same",
+        size=size,
+        differing=differing if comparable else None,
+        max_abs_difference=max_abs,
+        sample=tuple(sample),
+        left_only=tuple(
+            str(label) for label in left_columns if label not in right_columns
+        ),
+        right_only=tuple(
+            str(label) for label in right_columns if label not in left_columns
+        ),
+    )
+
+
+def compare_arrays(
+    left: object, right: object, *, sample_size: int = SAMPLE_SIZE
+) -> ArrayComparison:
+    """Compare two array-like or tabular objects element-wise.
+
+    >>> from array import array
+    >>> result = compare_arrays(array("d", [1, 2, 3]), array("d", [1, 2.5, 4]))
+    >>> result.differing, result.max_abs_difference, result.sample
+    (2, 1.0, ((1,), (2,)))
+
+    Args:
+        left (object): The first object.
+        right (object): The second object.
+        sample_size (int): Number of differing indices to report.
+
+    Returns:
+        ArrayComparison: Shapes, element types and a summary of the differences.
+
+    """
+    if is_tabular(left) and is_tabular(right):
+        return _compare_tables(left, right, sample_size)
+
+    left_flat, right_flat = as_flat(left), as_flat(right)
+    if left_flat is None or right_flat is None:
+        unknown = _Flat((), (), "unknown")
+        left_flat, right_flat = left_flat or unknown, right_flat or unknown
+        return ArrayComparison(
+            left_flat.shape, right_flat.shape, left_flat.dtype, right_flat.dtype
+        )
+    return _compare_flat(left_flat, right_flat, sample_size)
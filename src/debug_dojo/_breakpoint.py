@@ -0,0 +1,283 @@
+"""Conditional breakpoints for the `b` tool.
+
+`b()` stops like `breakpoint()`, but it can also be left in hot loops: it only stops
+when its condition holds and its hit count matches, e.g. `b(x > 3)`, `b(every=10000)`,
+`b(after=5)` or `b(once=True)`. Hit counts are kept per call site.
+
+When a breakpoint does not fire, the cost is a condition check, or for hit-counted
+breakpoints one counter increment per call site. `b.disable()` turns every `b()` call
+into a near-free no-op, e.g. for leftover calls in production code.
+
+Tools that need to act at every stop, like the memory tracker taking a snapshot, can
+register a callback with `on_hit`; it runs before the debugger starts.
+
+`post_mortem` starts the same configured debugger on a failing traceback.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+from typing import TYPE_CHECKING, cast, final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from types import CodeType, FrameType, TracebackType
+
+_HIT_CALLBACKS: list[Callable[[FrameType], object]] = []
+"""Callbacks run whenever a breakpoint fires, before the debugger starts."""
+
+
+@contextlib.contextmanager
+def on_hit(callback: Callable[[FrameType], object]) -> Generator[None]:
+    """Run a callback whenever a `b()` breakpoint fires, while in the context.
+
+    The callback receives the frame that called `b`, and runs even when breakpoints
+    are disabled with `PYTHONBREAKPOINT=0`.
+
+    Args:
+        callback (Callable[[FrameType], object]): The function to call.
+
+    """
+    _HIT_CALLBACKS.append(callback)
+    try:
+        yield
+    finally:
+        _HIT_CALLBACKS.remove(callback)
+
+
+def start_debugger(frame: FrameType, hook: Callable[[], object] | None = None) -> None:
+    """Start the configured debugger, stopping in the given frame.
+
+    PDB, IPDB, PuDB and Debugpy are started directly on the frame, so they stop at
+    the user's call rather than in a debug-dojo wrapper. Other debuggers named in
+    `PYTHONBREAKPOINT` have no way to be given a frame, and stop in the caller of the
+    hook.
+
+    Args:
+        frame (FrameType): The frame to stop in.
+        hook (Callable[[], object] | None): Starts other debuggers; by default the
+                                            callable named in `PYTHONBREAKPOINT`.
+
+    """
+    name = os.environ.get("PYTHONBREAKPOINT", "pdb.set_trace")
+    if name == "0":
+        return
+    if name == "pdb.set_trace":
+        import pdb  # noqa: PLC0415, T100
+
+        pdb.Pdb().set_trace(frame)
+    elif name == "ipdb.set_trace":
+        import ipdb  # pyright: ignore[reportMissingTypeStubs]  # noqa: PLC0415, T100
+
+        ipdb.set_trace(frame)  # pyright: ignore[reportUnknownMemberType]  # noqa: T100
+    elif name == "pudb.set_trace":
+        _start_pudb(frame)
+    elif name == "debugpy.breakpoint":
+        _start_debugpy(frame)
+    else:
+        _ = (hook or _named_hook(name))()
+
+
+def _start_pudb(frame: FrameType) -> None:
+    """Start PuDB on a frame, as `pudb.set_trace` does on its caller's."""
+    import threading  # noqa: PLC0415
+
+    import pudb  # pyright: ignore[reportMissingTypeStubs]  # noqa: PLC0415, T100
+
+    debugger = pudb._get_debugger()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage, reportUnknownMemberType]
+    if threading.current_thread() is threading.main_thread():
+        pudb.set_interrupt_handler()
+    debugger.set_trace(frame)
+
+
+def _start_debugpy(frame: FrameType) -> None:
+    """Suspend in a frame for the attached client, as `debugpy.breakpoint` does.
+
+    Like `debugpy.breakpoint`, does nothing while no client is attached.
+
+    """
+    from debugpy.server import api  # noqa: PLC0415
+
+    if not api.is_client_connected():
+        return
+    api._settrace(  # noqa: SLF001  # pyright: ignore[reportPrivateUsage, reportUnknownMemberType]
+        suspend=True,
+        trace_only_current_thread=True,
+        patch_multiprocessing=False,
+        stop_at_frame=frame,
+    )
+
+
+def _named_hook(name: str) -> Callable[..., object]:
+    """Import the callable named in `PYTHONBREAKPOINT`, e.g. `web_pdb.set_trace`.
+
+    Returns:
+        Callable[..., object]: The callable.
+
+    """
+    from importlib import import_module  # noqa: PLC0415
+
+    module, _, attribute = name.rpartition(".")
+    return cast(
+        "Callable[..., object]", getattr(import_module(module or "builtins"), attribute)
+    )
+
+
+def breakpointhook(*args: object, **kwargs: object) -> object:
+    """Start the debugger named in `PYTHONBREAKPOINT` in the caller's frame.
+
+    The `sys.breakpointhook` of the lazy install mode: the debugger is imported on
+    the first `breakpoint()` only, and stops at that call rather than in the hook.
+    Arguments, e.g. `breakpoint(header=...)`, are passed to the debugger's own hook.
+
+    Returns:
+        object: Whatever the debugger's hook returns, when called with arguments.
+
+    """
+    if args or kwargs:
+        name = os.environ.get("PYTHONBREAKPOINT", "pdb.set_trace")
+        return None if name == "0" else _named_hook(name)(*args, **kwargs)
+    start_debugger(sys._getframe(1))  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+    return None
+
+
+def _enter_debugger(frame: FrameType) -> None:
+    """Run the `on_hit` callbacks, then start the configured debugger.
+
+    Args:
+        frame (FrameType): The frame that called `b`.
+
+    """
+    for callback in _HIT_CALLBACKS:
+        _ = callback(frame)
+    start_debugger(frame)
+
+
+def post_mortem(traceback: TracebackType) -> bool:
+    """Start a post-mortem session of the configured debugger on a traceback.
+
+    The debugger is the one selected in `PYTHONBREAKPOINT`, so it is imported only
+    now, e.g. IPython only for IPDB. Debugpy has no post-mortem session: the
+    exception is reported to an attached client as it happens.
+
+    Args:
+        traceback (TracebackType): The traceback of the failure.
+
+    Returns:
+        bool: True if a session was started, False if the debugger has none or
+              breakpoints are disabled with `PYTHONBREAKPOINT=0`.
+
+    """
+    hook = os.environ.get("PYTHONBREAKPOINT", "pdb.set_trace")
+    if hook in {"0", "debugpy.breakpoint"}:
+        return False
+    if hook == "ipdb.set_trace":
+        import ipdb  # pyright: ignore[reportMissingTypeStubs]  # noqa: PLC0415, T100
+
+        ipdb.post_mortem(traceback)  # pyright: ignore[reportUnknownMemberType]
+    elif hook == "pudb.set_trace":
+        import pudb  # pyright: ignore[reportMissingTypeStubs]  # noqa: PLC0415, T100
+
+        pudb.post_mortem(traceback)
+    else:
+        import pdb  # noqa: PLC0415, T100
+
+        pdb.post_mortem(traceback)
+    return True
+
+
+@final
+class Breakpoint:
+    """A `breakpoint()` replacement with conditions and per call site hit counts.
+
+    >>> b = Breakpoint()
+    >>> b.disable()
+    >>> b()
+    >>> b.enabled
+    False
+
+    """
+
+    __slots__ = ("_hits", "_spent", "enabled")
+
+    def __init__(self) -> None:
+        """Create an enabled breakpoint with no hits recorded."""
+        self.enabled: bool = True
+        self._hits: dict[tuple[CodeType, int], int] = {}
+        self._spent: set[tuple[CodeType, int]] = set()
+
+    def __call__(
+        self,
+        condition: object = True,  # noqa: FBT002
+        *,
+        every: int = 0,
+        after: int = 0,
+        once: bool = False,
+    ) -> None:
+        """Stop in the debugger if the condition holds and the hit count matches.
+
+        Only calls where the condition holds are counted as hits.
+
+        Args:
+            condition (object): Stop only if this value is truthy.
+            every (int): Stop only on every `every`-th hit, e.g. hits 100, 200, ... for
+                         `every=100`. 0 stops on every hit.
+            after (int): Ignore the first `after` hits.
+            once (bool): Stop at most once at this call site.
+
+        """
+        if not self.enabled or not condition:
+            return
+        frame = sys._getframe(1)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        self.hit(frame, every=every, after=after, once=once)
+
+    def hit(
+        self,
+        frame: FrameType,
+        condition: object = True,  # noqa: FBT002
+        *,
+        every: int = 0,
+        after: int = 0,
+        once: bool = False,
+    ) -> None:
+        """Count a hit of the call site of a frame, and stop there if it is due.
+
+        The same as calling `b` from that frame, for wrappers around `b`.
+
+        Args:
+            frame (FrameType): The frame that called `b`.
+            condition (object): Stop only if this value is truthy.
+            every (int): Stop only on every `every`-th hit.
+            after (int): Ignore the first `after` hits.
+            once (bool): Stop at most once at this call site.
+
+        """
+        if not self.enabled or not condition:
+            return
+        if every or after or once:
+            site = (frame.f_code, frame.f_lasti)
+            hits = self._hits[site] = self._hits.get(site, 0) + 1
+            if (
+                hits <= after
+                or (every and (hits - after) % every)
+                or site in self._spent
+            ):
+                return
+            if once:
+                self._spent.add(site)
+        _enter_debugger(frame)
+
+    def enable(self) -> None:
+        """Make `b()` calls stop again."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Turn every `b()` call into a no-op."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Forget the hit counts and `once` breakpoints that already stopped."""
+        self._hits.clear()
+        self._spent.clear()
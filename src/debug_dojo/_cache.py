@@ -0,0 +1,233 @@
+"""On-disk cache for debug-dojo.
+
+Validated and updated configurations are pickled, keyed by the configuration file path,
+its modification time and size, and the installed debug-dojo version. Repeated runs
+against an unchanged file skip TOML parsing and model validation entirely.
+
+Configuration discovery results are stored per starting directory, together with the
+modification times of every directory and file inspected on the way, so a result is
+reused only while no configuration file can have appeared or disappeared.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle  # noqa: S403
+from functools import cache
+from pathlib import Path
+from typing import TypeAlias, cast
+
+from debug_dojo._config_models import DebugDojoConfig
+
+CACHE_DIR_ENV_VAR = "DEBUG_DOJO_CACHE_DIR"
+"""Environment variable overriding the cache directory."""
+
+CacheKey: TypeAlias = tuple[str, int, int, str]
+
+_CONFIG_CACHE = "config"
+_DISCOVERY_CACHE = "discovery"
+_CACHE_ERRORS = (
+    AttributeError,
+    EOFError,
+    ImportError,
+    OSError,
+    TypeError,
+    ValueError,
+    pickle.UnpicklingError,
+)
+
+
+def cache_dir() -> Path:
+    """Return the directory used for debug-dojo caches.
+
+    Uses `DEBUG_DOJO_CACHE_DIR` if set, otherwise `$XDG_CACHE_HOME/debug-dojo` or
+    `~/.cache/debug-dojo`.
+
+    Returns:
+        Path: The cache directory, which may not exist yet.
+
+    """
+    if env_dir := os.environ.get(CACHE_DIR_ENV_VAR):
+        return Path(env_dir)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "debug-dojo"
+
+
+@cache
+def _package_version() -> str:
+    """Return the installed debug-dojo version.
+
+    Returns:
+        str: The version string, or "unknown" if the package metadata is missing.
+
+    """
+    # Imported here, as it costs more than the rest of the module on a cache miss.
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("debug-dojo")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _config_key(config_path: Path) -> CacheKey:
+    """Build the cache key for a configuration file.
+
+    Returns:
+        CacheKey: Path, modification time, size and debug-dojo version.
+
+    """
+    stat = config_path.stat()
+    return (str(config_path), stat.st_mtime_ns, stat.st_size, _package_version())
+
+
+def _entry_path(config_path: Path, kind: str = _CONFIG_CACHE) -> Path:
+    """Return the cache file for a configuration file or directory.
+
+    Returns:
+        Path: The path of the cache entry.
+
+    """
+    digest = hashlib.sha256(str(config_path).encode()).hexdigest()[:32]
+    suffix = "json" if kind == _DISCOVERY_CACHE else "pickle"
+    return cache_dir() / kind / f"{digest}.{suffix}"
+
+
+def stamp(path: Path) -> int:
+    """Return the modification time of a path, used to validate cache entries.
+
+    Returns:
+        int: The modification time in nanoseconds, or -1 if the path does not exist.
+
+    """
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a file atomically, so readers never see a partial entry.
+
+    Args:
+        path (Path): Destination file; parent directories are created.
+        data (bytes): Content to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+
+    """
+    from tempfile import NamedTemporaryFile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(dir=path.parent, delete=False) as tmp_file:
+        _ = tmp_file.write(data)
+    try:
+        _ = Path(tmp_file.name).replace(path)
+    except OSError:
+        Path(tmp_file.name).unlink(missing_ok=True)
+        raise
+
+
+def load_cached_config(config_path: Path) -> DebugDojoConfig | None:
+    """Load a cached configuration if it is still valid.
+
+    Args:
+        config_path (Path): The absolute path to the configuration file.
+
+    Returns:
+        DebugDojoConfig | None: The cached configuration, or None on a cache miss.
+
+    """
+    try:
+        key = _config_key(config_path)
+        data = _entry_path(config_path).read_bytes()
+        # The cache lives in a user-owned directory written only by debug-dojo.
+        cached_key, config = pickle.loads(data)  # noqa: S301  # pyright: ignore[reportAny]
+    except _CACHE_ERRORS:
+        return None
+
+    if cached_key != key or not isinstance(config, DebugDojoConfig):
+        return None
+    return config
+
+
+def store_cached_config(config_path: Path, config: DebugDojoConfig) -> None:
+    """Store a validated configuration in the cache.
+
+    Failures (e.g. a read-only home directory) are ignored, as the cache is only an
+    optimization.
+
+    Args:
+        config_path (Path): The absolute path to the configuration file.
+        config (DebugDojoConfig): The validated and updated configuration.
+
+    """
+    try:
+        data = pickle.dumps((_config_key(config_path), config))
+        write_atomic(_entry_path(config_path), data)
+    except (OSError, pickle.PicklingError):
+        return
+
+
+def load_cached_discovery(start: Path) -> tuple[bool, Path | None]:
+    """Load a cached configuration discovery result for a directory.
+
+    Args:
+        start (Path): The absolute directory the discovery started from.
+
+    Returns:
+        tuple[bool, Path | None]: Whether the cache was hit, and the discovered
+            configuration path (None if no configuration file was found).
+
+    """
+    try:
+        entry = json.loads(_entry_path(start, _DISCOVERY_CACHE).read_text("utf-8"))  # pyright: ignore[reportAny]
+        stamps = cast(dict[str, int], entry["stamps"])
+        found = cast(str | None, entry["found"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return False, None
+
+    if any(stamp(Path(path)) != mtime for path, mtime in stamps.items()):
+        return False, None
+    return True, Path(found) if found else None
+
+
+def store_cached_discovery(
+    start: Path,
+    found: Path | None,
+    stamps: dict[str, int],
+) -> None:
+    """Store a configuration discovery result for a directory.
+
+    Args:
+        start (Path): The absolute directory the discovery started from.
+        found (Path | None): The discovered configuration path, or None.
+        stamps (dict[str, int]): Modification times of every inspected path.
+
+    """
+    entry = {"found": str(found) if found else None, "stamps": stamps}
+    try:
+        write_atomic(_entry_path(start, _DISCOVERY_CACHE), json.dumps(entry).encode())
+    except OSError:
+        return
+
+
+def clear_cache() -> int:
+    """Remove all cached configurations and discovery results.
+
+    Returns:
+        int: The number of removed cache entries.
+
+    """
+    removed = 0
+    for kind in (_CONFIG_CACHE, _DISCOVERY_CACHE):
+        for entry in (cache_dir() / kind).glob("*.*"):
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            removed += 1
+    return removed
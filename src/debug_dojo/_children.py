@@ -0,0 +1,133 @@
+"""Installing debug-dojo in the child processes of `dojo run`.
+
+`dojo run` executes its target in-process, so Python processes started by the target
+(pytest-xdist workers, `multiprocessing` pools with the spawn or forkserver start
+method, worker processes of servers) would start without debug-dojo. Forked children
+inherit the installed tools, spawned ones do not.
+
+This is opt-in, with `subprocesses = true`: every Python child then gets the
+builtins, the breakpoint hook and the rich traceback hook. While the target runs,
+the validated configuration is pickled to a temporary directory together with a
+`sitecustomize.py`, and the directory is prepended to `PYTHONPATH`. Every child
+interpreter imports that `sitecustomize` at startup, which first runs the
+`sitecustomize` it shadows, if any, so a project's own one keeps working, even in
+interpreters without debug-dojo. It then loads the pickled configuration and installs
+the tools, without any TOML parsing or validation.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import pickle  # noqa: S403
+import shutil
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from debug_dojo._config_models import DebugDojoConfig, DebuggerType
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+CHILD_CONFIG_ENV_VAR = "DEBUG_DOJO_CHILD_CONFIG"
+"""Environment variable with the path of the configuration pickled for children."""
+
+_CONFIG_FILE = "config.pickle"
+_SITECUSTOMIZE = '''\
+"""Install debug-dojo in a child process of `dojo run`; written by debug-dojo."""
+
+import os
+import sys
+from importlib.machinery import PathFinder
+from importlib.util import module_from_spec
+
+# Run the sitecustomize this one shadows, even without debug-dojo installed.
+sys.path[:] = [entry for entry in sys.path if entry != os.path.dirname(__file__)]
+_spec = PathFinder.find_spec("sitecustomize", sys.path)
+if _spec is not None and _spec.loader is not None:
+    _spec.loader.exec_module(module_from_spec(_spec))
+
+try:
+    from debug_dojo._children import bootstrap
+except ImportError:  # An interpreter without debug-dojo.
+    pass
+else:
+    bootstrap()
+'''
+
+
+def child_config(config: DebugDojoConfig) -> DebugDojoConfig:
+    """Adapt a configuration for a child process.
+
+    Debugpy is replaced by PDB, as the children cannot all listen on the port of the
+    parent.
+
+    Returns:
+        DebugDojoConfig: The configuration to install in children.
+
+    """
+    if config.debuggers.default is not DebuggerType.DEBUGPY:
+        return config
+    debuggers = replace(config.debuggers, default=DebuggerType.PDB)
+    return replace(config, debuggers=debuggers)
+
+
+def bootstrap() -> None:
+    """Install debug-dojo from the pickled configuration, at interpreter startup.
+
+    Called by the generated `sitecustomize.py`, once it ran the one it shadows.
+    Children that outlive `dojo run`, and so its temporary directory, start without
+    debug-dojo.
+
+    """
+    try:
+        data = Path(os.environ[CHILD_CONFIG_ENV_VAR]).read_bytes()
+        # Written by the parent `dojo run` to a directory only it can write to.
+        config = pickle.loads(data)  # noqa: S301  # pyright: ignore[reportAny]
+    except (KeyError, OSError, EOFError, pickle.UnpicklingError):
+        return
+    if not isinstance(config, DebugDojoConfig):
+        return
+
+    from debug_dojo._installers import install_by_config  # noqa: PLC0415
+
+    install_by_config(config)
+
+
+@contextlib.contextmanager
+def propagated(config: DebugDojoConfig) -> Generator[Path]:
+    """Install debug-dojo in child Python processes started within the context.
+
+    Sets `PYTHONPATH` and `DEBUG_DOJO_CHILD_CONFIG`, and restores them and removes
+    the temporary directory on exit.
+
+    Args:
+        config (DebugDojoConfig): The validated configuration of the parent.
+
+    Yields:
+        Path: The temporary directory holding `sitecustomize.py` and the
+              configuration.
+
+    """
+    directory = Path(tempfile.mkdtemp(prefix="debug-dojo-"))
+    config_path = directory / _CONFIG_FILE
+    _ = config_path.write_bytes(pickle.dumps(child_config(config)))
+    _ = (directory / "sitecustomize.py").write_text(_SITECUSTOMIZE, encoding="utf-8")
+
+    saved = {
+        name: os.environ.get(name) for name in ("PYTHONPATH", CHILD_CONFIG_ENV_VAR)
+    }
+    python_path = [str(directory), *filter(None, [saved["PYTHONPATH"]])]
+    os.environ["PYTHONPATH"] = os.pathsep.join(python_path)
+    os.environ[CHILD_CONFIG_ENV_VAR] = str(config_path)
+    try:
+        yield directory
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                _ = os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(directory, ignore_errors=True)
@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import sys
+from functools import partial
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich import print as rich_print
 
+from debug_dojo._cache import clear_cache
 from debug_dojo._config import load_config
 from debug_dojo._config_models import DebuggerType  # noqa: TC001
 from debug_dojo._execution import ExecMode, execute_with_debug
+from debug_dojo._profiling import PSTATS_FILE, CallProfileOptions, CallSort
+from debug_dojo._server import (
+    default_socket_path,
+    is_supported,
+    run_warm,
+    serve_forever,
+    warm_up,
+)
+from debug_dojo._snapshot import replay_snapshot
+from debug_dojo._stats import ToolStats
+from debug_dojo._watch import is_supported as watch_supported
+from debug_dojo._watch import watch
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 cli = typer.Typer(
     name="debug_dojo",
@@ -50,6 +68,64 @@ def run(  # noqa: PLR0913
         bool,
         typer.Option("--exec", "-e", help="Run a command"),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Bypass the configuration cache"),
+    ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option("--profile", help="Profile the target with a sampling profiler"),
+    ] = False,
+    profile_output: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile-output", help="Write the profile as collapsed stacks to a file"
+        ),
+    ] = None,
+    cprofile: Annotated[
+        bool,
+        typer.Option("--cprofile", help="Profile every call of the target"),
+    ] = False,
+    cprofile_output: Annotated[
+        Path,
+        typer.Option("--cprofile-output", help="File to dump the call statistics to"),
+    ] = PSTATS_FILE,
+    cprofile_sort: Annotated[
+        CallSort,
+        typer.Option("--cprofile-sort", help="Order of the top functions"),
+    ] = CallSort.CUMULATIVE,
+    cprofile_filter: Annotated[
+        str | None,
+        typer.Option(
+            "--cprofile-filter", help="Only show functions of modules with this prefix"
+        ),
+    ] = None,
+    trace_malloc: Annotated[
+        bool,
+        typer.Option("--trace-malloc", help="Track memory allocations"),
+    ] = False,
+    warm: Annotated[
+        bool,
+        typer.Option("--warm", help="Run in a forked child of `dojo serve`"),
+    ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option("--watch", help="Run again whenever the source changes"),
+    ] = False,
+    preload: Annotated[
+        bool,
+        typer.Option(
+            "--preload", help="With --watch, keep third-party packages imported"
+        ),
+    ] = False,
+    stats: Annotated[
+        bool,
+        typer.Option("--stats", help="Count and time the debugging tool calls"),
+    ] = False,
+    stats_output: Annotated[
+        Path | None,
+        typer.Option("--stats-output", help="Write the tool statistics to a file"),
+    ] = None,
 ) -> None:
     """Run a Python script, module, or executable with debug-dojo tools.
 
@@ -72,10 +148,40 @@ def run(  # noqa: PLR0913
                        (e.g., `dojo -m my_package.my_module`).
         executable (bool): Treat `target_name` as an executable command to run
                            (e.g., `dojo -e pytest`).
+        no_cache (bool): Parse and validate the configuration file even if a cached
+                         result is available.
+        profile (bool): Sample the target's call stack while it runs and print where
+                        the time went at exit.
+        profile_output (Path | None): Write the profile to this file as collapsed
+                                      stacks (implies `--profile`).
+        cprofile (bool): Run the target under `cProfile` for exact call counts, and
+                         print the top functions at exit.
+        cprofile_output (Path): The `.pstats` file to dump the call statistics to.
+        cprofile_sort (CallSort): Order of the top functions: by cumulative time,
+                                  self time or number of calls.
+        cprofile_filter (str | None): Only show functions of modules starting with
+                                      this prefix.
+        trace_malloc (bool): Track memory allocations, and report the top allocation
+                             sites and their growth at start, at every `b()` hit and
+                             at exit.
+        warm (bool): Run in a child forked from a running `dojo serve`, which has
+                     everything imported already. Without a server, run as usual.
+        watch (bool): Run the target in a forked child, and again whenever the
+                      script or a project module it imported changes, until
+                      interrupted.
+        preload (bool): With `--watch`, import the third-party packages imported by
+                        the target in the watching process, so that the next run
+                        starts with them loaded. Only safe for packages that do not
+                        start threads or open resources on import.
+        stats (bool): Count and time the calls of `b`, `p`, `i`, `c` and
+                      `breakpoint()` per call site, and print them at exit.
+        stats_output (Path | None): Write the tool statistics to this JSON file
+                                    instead (implies `--stats`), see `dojo stats`.
 
     Raises:
-        typer.Exit: If `--module` and `--exec` are used together, or if the target
-                    cannot be executed, or if an error occurs during execution.
+        typer.Exit: If `--module` and `--exec`, or `--cprofile` and `--profile` are
+                    used together, or if the target cannot be executed, or if an
+                    error occurs during execution.
 
     """
     if module and executable:
@@ -84,6 +190,21 @@ def run(  # noqa: PLR0913
         )
         raise typer.Exit(1)
 
+    if cprofile and (profile or profile_output):
+        rich_print(
+            "[red]Error: --cprofile and --profile options are mutually exclusive.[/red]"
+        )
+        raise typer.Exit(1)
+
+    if warm:
+        code = run_warm(_warm_arguments(), default_socket_path())
+        if code is not None:
+            raise typer.Exit(code)
+        if verbose:
+            rich_print(
+                "[yellow]No dojo server is running, running in-process.[/yellow]"
+            )
+
     mode = (
         ExecMode.EXECUTABLE
         if executable
@@ -92,19 +213,42 @@ def run(  # noqa: PLR0913
         else ExecMode.FILE
     )
 
-    config = load_config(config_path, verbose=verbose, debugger=debugger)
+    config = load_config(
+        config_path, verbose=verbose, debugger=debugger, use_cache=not no_cache
+    )
 
     if verbose:
         rich_print(f"[blue]Using debug-dojo configuration: {config} [/blue]")
 
-    if target_name:
-        execute_with_debug(
-            target_name=target_name,
-            target_mode=mode,
-            target_args=ctx.args,
-            verbose=verbose,
-            config=config,
+    if not target_name:
+        return
+
+    execute = partial(
+        execute_with_debug,
+        target_name=target_name,
+        target_mode=mode,
+        target_args=ctx.args,
+        verbose=verbose,
+        config=config,
+        profile=profile,
+        profile_output=profile_output,
+        call_profile=CallProfileOptions(
+            output=cprofile_output, sort=cprofile_sort, prefix=cprofile_filter
+        )
+        if cprofile
+        else None,
+        trace_malloc=trace_malloc,
+        stats=stats,
+        stats_output=stats_output,
+    )
+    if watch:
+        _watch(
+            execute,
+            [Path(target_name)] if mode is ExecMode.FILE else [],
+            preload=preload,
         )
+    else:
+        execute()
 
 
 @cli.command(
@@ -116,12 +260,184 @@ def config(
     config_path: Annotated[
         Path | None, typer.Option("--config", "-c", help="Show configuration")
     ] = None,
+    *,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Bypass the configuration cache"),
+    ] = False,
+    clear: Annotated[
+        bool,
+        typer.Option("--clear-cache", help="Remove cached configurations first"),
+    ] = False,
 ) -> None:
     """Display resolved and updated config."""
-    config = load_config(config_path, verbose=True, debugger=None)
+    if clear:
+        removed = clear_cache()
+        rich_print(f"[blue]Removed {removed} cache file(s).[/blue]")
+
+    config = load_config(
+        config_path, verbose=True, debugger=None, use_cache=not no_cache
+    )
     rich_print(f"[blue]Using debug-dojo configuration:\n{config} [/blue]")
 
 
+@cli.command(help="Browse a post-mortem snapshot.", no_args_is_help=True)
+def replay(
+    snapshot_path: Annotated[
+        Path,
+        typer.Argument(
+            help="The snapshot file to browse.", metavar="snapshot", exists=True
+        ),
+    ],
+    *,
+    browse: Annotated[
+        bool | None,
+        typer.Option(
+            "--browse/--no-browse",
+            help="Browse the frames after the summary, by default on a terminal",
+        ),
+    ] = None,
+) -> None:
+    """Show a post-mortem snapshot and browse its frames.
+
+    Args:
+        snapshot_path (Path): The snapshot file written by a failing `dojo run`.
+        browse (bool | None): Open the frame browser after printing the failure and
+                              the innermost frame. By default, only if the standard
+                              input is a terminal.
+
+    """
+    replay_snapshot(
+        snapshot_path, browse=sys.stdin.isatty() if browse is None else browse
+    )
+
+
+@cli.command(help="Show recorded debugging tool statistics.", no_args_is_help=True)
+def stats(
+    stats_path: Annotated[
+        Path,
+        typer.Argument(
+            help="The statistics file to show.", metavar="stats", exists=True
+        ),
+    ],
+) -> None:
+    """Show the statistics written by `dojo run --stats-output`.
+
+    Args:
+        stats_path (Path): The JSON file with the statistics.
+
+    """
+    rich_print(ToolStats.load(stats_path).table())
+
+
+@cli.command(help="Keep a warm interpreter for `dojo run --warm`.")
+def serve(
+    config_path: Annotated[
+        Path | None, typer.Option("--config", "-c", help="Configuration to warm up")
+    ] = None,
+    socket_path: Annotated[
+        Path | None,
+        typer.Option("--socket", help="Unix socket to listen on"),
+    ] = None,
+) -> None:
+    """Import everything a run needs once, then fork a child per `dojo run --warm`.
+
+    Args:
+        config_path (Path | None): The configuration whose debugger to import. Each
+                                   run still loads the configuration of its own
+                                   working directory.
+        socket_path (Path | None): The Unix socket to listen on; by default
+                                   `DEBUG_DOJO_SOCKET` or `dojo.sock` in the cache
+                                   directory.
+
+    Raises:
+        typer.Exit: If the platform cannot fork, or a server already listens.
+
+    """
+    if not is_supported():
+        rich_print("[red]Error: dojo serve needs fork and Unix sockets.[/red]")
+        raise typer.Exit(1)
+
+    missing = warm_up(load_config(config_path))
+    if missing:
+        rich_print(f"[yellow]Could not import: {', '.join(missing)}.[/yellow]")
+
+    path = socket_path or default_socket_path()
+    try:
+        serve_forever(
+            path,
+            _run_forked,
+            ready=lambda: rich_print(f"[blue]Serving warm runs on {path}.[/blue]"),
+        )
+    except OSError as e:
+        rich_print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+
+def _watch(
+    execute: Callable[[], None], files: list[Path], *, preload: bool = False
+) -> None:
+    """Run the target in forked children until interrupted, see `dojo run --watch`.
+
+    Args:
+        execute (Callable[[], None]): Runs the target once.
+        files (list[Path]): The files to watch from the start.
+        preload (bool): Keep the third-party packages imported between runs.
+
+    Raises:
+        typer.Exit: If the platform cannot fork.
+
+    """
+    if not watch_supported():
+        rich_print("[red]Error: --watch needs fork, which is not available.[/red]")
+        raise typer.Exit(1)
+
+    def run_once() -> int:
+        try:
+            execute()
+        except typer.Exit as e:
+            return e.exit_code
+        return 0
+
+    try:
+        watch(
+            run_once,
+            files,
+            root=Path.cwd(),
+            notify=lambda message: rich_print(f"[blue]{message}[/blue]"),
+            preload=preload,
+        )
+    except KeyboardInterrupt:
+        rich_print("[blue]Stopped watching.[/blue]")
+
+
+def _warm_arguments() -> list[str]:
+    """Return the `dojo run` arguments of this process, without `--warm`.
+
+    Returns:
+        list[str]: The arguments following `run` on the command line.
+
+    """
+    arguments = sys.argv[sys.argv.index("run") + 1 :] if "run" in sys.argv else []
+    if "--warm" in arguments:
+        arguments.remove("--warm")
+    return arguments
+
+
+def _run_forked(argv: list[str]) -> int:
+    """Run `dojo run` with the given arguments, in a child forked by the server.
+
+    Returns:
+        int: The exit code.
+
+    """
+    try:
+        cli(["run", *argv], prog_name="dojo")
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+    return 0
+
+
 def main() -> None:
     """Run the command-line interface."""
     cli()
@@ -2,72 +2,696 @@
 
 This module provides functions to display attributes and methods of two objects in a
 visually appealing, side-by-side format in the terminal.
+
+Rendering cost is bounded regardless of object size: values are shown through a
+truncating repr with a per-value size budget, and members are listed one page of at
+most `max_members` entries at a time. The member names of each type and which of them
+are methods are computed once and cached, so listing many instances of the same class
+only fetches the instance-level values. `iter_simplified_object_info` streams the
+listing instead, evaluating each member only when its line is reached.
+
+Evaluating members can be made side-effect free and time-bounded: in safe mode,
+properties and other computed descriptors (detected through the type's MRO without
+invoking them) are shown as placeholders, and `attribute_timeout` interrupts any single
+attribute that takes too long to evaluate or format.
+
+Below the listings, a structural diff (see `debug_dojo._diff`) shows only the paths
+whose values were changed, added or removed. Array-like and tabular objects are not
+listed at all: they are compared element-wise (see `debug_dojo._arrays`) and only a
+summary of the differences is shown.
 """
 
 from __future__ import annotations
 
 import contextlib
-from typing import TYPE_CHECKING, Any
+import heapq
+import inspect
+import reprlib
+import signal
+import threading
+import time
+import weakref
+from collections.abc import Sized
+from itertools import islice
+from types import (
+    BuiltinFunctionType,
+    ClassMethodDescriptorType,
+    FunctionType,
+    GetSetDescriptorType,
+    MemberDescriptorType,
+    MethodDescriptorType,
+    MethodWrapperType,
+    WrapperDescriptorType,
+)
+from typing import TYPE_CHECKING, NamedTuple
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from debug_dojo._arrays import ArrayComparison, compare_arrays, is_array_like
+from debug_dojo._diff import ChangeKind, DiffResult, diff_objects
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Generator, Iterable, Iterator
+    from types import FrameType
 
+MAX_MEMBERS = 50
+"""Default number of attributes or methods rendered per page."""
+MAX_REPR_LENGTH = 120
+"""Default size budget, in characters, for the repr of a single value."""
 
-def _get_members(
-    obj: object,
-    predicate: Callable[[str, Any], bool],  # pyright: ignore[reportExplicitAny]
-    formatter: Callable[[str, Any], str],  # pyright: ignore[reportExplicitAny]
-) -> list[str]:
-    members: list[str] = []
-    for name in sorted(dir(obj)):
+_TYPE_MEMBERS: weakref.WeakKeyDictionary[type, _TypeMembers] = (
+    weakref.WeakKeyDictionary()
+)
+"""Per-type cache of sorted member names and their method classification."""
+
+
+def _join_items(items: Iterable[str], level: int, limit: int) -> str:
+    """Join at most `limit` item reprs, consuming only one item past the limit.
+
+    Returns:
+        str: The joined items, with a trailing "..." if some were left out.
+
+    """
+    if level <= 0:
+        return "..."
+    shown = list(islice(items, limit + 1))
+    text = ", ".join(shown[:limit])
+    if len(shown) > limit:
+        text += ", ..."
+    return text
+
+
+class _BoundedRepr(reprlib.Repr):
+    """A `reprlib.Repr` that never sorts or walks a whole container.
+
+    `reprlib` sorts dicts and sets before truncating them, which is O(n log n) in the
+    container size; here only the first few items are visited. Byte buffers are cut
+    before their repr is built, like strings.
+    """
+
+    def repr_bytes(self, x: bytes, _level: int) -> str:
+        text = repr(x[: self.maxstring])
+        return text if len(x) <= self.maxstring else text + "..."
+
+    def repr_bytearray(self, x: bytearray, _level: int) -> str:
+        text = repr(x[: self.maxstring])
+        return text if len(x) <= self.maxstring else text + "..."
+
+    def repr_dict(self, x: dict[object, object], level: int) -> str:  # pyright: ignore[reportImplicitOverride]
+        if not x:
+            return "{}"
+        items = (
+            f"{self.repr1(key, level - 1)}: {self.repr1(value, level - 1)}"
+            for key, value in x.items()
+        )
+        return "{" + _join_items(items, level, self.maxdict) + "}"
+
+    def repr_set(self, x: set[object], level: int) -> str:  # pyright: ignore[reportImplicitOverride]
+        if not x:
+            return "set()"
+        items = (self.repr1(item, level - 1) for item in x)
+        return "{" + _join_items(items, level, self.maxset) + "}"
+
+    def repr_frozenset(self, x: frozenset[object], level: int) -> str:  # pyright: ignore[reportImplicitOverride]
+        if not x:
+            return "frozenset()"
+        items = (self.repr1(item, level - 1) for item in x)
+        return "frozenset({" + _join_items(items, level, self.maxset) + "})"
+
+
+def bounded_repr(
+    value: object, max_length: int = MAX_REPR_LENGTH, max_items: int = 6
+) -> str:
+    """Return a repr of a value truncated to a size budget.
+
+    Containers are cut after a few items instead of being rendered in full, so the
+    cost does not grow with the size of the value.
+
+    >>> bounded_repr(list(range(1_000_000)), max_length=30)
+    '[0, 1, 2, 3, 4, 5, ...]'
+    >>> bounded_repr("x" * 100, max_length=10)
+    "'xx...xxx'"
+
+    Args:
+        value (object): The value to represent.
+        max_length (int): The maximal length of the returned string.
+        max_items (int): The maximal number of items shown per container.
+
+    Returns:
+        str: The truncated representation.
+
+    """
+    bounded = _BoundedRepr()
+    bounded.maxlevel = 3
+    bounded.maxdict = bounded.maxlist = bounded.maxtuple = max_items
+    bounded.maxset = bounded.maxfrozenset = max_items
+    bounded.maxdeque = bounded.maxarray = max_items
+    bounded.maxstring = bounded.maxother = bounded.maxlong = max_length
+    text = bounded.repr(value)
+    if len(text) > max_length:
+        text = text[: max(max_length - 3, 0)] + "..."
+    return text
+
+
+class _Members(NamedTuple):
+    """A page of formatted members and the total number of matching members."""
+
+    items: list[str]
+    total: int
+
+
+class _Placeholder:
+    """Stands in for a value that was not evaluated."""
+
+    __slots__: tuple[str, ...] = ("_text",)
+
+    def __init__(self, text: str) -> None:
+        self._text: str = text
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        return self._text
+
+
+class _AttributeTimeoutError(Exception):
+    """Raised when evaluating an attribute exceeds its time budget."""
+
+
+def _time_limit_supported() -> bool:
+    """Check whether a time budget can be enforced in the current thread.
+
+    Returns:
+        bool: True if `SIGALRM` timers are available and this is the main thread.
+
+    """
+    return (
+        hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+@contextlib.contextmanager
+def _time_limit(seconds: float) -> Generator[None]:
+    """Interrupt the body with `_AttributeTimeoutError` after `seconds`.
+
+    Uses a `SIGALRM` interval timer, so it only works in the main thread; a previously
+    scheduled timer is restored afterwards.
+
+    Yields:
+        None: Control to the body.
+
+    """
+
+    def _raise_timeout(_signum: int, _frame: FrameType | None) -> None:
+        raise _AttributeTimeoutError
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    started = time.monotonic()
+    previous_delay, previous_interval = signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        _ = signal.setitimer(signal.ITIMER_REAL, 0)
+        _ = signal.signal(signal.SIGALRM, previous_handler)
+        if previous_delay:
+            remaining = max(previous_delay - (time.monotonic() - started), 1e-3)
+            _ = signal.setitimer(signal.ITIMER_REAL, remaining, previous_interval)
+
+
+def _read_member(obj: object, name: str, timeout: float | None) -> object:
+    """Read a member of an object, within a time budget if one is given.
+
+    Returns:
+        object: The member value, or a placeholder if the time budget ran out.
+
+    """
+    if timeout is None:
+        return getattr(obj, name)  # pyright: ignore[reportAny]
+    try:
+        with _time_limit(timeout):
+            return getattr(obj, name)  # pyright: ignore[reportAny]
+    except _AttributeTimeoutError:
+        return _Placeholder(f"<timed out after {timeout:g}s>")
+
+
+def _format_member(value: object, max_repr_length: int, timeout: float | None) -> str:
+    """Format a member value, within a time budget if one is given.
+
+    Returns:
+        str: The bounded repr of the value, or a note if the time budget ran out.
+
+    """
+    if timeout is None:
+        return bounded_repr(value, max_repr_length)
+    try:
+        with _time_limit(timeout):
+            return bounded_repr(value, max_repr_length)
+    except _AttributeTimeoutError:
+        return f"<repr timed out after {timeout:g}s>"
+
+
+_PLAIN_DESCRIPTORS = (
+    FunctionType,
+    BuiltinFunctionType,
+    MethodDescriptorType,
+    WrapperDescriptorType,
+    MethodWrapperType,
+    ClassMethodDescriptorType,
+    MemberDescriptorType,
+    GetSetDescriptorType,
+    staticmethod,
+    classmethod,
+)
+"""Descriptors that bind methods or read plain slots without running user code."""
+
+
+def _is_computed(static: object) -> bool:
+    """Check whether a class member runs arbitrary code when read from an instance.
+
+    >>> _is_computed(property(lambda self: 1))
+    True
+    >>> _is_computed(lambda self: 1)
+    False
+
+    Returns:
+        bool: True for properties and other descriptors with a custom `__get__`.
+
+    """
+    return hasattr(type(static), "__get__") and not isinstance(
+        static, _PLAIN_DESCRIPTORS
+    )
+
+
+def _is_method(cls: type, name: str, static: object) -> bool:
+    """Check whether a class member is callable on every instance of the class.
+
+    Data descriptors (properties, slots) are excluded, as their value depends on the
+    instance.
+
+    Returns:
+        bool: True if the member is a method regardless of the instance state.
+
+    """
+    if inspect.isdatadescriptor(static):
+        return False
+    try:
+        value = getattr(cls, name)  # pyright: ignore[reportAny]
+    except Exception:  # noqa: BLE001
+        return False
+    return callable(value)  # pyright: ignore[reportAny]
+
+
+class _TypeMembers(NamedTuple):
+    """Sorted member names of a type, split by what is known without an instance."""
+
+    methods: tuple[str, ...]
+    """Public members that are methods on every instance."""
+    method_candidates: tuple[str, ...]
+    """Public members whose value decides whether they are methods."""
+    attribute_candidates: tuple[str, ...]
+    """Non-dunder members that may be attributes, depending on their value."""
+    computed: dict[str, str]
+    """Members that run code when read (e.g. properties), mapped to their kind."""
+    overridable: frozenset[str]
+    """Computed members whose value is read from the instance `__dict__` if set."""
+    stamp: tuple[int, ...]
+    """Number of members of each class of the MRO when the names were classified."""
+
+
+def _mro_stamp(cls: type) -> tuple[int, ...]:
+    """Count the members of every class in a type's MRO.
+
+    Adding or removing a class member, e.g. when a class is patched in a debugging
+    session, changes the stamp. Counting is cheap enough to run on every lookup; a
+    member replaced in place keeps its classification until the counts change.
+
+    Returns:
+        tuple[int, ...]: The number of members of each class of the MRO.
+
+    """
+    return tuple(len(vars(klass)) for klass in cls.__mro__)
+
+
+def _type_members(cls: type) -> _TypeMembers:
+    """Return the classified member names of a type.
+
+    Members are classified from the type's MRO with `inspect.getattr_static`, so
+    properties and other computed descriptors are never invoked. Results are cached
+    per type, recomputed when a class of the MRO gains or loses a member, and
+    evicted when the type is garbage-collected.
+
+    Returns:
+        _TypeMembers: The member names of the type.
+
+    """
+    stamp = _mro_stamp(cls)
+    members = _TYPE_MEMBERS.get(cls)
+    if members is not None and members.stamp == stamp:
+        return members
+
+    names = sorted(dir(cls))
+    is_method: dict[str, bool] = {}
+    computed: dict[str, str] = {}
+    overridable: set[str] = set()
+    for name in names:
         try:
-            value = getattr(obj, name)  # pyright: ignore[reportAny]
-        except Exception:  # noqa: S112, BLE001
+            static: object = inspect.getattr_static(cls, name)  # pyright: ignore[reportAny]
+        except AttributeError:
+            is_method[name] = False
             continue
+        if _is_computed(static):
+            computed[name] = type(static).__name__
+            if not inspect.isdatadescriptor(static):
+                overridable.add(name)
+            is_method[name] = False
+        else:
+            is_method[name] = _is_method(cls, name, static)
 
-        if predicate(name, value):
-            with contextlib.suppress(Exception):
-                members.append(formatter(name, value))
+    members = _TypeMembers(
+        methods=tuple(n for n in names if is_method[n] and not n.startswith("_")),
+        method_candidates=tuple(
+            n for n in names if not is_method[n] and not n.startswith("_")
+        ),
+        attribute_candidates=tuple(
+            n for n in names if not is_method[n] and not n.startswith("__")
+        ),
+        computed=computed,
+        overridable=frozenset(overridable),
+        stamp=stamp,
+    )
+    _TYPE_MEMBERS[cls] = members
     return members
 
 
-def get_object_attributes(obj: object) -> list[str]:
+class _MemberNames(NamedTuple):
+    """The visible member names of an object, split by how they are evaluated."""
+
+    known: list[str]
+    """Names known to match without fetching their value."""
+    candidates: list[str]
+    """Names whose value must be fetched to decide whether they match."""
+    computed: dict[str, str]
+    """Candidates that run code when read, mapped to their kind (only in safe mode)."""
+
+
+def _computed_members(obj: object, names: Iterable[str]) -> dict[str, str]:
+    """Find the members of an arbitrary object that run code when read.
+
+    Returns:
+        dict[str, str]: Computed member names mapped to their kind.
+
+    """
+    computed: dict[str, str] = {}
+    for name in names:
+        try:
+            static: object = inspect.getattr_static(obj, name)  # pyright: ignore[reportAny]
+        except AttributeError:
+            computed[name] = "dynamic"
+            continue
+        if _is_computed(static):
+            computed[name] = type(static).__name__
+    return computed
+
+
+def _member_names(obj: object, *, methods: bool, safe: bool) -> _MemberNames:
+    """Split the visible member names of an object by whether their value decides.
+
+    The names of the object's type come from the per-type cache; only the instance
+    `__dict__` is inspected per object. Objects with a custom `__dir__` (including
+    classes and modules) are not cached.
+
+    Returns:
+        _MemberNames: The member names of the object.
+
+    """
+    prefix = "_" if methods else "__"
+    cls = type(obj)
+    if cls.__dir__ is not object.__dir__:
+        candidates = [name for name in sorted(dir(obj)) if not name.startswith(prefix)]
+        computed = _computed_members(obj, candidates) if safe else {}
+        return _MemberNames([], candidates, computed)
+
+    members = _type_members(cls)
+    instance: dict[str, object] = getattr(obj, "__dict__", {})
+    known = list(members.methods) if methods else []
+    if instance and not instance.keys().isdisjoint(members.methods):
+        # Instance attributes shadow methods of the class.
+        known = [name for name in known if name not in instance]
+    candidates = [
+        *(members.method_candidates if methods else members.attribute_candidates),
+        *(name for name in instance if not name.startswith(prefix)),
+    ]
+    computed: dict[str, str] = {}
+    if safe:
+        computed = {
+            name: kind
+            for name, kind in members.computed.items()
+            if not (name in members.overridable and name in instance)
+        }
+    return _MemberNames(known, candidates, computed)
+
+
+_SKIPPED = object()
+"""Marks a candidate member that does not belong to the requested listing."""
+_FAILED = object()
+"""Marks a member whose value could not be read."""
+
+
+def _effective_timeout(
+    *, safe: bool, attribute_timeout: float | None
+) -> tuple[bool, float | None]:
+    """Resolve the time budget, falling back to safe mode if it cannot be enforced.
+
+    Returns:
+        tuple[bool, float | None]: Whether computed members are skipped, and the
+            enforceable time budget.
+
+    """
+    timeout = attribute_timeout if _time_limit_supported() else None
+    return safe or timeout != attribute_timeout, timeout
+
+
+def _candidate_value(  # noqa: PLR0913
+    obj: object,
+    name: str,
+    names: _MemberNames,
+    *,
+    methods: bool,
+    timeout: float | None,
+    cache: dict[str, object] | None = None,
+) -> object:
+    """Evaluate a candidate member of an object.
+
+    Members read into `cache` are not read again, so listing the attributes and the
+    methods of an object evaluates each of its properties once.
+
+    Returns:
+        object: The member value (or a placeholder for computed members), or
+            `_SKIPPED` if the member does not belong to the listing.
+
+    """
+    if name in names.computed:
+        return _SKIPPED if methods else _Placeholder(f"<{names.computed[name]}>")
+    if cache is None:
+        cache = {}
+    if name not in cache:
+        try:
+            cache[name] = _read_member(obj, name, timeout)
+        except Exception:  # noqa: BLE001
+            cache[name] = _FAILED
+    value = cache[name]
+    if value is _FAILED:
+        return _SKIPPED
+    return value if callable(value) is methods else _SKIPPED
+
+
+def _get_members(  # noqa: PLR0913
+    obj: object,
+    *,
+    methods: bool,
+    max_members: int | None = None,
+    max_repr_length: int = MAX_REPR_LENGTH,
+    page: int = 0,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+    cache: dict[str, object] | None = None,
+) -> _Members:
+    safe, timeout = _effective_timeout(safe=safe, attribute_timeout=attribute_timeout)
+    names = _member_names(obj, methods=methods, safe=safe)
+    values: dict[str, object] = {}
+    for name in dict.fromkeys(names.candidates):
+        value = _candidate_value(
+            obj, name, names, methods=methods, timeout=timeout, cache=cache
+        )
+        if value is not _SKIPPED:
+            values[name] = value
+    known = names.known
+    if values:
+        known = sorted([*known, *values])
+
+    start = page * max_members if max_members else 0
+    stop = start + max_members if max_members else None
+    if methods:
+        return _Members(known[start:stop], len(known))
+
+    members: list[str] = []
+    # Only attributes on the requested page are formatted, the rest are counted.
+    for name in known[start:stop]:
+        with contextlib.suppress(Exception):
+            text = _format_member(values[name], max_repr_length, timeout)
+            members.append(f"{name}={text}")
+    return _Members(members, len(known))
+
+
+def iter_object_members(  # noqa: PLR0913
+    obj: object,
+    *,
+    methods: bool,
+    max_repr_length: int = MAX_REPR_LENGTH,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+    cache: dict[str, object] | None = None,
+) -> Iterator[str]:
+    """Yield the formatted attributes or methods of an object one at a time.
+
+    Members are yielded in sorted order and each one is evaluated only when it is
+    reached, so the first members are available immediately however many the object
+    has. Stop iterating to stop evaluating.
+
+    Args:
+        obj (object): The object to list the members of.
+        methods (bool): If True, yield public method names, otherwise attributes.
+        max_repr_length (int): Size budget for the repr of each value.
+        safe (bool): If True, show properties and other computed members as a
+                     placeholder instead of evaluating them.
+        attribute_timeout (float | None): Time budget in seconds for evaluating and
+                                          formatting a single attribute.
+        cache (dict[str, object] | None): Member values already read, by name; the
+                                          values read are added to it.
+
+    Yields:
+        str: A method name, or an attribute formatted as `name=value`.
+
+    """
+    safe, timeout = _effective_timeout(safe=safe, attribute_timeout=attribute_timeout)
+    names = _member_names(obj, methods=methods, safe=safe)
+    ordered = heapq.merge(
+        ((name, True) for name in names.known),
+        ((name, False) for name in sorted(set(names.candidates))),
+    )
+    for name, known in ordered:
+        if known:
+            yield name
+            continue
+        value = _candidate_value(
+            obj, name, names, methods=methods, timeout=timeout, cache=cache
+        )
+        if value is _SKIPPED:
+            continue
+        if methods:
+            yield name
+            continue
+        with contextlib.suppress(Exception):
+            yield f"{name}={_format_member(value, max_repr_length, timeout)}"
+
+
+def _with_more_marker(
+    members: _Members, max_members: int | None, page: int
+) -> list[str]:
+    """Append a marker for members left out of the page.
+
+    Returns:
+        list[str]: The formatted members, with a trailing marker if some were cut.
+
+    """
+    if not max_members:
+        return members.items
+    remaining = members.total - (page + 1) * max_members
+    if remaining <= 0:
+        return members.items
+    return [*members.items, f"... {remaining} more (page={page + 1})"]
+
+
+def get_object_attributes(  # noqa: PLR0913
+    obj: object,
+    *,
+    max_members: int | None = None,
+    max_repr_length: int = MAX_REPR_LENGTH,
+    page: int = 0,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+    cache: dict[str, object] | None = None,
+) -> list[str]:
     """Extract and format non-callable attributes of an object.
 
     Args:
         obj (object): The object to extract attributes from.
+        max_members (int | None): Number of attributes per page, or None for all.
+        max_repr_length (int): Size budget for the repr of each value.
+        page (int): The page of attributes to return.
+        safe (bool): If True, show properties and other computed members as a
+                     placeholder instead of evaluating them.
+        attribute_timeout (float | None): Time budget in seconds for evaluating and
+                                          formatting a single attribute.
+        cache (dict[str, object] | None): Member values already read, by name; the
+                                          values read are added to it.
 
     Returns:
-        list[str]: A list of formatted strings, each representing an attribute.
+        list[str]: A list of formatted strings, each representing an attribute,
+            followed by a marker if more attributes are available.
 
     """
-    return _get_members(
+    members = _get_members(
         obj,
-        lambda n, v: not n.startswith("__") and not callable(v),  # pyright: ignore[reportAny]
-        lambda n, v: f"{n}={v!r}",  # pyright: ignore[reportAny]
+        methods=False,
+        max_members=max_members,
+        max_repr_length=max_repr_length,
+        page=page,
+        safe=safe,
+        attribute_timeout=attribute_timeout,
+        cache=cache,
     )
+    return _with_more_marker(members, max_members, page)
 
 
-def get_object_methods(obj: object) -> list[str]:
+def get_object_methods(  # noqa: PLR0913
+    obj: object,
+    *,
+    max_members: int | None = None,
+    page: int = 0,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+    cache: dict[str, object] | None = None,
+) -> list[str]:
     """Extract and format public callable methods of an object.
 
     Args:
         obj (object): The object to extract methods from.
+        max_members (int | None): Number of methods per page, or None for all.
+        page (int): The page of methods to return.
+        safe (bool): If True, do not evaluate properties and other computed members.
+        attribute_timeout (float | None): Time budget in seconds for evaluating a
+                                          single member.
+        cache (dict[str, object] | None): Member values already read, by name; the
+                                          values read are added to it.
 
     Returns:
-        list[str]: A list of method names.
+        list[str]: A list of method names, followed by a marker if more methods are
+            available.
 
     """
-    return _get_members(
+    members = _get_members(
         obj,
-        lambda n, v: not n.startswith("_") and callable(v),  # pyright: ignore[reportAny]
-        lambda n, _v: n,  # pyright: ignore[reportAny]
+        methods=True,
+        max_members=max_members,
+        page=page,
+        safe=safe,
+        attribute_timeout=attribute_timeout,
+        cache=cache,
     )
+    return _with_more_marker(members, max_members, page)
 
 
 def _is_basic_type(obj: object) -> bool:
@@ -82,19 +706,26 @@ def _is_basic_type(obj: object) -> bool:
     )
 
 
-def _get_basic_info(obj: object) -> list[Text]:
+def _get_basic_info(obj: object, max_repr_length: int = MAX_REPR_LENGTH) -> list[Text]:
     """Get information for basic types.
 
     Returns:
         list[Text]: A list of Rich Text objects representing the basic info.
 
     """
-    return [
+    lines = [
         Text("Value:", style="bold"),
-        Text(f"  {obj!r}", style="yellow"),
-        Text(""),
-        Text("No attributes or methods to display for this type.", style="dim"),
+        Text(f"  {bounded_repr(obj, max_repr_length)}", style="yellow"),
     ]
+    if isinstance(obj, Sized):
+        lines.append(Text(f"  Length: {len(obj)}", style="dim"))
+    lines.extend(
+        (
+            Text(""),
+            Text("No attributes or methods to display for this type.", style="dim"),
+        )
+    )
+    return lines
 
 
 def _format_section(title: str, items: list[str], empty_message: str) -> list[Text]:
@@ -114,7 +745,16 @@ def _format_section(title: str, items: list[str], empty_message: str) -> list[Te
     return lines
 
 
-def _get_attributes_section(obj: object) -> list[Text]:
+def _get_attributes_section(  # noqa: PLR0913
+    obj: object,
+    *,
+    max_members: int | None,
+    max_repr_length: int,
+    page: int,
+    safe: bool,
+    attribute_timeout: float | None,
+    cache: dict[str, object],
+) -> list[Text]:
     """Get the attributes section for the object info.
 
     Returns:
@@ -123,26 +763,58 @@ def _get_attributes_section(obj: object) -> list[Text]:
     """
     return _format_section(
         "Attributes:",
-        get_object_attributes(obj),
+        get_object_attributes(
+            obj,
+            max_members=max_members,
+            max_repr_length=max_repr_length,
+            page=page,
+            safe=safe,
+            attribute_timeout=attribute_timeout,
+            cache=cache,
+        ),
         "No attributes found.",
     )
 
 
-def _get_methods_section(obj: object) -> list[Text]:
+def _get_methods_section(  # noqa: PLR0913
+    obj: object,
+    *,
+    max_members: int | None,
+    page: int,
+    safe: bool,
+    attribute_timeout: float | None,
+    cache: dict[str, object],
+) -> list[Text]:
     """Get the methods section for the object info.
 
     Returns:
         list[Text]: A list of Rich Text objects for the methods section.
 
     """
+    methods = get_object_methods(
+        obj,
+        max_members=max_members,
+        page=page,
+        safe=safe,
+        attribute_timeout=attribute_timeout,
+        cache=cache,
+    )
     return _format_section(
         "Methods:",
-        [f"{method}()" for method in get_object_methods(obj)],
+        [method if method.startswith("...") else f"{method}()" for method in methods],
         "No public methods found.",
     )
 
 
-def get_simplified_object_info(obj: object) -> list[Text]:
+def get_simplified_object_info(  # noqa: PLR0913
+    obj: object,
+    *,
+    max_members: int | None = MAX_MEMBERS,
+    max_repr_length: int = MAX_REPR_LENGTH,
+    page: int = 0,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+) -> list[Text]:
     """Generate a simplified, Rich-formatted inspection output for an object.
 
     Handles basic Python types by displaying their value directly. For other objects, it
@@ -150,6 +822,14 @@ def get_simplified_object_info(obj: object) -> list[Text]:
 
     Args:
         obj (object): The object to generate info for.
+        max_members (int | None): Number of attributes and of methods shown per page,
+                                  or None to show all of them.
+        max_repr_length (int): Size budget for the repr of each value.
+        page (int): The page of members to show.
+        safe (bool): If True, show properties and other computed members as a
+                     placeholder instead of evaluating them.
+        attribute_timeout (float | None): Time budget in seconds for evaluating and
+                                          formatting a single attribute.
 
     Returns:
         list[Text]: A list of Rich Text objects representing the object's information.
@@ -160,33 +840,291 @@ def get_simplified_object_info(obj: object) -> list[Text]:
     info_lines.extend((Text(f"<class '{obj_type}'>", style="cyan bold"), Text("")))
 
     if _is_basic_type(obj):
-        info_lines.extend(_get_basic_info(obj))
+        info_lines.extend(_get_basic_info(obj, max_repr_length))
         return info_lines
 
-    info_lines.extend(_get_attributes_section(obj))
-    info_lines.extend(_get_methods_section(obj))
+    # Properties are candidates of both sections; each is evaluated once.
+    cache: dict[str, object] = {}
+    info_lines.extend(
+        _get_attributes_section(
+            obj,
+            max_members=max_members,
+            max_repr_length=max_repr_length,
+            page=page,
+            safe=safe,
+            attribute_timeout=attribute_timeout,
+            cache=cache,
+        )
+    )
+    info_lines.extend(
+        _get_methods_section(
+            obj,
+            max_members=max_members,
+            page=page,
+            safe=safe,
+            attribute_timeout=attribute_timeout,
+            cache=cache,
+        )
+    )
 
     return info_lines
 
 
-def inspect_objects_side_by_side(
+def _stream_section(
+    title: str,
+    items: Iterator[str],
+    empty_message: str,
+    *,
+    max_members: int | None,
+    page: int,
+) -> Iterator[Text]:
+    """Format a section of the inspection output as its items are produced.
+
+    At most `max_members` items are consumed past the skipped pages, plus one to tell
+    whether a "... more" marker is needed.
+
+    Yields:
+        Text: The lines of the formatted section.
+
+    """
+    if max_members:
+        items = islice(items, page * max_members, None)
+    shown = 0
+    for item in items:
+        if max_members and shown == max_members:
+            yield Text(f"  ... more (page={page + 1})")
+            break
+        if not shown:
+            yield Text(title, style="bold")
+        yield Text(f"  {item}")
+        shown += 1
+    if not shown:
+        yield Text(empty_message, style="dim")
+    yield Text("")
+
+
+def iter_simplified_object_info(  # noqa: PLR0913
+    obj: object,
+    *,
+    max_members: int | None = MAX_MEMBERS,
+    max_repr_length: int = MAX_REPR_LENGTH,
+    page: int = 0,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+) -> Iterator[Text]:
+    """Stream the output of `get_simplified_object_info` line by line.
+
+    Members are evaluated and formatted only when their line is reached, so the first
+    lines are produced in constant time however many members the object has. Unlike
+    `get_simplified_object_info`, members past the page are not counted.
+
+    Args:
+        obj (object): The object to generate info for.
+        max_members (int | None): Number of attributes and of methods shown per page,
+                                  or None to show all of them.
+        max_repr_length (int): Size budget for the repr of each value.
+        page (int): The page of members to show.
+        safe (bool): If True, show properties and other computed members as a
+                     placeholder instead of evaluating them.
+        attribute_timeout (float | None): Time budget in seconds for evaluating and
+                                          formatting a single attribute.
+
+    Yields:
+        Text: The lines of the object's information.
+
+    """
+    yield Text(f"<class '{type(obj).__name__}'>", style="cyan bold")
+    yield Text("")
+
+    if _is_basic_type(obj):
+        yield from _get_basic_info(obj, max_repr_length)
+        return
+
+    # Properties are candidates of both sections; each is evaluated once.
+    cache: dict[str, object] = {}
+    attributes = iter_object_members(
+        obj,
+        methods=False,
+        max_repr_length=max_repr_length,
+        safe=safe,
+        attribute_timeout=attribute_timeout,
+        cache=cache,
+    )
+    yield from _stream_section(
+        "Attributes:",
+        attributes,
+        "No attributes found.",
+        max_members=max_members,
+        page=page,
+    )
+    methods = iter_object_members(
+        obj, methods=True, safe=safe, attribute_timeout=attribute_timeout, cache=cache
+    )
+    yield from _stream_section(
+        "Methods:",
+        (f"{method}()" for method in methods),
+        "No public methods found.",
+        max_members=max_members,
+        page=page,
+    )
+
+
+_CHANGE_STYLES = {
+    ChangeKind.CHANGED: "yellow",
+    ChangeKind.ADDED: "green",
+    ChangeKind.REMOVED: "red",
+}
+
+
+def get_diff_table(
+    result: DiffResult, max_repr_length: int = MAX_REPR_LENGTH
+) -> Table | Text:
+    """Render the differences between two objects as a table.
+
+    Args:
+        result (DiffResult): The differences, as computed by `diff_objects`.
+        max_repr_length (int): Size budget for the repr of each value.
+
+    Returns:
+        Table | Text: A table with one row per difference, or a note if the objects
+            are identical.
+
+    """
+    if not result.differences:
+        return Text("No differences found.", style="dim")
+
+    title = "Differences"
+    if result.truncated:
+        title += f" (first {len(result.differences)})"
+
+    table = Table(title=title, title_justify="left", expand=True)
+    table.add_column("Path", style="cyan", no_wrap=True)
+    table.add_column("Change")
+    table.add_column("Left", overflow="fold")
+    table.add_column("Right", overflow="fold")
+
+    for difference in result.differences:
+        kind = difference.kind
+        table.add_row(
+            difference.path or "<root>",
+            Text(kind.value, style=_CHANGE_STYLES[kind]),
+            ""
+            if kind is ChangeKind.ADDED
+            else bounded_repr(difference.left, max_repr_length),
+            ""
+            if kind is ChangeKind.REMOVED
+            else bounded_repr(difference.right, max_repr_length),
+        )
+    return table
+
+
+def get_array_table(comparison: ArrayComparison) -> Table:
+    """Render an element-wise comparison of two arrays or tables.
+
+    Args:
+        comparison (ArrayComparison): The comparison, as computed by `compare_arrays`.
+
+    Returns:
+        Table: A table with the shapes and element types of both objects and a
+            summary of their differences.
+
+    """
+    table = Table(title="Array comparison", title_justify="left", expand=True)
+    table.add_column("", style="bold", no_wrap=True)
+    table.add_column("Left", overflow="fold")
+    table.add_column("Right", overflow="fold")
+
+    shape_style = "" if comparison.left_shape == comparison.right_shape else "red"
+    dtype_style = "" if comparison.left_dtype == comparison.right_dtype else "yellow"
+    table.add_row(
+        "Shape",
+        Text(str(comparison.left_shape), style=shape_style),
+        Text(str(comparison.right_shape), style=shape_style),
+    )
+    table.add_row(
+        "Dtype",
+        Text(comparison.left_dtype, style=dtype_style),
+        Text(comparison.right_dtype, style=dtype_style),
+    )
+    if comparison.left_only or comparison.right_only:
+        table.add_row(
+            "Only in",
+            Text(", ".join(comparison.left_only), style="red"),
+            Text(", ".join(comparison.right_only), style="green"),
+        )
+
+    if comparison.differing is None:
+        table.add_row("Elements", Text("not comparable element-wise", style="dim"))
+        return table
+
+    style = "green" if comparison.identical else "yellow"
+    table.add_row(
+        "Differing",
+        Text(f"{comparison.differing:,} of {comparison.size:,}", style=style),
+    )
+    if comparison.max_abs_difference is not None:
+        table.add_row("Max abs difference", f"{comparison.max_abs_difference:g}")
+    if comparison.sample:
+        indices = ", ".join(
+            "[" + ", ".join(map(repr, index)) + "]" for index in comparison.sample
+        )
+        table.add_row("First differing", indices)
+    return table
+
+
+def inspect_objects_side_by_side(  # noqa: PLR0913
     obj1: object,
     obj2: object,
+    *,
+    max_members: int | None = MAX_MEMBERS,
+    max_repr_length: int = MAX_REPR_LENGTH,
+    page: int = 0,
+    show_diff: bool = True,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+    console: Console | None = None,
 ) -> None:
     """Display two Python objects side-by-side in the terminal using Rich.
 
-    Showing their attributes and methods in a simplified, aligned format.
+    Showing their attributes and methods in a simplified, aligned format, followed by
+    the paths at which the two objects differ. Two arrays or tables are compared
+    element-wise instead, showing only a summary. Large objects are paged: call again
+    with `page=1`, `page=2`, ... to see the members hidden behind the "... N more"
+    marker.
 
     Args:
         obj1 (object): The first object to display.
         obj2 (object): The second object to display.
+        max_members (int | None): Number of attributes and of methods shown per page,
+                                  or None to show all of them.
+        max_repr_length (int): Size budget for the repr of each value.
+        page (int): The page of members to show.
+        show_diff (bool): Whether to show the structural diff below the listings.
+        safe (bool): If True, show properties and other computed members as a
+                     placeholder instead of evaluating them.
+        attribute_timeout (float | None): Time budget in seconds for evaluating and
+                                          formatting a single attribute.
+        console (Console | None): The console to print to, a new one by default.
 
     """
-    main_console: Console = Console()
+    main_console: Console = console or Console()
+
+    if is_array_like(obj1) and is_array_like(obj2):
+        main_console.print(get_array_table(compare_arrays(obj1, obj2)))
+        return
 
     # Get info for both objects
-    lines1: list[Text] = get_simplified_object_info(obj1)
-    lines2: list[Text] = get_simplified_object_info(obj2)
+    lines1, lines2 = (
+        get_simplified_object_info(
+            obj,
+            max_members=max_members,
+            max_repr_length=max_repr_length,
+            page=page,
+            safe=safe,
+            attribute_timeout=attribute_timeout,
+        )
+        for obj in (obj1, obj2)
+    )
 
     # Convert list of Text to a single Renderable for Panel
     inspect_text1: Text = Text("\n").join(lines1)
@@ -203,3 +1141,6 @@ def inspect_objects_side_by_side(
     table.add_row(panel1, panel2)
 
     main_console.print(table)
+
+    if show_diff:
+        main_console.print(get_diff_table(diff_objects(obj1, obj2), max_repr_length))
@@ -7,59 +7,232 @@ that can be enabled or disabled.
 from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
+from dataclasses import fields
 from pathlib import Path
 from typing import TypeAlias, cast
 
-from dacite import DaciteError, from_dict
-from rich import print as rich_print
-from tomlkit import parse
-from tomlkit.exceptions import TOMLKitError
-from typer import Exit
-
+from debug_dojo._cache import (
+    load_cached_config,
+    load_cached_discovery,
+    stamp,
+    store_cached_config,
+    store_cached_discovery,
+)
 from debug_dojo._config_models import (
-    DACITE_CONFIG,
+    CONFIG_MODELS,
+    CONFIG_VALIDATORS,
+    CONFIG_VERSION_KEY,
+    CURRENT_CONFIG_VERSION,
+    AnyDebugDojoConfig,
     DebugDojoConfig,
-    DebugDojoConfigV1,
     DebugDojoConfigV2,
     DebuggerType,
+    Features,
 )
+from debug_dojo._toml import read_toml, read_toml_table
 
 JSON: TypeAlias = (
     Mapping[str, "JSON"] | Sequence["JSON"] | str | int | float | bool | None
 )
 
+VCS_ROOT_MARKERS = (".git", ".hg", ".svn")
+"""Entries marking a repository root, where configuration discovery stops."""
+
+_discovered: dict[Path, Path | None] = {}
+"""In-process memo of discovered configuration paths per directory."""
+
+_V1_FEATURES = frozenset(item.name for item in fields(Features))
+_V2_KEYS = frozenset(item.name for item in fields(DebugDojoConfigV2))
+
+
+def forget_discoveries() -> None:
+    """Forget the configuration paths discovered in this process.
+
+    For long-lived processes, like the warm server's children, whose memo may be
+    older than the configuration files.
+    """
+    _discovered.clear()
 
-def _validate_model(
-    model: type[DebugDojoConfigV1 | DebugDojoConfigV2],
-    raw_config: JSON,
-) -> DebugDojoConfigV1 | DebugDojoConfigV2:
-    """Validate the raw configuration against a specific model.
+
+def detect_config_version(raw_config: Mapping[str, JSON]) -> int:
+    """Detect the schema version of a raw configuration.
+
+    An explicit `version` key wins. Otherwise the version is inferred from the
+    structure: a `debugger` key, or `features` made only of legacy keys with boolean
+    values, mark version 1; a `gamification` key with only version 2 keys marks
+    version 2; anything else is the current version, which accepts `gamification`.
+
+    >>> detect_config_version({"version": 2})
+    2
+    >>> detect_config_version({"debugger": "pudb"})
+    1
+    >>> detect_config_version({"features": {"comparer": "c"}})
+    3
+    >>> detect_config_version({"features": {"safe_inspect": True}})
+    3
+    >>> detect_config_version({"gamification": True, "install_mode": "eager"})
+    3
+
+    Args:
+        raw_config (Mapping[str, JSON]): The raw configuration data.
+
+    Returns:
+        int: The schema version.
+
+    Raises:
+        DaciteError: If the explicit version is not a supported version.
+
+    """
+    if CONFIG_VERSION_KEY in raw_config:
+        version = raw_config[CONFIG_VERSION_KEY]
+        if not isinstance(version, int) or version not in CONFIG_MODELS:
+            from dacite import DaciteError
+
+            msg = f"Unsupported configuration version: {version!r}."
+            raise DaciteError(msg)
+        return version
+
+    features = raw_config.get("features")
+    if "debugger" in raw_config or (
+        isinstance(features, Mapping)
+        and features.keys() <= _V1_FEATURES
+        and any(isinstance(value, bool) for value in features.values())
+    ):
+        return 1
+    if "gamification" in raw_config and raw_config.keys() <= _V2_KEYS:
+        return 2
+    return CURRENT_CONFIG_VERSION
+
+
+def _validate_model(raw_config: JSON) -> AnyDebugDojoConfig:
+    """Validate the raw configuration against the model of its schema version.
 
     Args:
-        model (type[DebugDojoConfigV1 | DebugDojoConfigV2]): The model class to use
-            for validation.
         raw_config (JSON): The raw configuration data.
 
     Returns:
-        DebugDojoConfigV1 | DebugDojoConfigV2: The validated configuration object.
+        AnyDebugDojoConfig: The validated configuration object.
 
     Raises:
         DaciteError: If the configuration does not match the model.
 
     """
-    if not isinstance(raw_config, dict):
+    if not isinstance(raw_config, Mapping):
+        from dacite import DaciteError
+
         msg = "Configuration must be a dictionary."
         raise DaciteError(msg)
-    return from_dict(data_class=model, data=raw_config, config=DACITE_CONFIG)
 
+    version = detect_config_version(raw_config)
+    data = {
+        key: value for key, value in raw_config.items() if key != CONFIG_VERSION_KEY
+    }
+    return CONFIG_VALIDATORS[version](data)
+
+
+def _directory_config(directory: Path, stamps: dict[str, int]) -> Path | None:
+    """Find the configuration file in a single directory.
+
+    `dojo.toml` always counts, `pyproject.toml` only if it has a non-empty
+    `[tool.debug_dojo]` table, so project files without debug-dojo settings (even if
+    they mention it, e.g. as a dependency) do not stop the search. A `pyproject.toml`
+    that does not parse counts, so its error is reported when the config is loaded.
+
+    Args:
+        directory (Path): The directory to check.
+        stamps (dict[str, int]): Collects modification times of inspected paths.
+
+    Returns:
+        Path | None: The configuration file, or None if the directory has none.
+
+    """
+    dojo_toml = directory / "dojo.toml"
+    if dojo_toml.exists():
+        return dojo_toml
+
+    pyproject = directory / "pyproject.toml"
+    if pyproject.exists():
+        stamps[str(pyproject)] = stamp(pyproject)
+        try:
+            table = read_toml_table(pyproject, "tool.debug_dojo")
+        except ValueError:
+            return pyproject
+        if table:
+            return pyproject
+    return None
+
+
+def _is_vcs_root(directory: Path) -> bool:
+    """Check whether a directory is the root of a repository.
+
+    Returns:
+        bool: True if the directory contains a VCS marker such as `.git`.
+
+    """
+    return any((directory / marker).exists() for marker in VCS_ROOT_MARKERS)
+
+
+def discover_config_path(start: Path, *, use_cache: bool = True) -> Path | None:
+    """Find the configuration file for a directory by walking up its parents.
+
+    The search stops at the first directory with a configuration file, at a
+    repository root or at the filesystem root. Results are memoized in-process for
+    every visited directory and, if `use_cache` is set, stored on disk together with
+    the modification times needed to tell when they went stale.
 
-def resolve_config_path(config_path: Path | None) -> Path | None:
+    Args:
+        start (Path): The absolute directory to start from.
+        use_cache (bool): If True, use the on-disk discovery cache.
+
+    Returns:
+        Path | None: The discovered configuration file, or None if there is none.
+
+    """
+    if start in _discovered:
+        return _discovered[start]
+
+    if use_cache:
+        hit, found = load_cached_discovery(start)
+        if hit:
+            _discovered[start] = found
+            return found
+
+    visited: list[Path] = []
+    stamps: dict[str, int] = {}
+    found: Path | None = None
+    complete = True
+
+    for directory in (start, *start.parents):
+        if directory in _discovered:
+            found, complete = _discovered[directory], False
+            break
+        visited.append(directory)
+        stamps[str(directory)] = stamp(directory)
+        found = _directory_config(directory, stamps)
+        if found or _is_vcs_root(directory):
+            break
+
+    for directory in visited:
+        _discovered[directory] = found
+    if use_cache and complete:
+        store_cached_discovery(start, found, stamps)
+    return found
+
+
+def resolve_config_path(
+    config_path: Path | None,
+    *,
+    use_cache: bool = True,
+) -> Path | None:
     """Resolve the configuration path.
 
-    Returning a default if none is provided.
+    Returning a default if none is provided: the nearest `dojo.toml`, or
+    `pyproject.toml` with a `[tool.debug_dojo]` table, in the current directory or
+    its parents up to the repository root.
 
     Args:
         config_path (Path | None): The explicit path to the configuration file, or None.
+        use_cache (bool): If True, use the on-disk discovery cache.
 
     Returns:
         Path | None: The resolved absolute path to the configuration file, or None if no
@@ -76,20 +249,16 @@ def resolve_config_path(config_path: Path | None) -> Path | None:
             raise FileNotFoundError(msg)
         return config_path.resolve()
 
-    # Default configuration path
-    for path in (Path("dojo.toml"), Path("pyproject.toml")):
-        if path.exists():
-            return path.resolve()
-
     # None means - use default config values
-    return None
+    return discover_config_path(Path.cwd().resolve(), use_cache=use_cache)
 
 
 def load_raw_config(config_path: Path) -> JSON:
     """Load the Debug Dojo configuration from a file.
 
-    Currently supports 'dojo.toml' or 'pyproject.toml'. If no path is provided, it
-    checks the current directory for these files.
+    Currently supports 'dojo.toml' or 'pyproject.toml'. The file is read with a
+    read-only TOML parser; for 'pyproject.toml' only the `[tool.debug_dojo]` table is
+    parsed.
 
     Args:
         config_path (Path): The absolute path to the configuration file.
@@ -101,61 +270,55 @@ def load_raw_config(config_path: Path) -> JSON:
         ValueError: If there is an error parsing the TOML file.
 
     """
-    config_str = config_path.read_text(encoding="utf-8")
-
     try:
-        config_data = parse(config_str).unwrap()
-    except TOMLKitError as e:
+        if config_path.name == "pyproject.toml":
+            # If config is in [tool.debug_dojo] (pyproject.toml), extract it.
+            config_data = read_toml_table(config_path, "tool.debug_dojo")
+        else:
+            config_data = read_toml(config_path)
+    except ValueError as e:
         msg = f"Error parsing configuration file {config_path.resolve()}.."
         raise ValueError(msg) from e
 
-    if config_path.name != "pyproject.toml":
-        return config_data
-
-    # If config is in [tool.debug_dojo] (pyproject.toml), extract it.
-    try:
-        dojo_config = cast(JSON, config_data["tool"]["debug_dojo"])
-    except KeyError:
-        return {}
-    else:
-        return dojo_config
+    return cast(JSON, config_data)
 
 
 def _try_validate_config(
     raw_config: JSON,
     *,
     verbose: bool,
-) -> DebugDojoConfigV1 | DebugDojoConfigV2 | None:
-    """Try to validate the raw configuration against known configuration models.
+) -> AnyDebugDojoConfig | None:
+    """Validate the raw configuration against the model of its schema version.
+
+    Exactly one model is validated, so the cost does not grow with the number of
+    supported configuration versions.
 
     Args:
         raw_config (JSON): The raw configuration data.
         verbose (bool): If True, print verbose messages during validation.
 
     Returns:
-        DebugDojoConfigV1 | DebugDojoConfigV2 | None: The validated configuration
-            model, or None if validation fails for all models.
+        AnyDebugDojoConfig | None: The validated configuration model, or None if
+            validation fails.
 
     """
-    for model in (DebugDojoConfigV2, DebugDojoConfigV1):
-        model_name = model.__name__
-        try:
-            config = _validate_model(model, raw_config)
-        except (DaciteError, TypeError, ValueError) as e:
-            if verbose:
-                msg = (
-                    f"[yellow]Configuration validation error for {model_name}:\n{e}\n\n"
-                )
-                rich_print(msg)
-        else:
-            if verbose or model_name != DebugDojoConfig.__name__:
-                msg = (
-                    f"[blue]Using configuration model: {model_name}.\n"
-                    f"Current configuration model {DebugDojoConfig.__name__}. [/blue]"
-                )
-                rich_print(msg)
-            return config
-    return None
+    from dacite import DaciteError
+    from rich import print as rich_print
+
+    try:
+        config = _validate_model(raw_config)
+    except (DaciteError, TypeError, ValueError) as e:
+        rich_print(f"[yellow]Configuration validation error:\n{e}\n[/yellow]")
+        return None
+
+    model_name = type(config).__name__
+    if verbose or model_name != DebugDojoConfig.__name__:
+        msg = (
+            f"[blue]Using configuration model: {model_name}.\n"
+            f"Current configuration model {DebugDojoConfig.__name__}. [/blue]"
+        )
+        rich_print(msg)
+    return config
 
 
 def validated_and_updated_config(
@@ -179,6 +342,9 @@ def validated_and_updated_config(
     config = _try_validate_config(raw_config, verbose=verbose)
 
     if not config:
+        from rich import print as rich_print
+        from typer import Exit
+
         msg = "[red]Unsupported configuration version or error.[/red]"
         rich_print(msg)
         raise Exit(code=1)
@@ -194,27 +360,32 @@ def load_config(
     *,
     verbose: bool = False,
     debugger: DebuggerType | None = None,
+    use_cache: bool = True,
 ) -> DebugDojoConfig:
     """Load the Debug Dojo configuration.
 
     Return a DebugDojoConfig instance with the loaded configuration.
 
     If no configuration file is found, it returns a default configuration. If a debugger
-    is specified, it overrides the config.
+    is specified, it overrides the config. Validated configurations are cached on disk,
+    so an unchanged file is neither parsed nor validated again.
 
     Args:
         config_path (Path | None): Optional path to a configuration file.
         verbose (bool): If True, print verbose messages during configuration loading.
         debugger (DebuggerType | None): Optional debugger type to override the default
                                         debugger specified in the configuration.
+        use_cache (bool): If False, bypass the on-disk configuration cache.
 
     Returns:
         DebugDojoConfig: The loaded and potentially overridden DebugDojoConfig instance.
 
     """
-    resolved_path = resolve_config_path(config_path)
+    resolved_path = resolve_config_path(config_path, use_cache=use_cache)
 
     if verbose:
+        from rich import print as rich_print
+
         if resolved_path:
             msg = f"Using configuration file: {resolved_path}."
         else:
@@ -224,8 +395,17 @@ def load_config(
     if not resolved_path:
         return DebugDojoConfig()
 
-    raw_config = load_raw_config(resolved_path)
-    config = validated_and_updated_config(raw_config, verbose=verbose)
+    config = load_cached_config(resolved_path) if use_cache else None
+
+    if config is None:
+        raw_config = load_raw_config(resolved_path)
+        config = validated_and_updated_config(raw_config, verbose=verbose)
+        if use_cache:
+            store_cached_config(resolved_path, config)
+    elif verbose:
+        from rich import print as rich_print
+
+        rich_print("[blue]Using cached configuration.[/blue]")
 
     # If a debugger is specified, override the config.
     if debugger:
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING, TypeAlias
 
-from dacite import Config
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
 
 
 class DebuggerType(Enum):
@@ -21,6 +23,14 @@ class DebuggerType(Enum):
     PUDB = "pudb"
 
 
+class InstallMode(Enum):
+    """Enum for how debugging tools are installed."""
+
+    EAGER = "eager"
+    LAZY = "lazy"
+    DISABLED = "disabled"
+
+
 @dataclass
 class Features:
     """Legacy configuration for installing debug features (used in V1 config)."""
@@ -49,6 +59,8 @@ class DebugpyConfig:
     """Port for debugpy debugger."""
     wait_for_client: bool = True
     """Whether to wait for the client to connect before starting debugging."""
+    listen_on_signal: bool = False
+    """Whether to start listening only on SIGUSR1, without waiting for the client."""
 
     @property
     def set_trace_hook(self) -> str:
@@ -114,6 +126,21 @@ class ExceptionsConfig:
     """Enable post-mortem debugging after an exception."""
     rich_traceback: bool = True
     """Enable rich traceback for better error reporting."""
+    post_mortem_snapshot: bool = False
+    """Write a snapshot of the failing frames instead of an interactive post-mortem."""
+    snapshot_dir: str = "dojo-snapshots"
+    """Directory the post-mortem snapshots are written to."""
+    max_frames: int = 20
+    """Frames shown per rich traceback, half at each end; 0 shows all frames."""
+    max_locals: int = 20
+    """Locals shown per frame in a rich traceback."""
+    max_repr_length: int = 80
+    """Size budget, in characters, for the repr of a local in a rich traceback."""
+    max_container_items: int = 10
+    """Items shown per container local in a rich traceback."""
+    skip_types: list[str] = field(default_factory=list)
+    """Types whose locals are not represented in a rich traceback, by name or
+    qualified name (e.g. `pandas.DataFrame`)."""
 
 
 @dataclass
@@ -128,18 +155,44 @@ class FeaturesConfig:
     """Install rich inspect as 'i' for enhanced object inspection."""
     rich_print: str = "p"
     """Install rich print as 'p' for enhanced printing."""
+    safe_inspect: bool = False
+    """Show properties and other computed members as placeholders in 'i' and 'c'."""
+    attribute_timeout_ms: int = 0
+    """Time budget for evaluating one attribute in 'i' and 'c'; 0 for no budget."""
+    stream_inspect: bool = False
+    """Print the members listed by 'i' one by one as they are evaluated."""
+    inspect_max_members: int = 0
+    """Attributes and methods listed by 'i'; 0 for no cap."""
+
+
+@dataclass
+class MemoryConfig:
+    """Configuration for memory allocation tracking (`dojo run --trace-malloc`)."""
+
+    frames: int = 1
+    """Number of frames stored per allocation; more tell call paths apart."""
+    top: int = 10
+    """Number of allocation sites shown per snapshot and per growth report."""
 
 
 @dataclass
 class DebugDojoConfigV3:
     """Configuration for Debug Dojo."""
 
+    install_mode: InstallMode = InstallMode.LAZY
+    """Install tools eagerly, as proxies importing on first use, or as no-ops."""
     exceptions: ExceptionsConfig = field(default_factory=ExceptionsConfig)
     """Better exception messages."""
     debuggers: DebuggersConfig = field(default_factory=DebuggersConfig)
     """Default debugger and configs."""
     features: FeaturesConfig = field(default_factory=FeaturesConfig)
     """Features mnemonics."""
+    memory: MemoryConfig = field(default_factory=MemoryConfig)
+    """Memory allocation tracking."""
+    subprocesses: bool = False
+    """Install the tools in the child Python processes of `dojo run` as well."""
+    gamification: bool = True
+    """Enable or disable gamification (Dojo Belts)."""
 
 
 @dataclass
@@ -166,6 +219,7 @@ class DebugDojoConfigV2:
             exceptions=self.exceptions,
             debuggers=self.debuggers,
             features=self.features,
+            gamification=self.gamification,
         )
 
 
@@ -204,4 +258,50 @@ class DebugDojoConfigV1:
 
 DebugDojoConfig = DebugDojoConfigV3
 
-DACITE_CONFIG = Config(cast=[Enum], strict=True)
+AnyDebugDojoConfig: TypeAlias = (
+    DebugDojoConfigV1 | DebugDojoConfigV2 | DebugDojoConfigV3
+)
+"""Any supported version of the configuration model."""
+
+CONFIG_VERSION_KEY = "version"
+"""Optional top-level key pinning the configuration schema version."""
+
+CONFIG_MODELS: dict[int, type[AnyDebugDojoConfig]] = {
+    1: DebugDojoConfigV1,
+    2: DebugDojoConfigV2,
+    3: DebugDojoConfigV3,
+}
+"""Configuration models by schema version."""
+
+CURRENT_CONFIG_VERSION = max(CONFIG_MODELS)
+
+
+def _validator(
+    model: type[AnyDebugDojoConfig],
+) -> Callable[[Mapping[str, object]], AnyDebugDojoConfig]:
+    """Bind a strict `dacite.from_dict` validation to a configuration model.
+
+    Nothing is precompiled: every call runs `from_dict`, which does its own type
+    introspection. `dacite` is imported on the first validation, so reading a cached
+    configuration does not import it.
+
+    Returns:
+        Callable[[Mapping[str, object]], AnyDebugDojoConfig]: The validator.
+
+    """
+
+    def validate(data: Mapping[str, object]) -> AnyDebugDojoConfig:
+        from dacite import Config, from_dict
+
+        return from_dict(model, data, config=Config(cast=[Enum], strict=True))
+
+    return validate
+
+
+CONFIG_VALIDATORS: dict[int, Callable[[Mapping[str, object]], AnyDebugDojoConfig]] = {
+    version: _validator(model) for version, model in CONFIG_MODELS.items()
+}
+"""Strict validators by schema version.
+
+The saving over trying every model is that exactly one of them runs per load.
+"""
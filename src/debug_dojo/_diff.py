@@ -0,0 +1,333 @@
+"""Structural diff of Python objects.
+
+Two objects are walked side by side: mappings are aligned by key, sequences by index,
+sets by membership, arrays element-wise and plain objects by attribute name (from
+their `__dict__`). Every subtree is fingerprinted once, so identical branches are
+skipped with a single comparison and the cost of a diff is linear in the size of the
+objects, no matter how deeply the differences are nested.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, cast
+
+from debug_dojo._arrays import compare_arrays, is_array_like
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from collections.abc import Set as AbstractSet
+
+MAX_DEPTH = 20
+"""Default depth below which differing subtrees are reported as a whole."""
+MAX_DIFFERENCES = 200
+"""Default number of differences collected before the diff stops."""
+
+_HASH_MASK = (1 << 64) - 1
+_PRIMITIVES = (str, bytes, int, float, complex, bool, type(None), Enum)
+
+
+class ChangeKind(Enum):
+    """Kind of a difference between two objects."""
+
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+@dataclass(frozen=True)
+class Difference:
+    """A single difference between two objects."""
+
+    path: str
+    """Location of the difference, e.g. `.config['hosts'][2]`; empty for the root."""
+    kind: ChangeKind
+    """Whether the value was added, removed or changed."""
+    left: object = None
+    """The value in the first object (None if added)."""
+    right: object = None
+    """The value in the second object (None if removed)."""
+
+
+@dataclass
+class DiffResult:
+    """The differences between two objects."""
+
+    differences: list[Difference]
+    """The differences found, in traversal order."""
+    truncated: bool = False
+    """Whether the diff stopped early after `max_differences` differences."""
+
+
+class _DiffLimitReachedError(Exception):
+    """Raised internally to stop the traversal."""
+
+
+class _Fingerprints:
+    """Memoized structural fingerprints of object subtrees.
+
+    Objects are memoized by identity, so shared subtrees are fingerprinted once. Flat
+    containers of hashable values are hashed by the interpreter in a single call.
+    """
+
+    def __init__(self, max_depth: int) -> None:
+        self._max_depth: int = max_depth
+        self._memo: dict[int, int] = {}
+        self._alive: list[object] = []
+
+    def __call__(self, obj: object, depth: int = 0) -> int:
+        if isinstance(obj, _PRIMITIVES):
+            return hash(obj)
+
+        key = id(obj)
+        if key in self._memo:
+            return self._memo[key]
+
+        # A placeholder terminates cycles; the object is kept alive so its id stays
+        # unique while the memo is in use.
+        self._memo[key] = key
+        self._alive.append(obj)
+        fingerprint = self._compute(obj, depth) & _HASH_MASK
+        self._memo[key] = fingerprint
+        return fingerprint
+
+    def _compute(self, obj: object, depth: int) -> int:
+        if depth >= self._max_depth:
+            return _identity_hash(obj)
+        if isinstance(obj, (list, tuple)):
+            return self._sequence(cast("Sequence[object]", obj), depth)
+        if isinstance(obj, Mapping):
+            return self._mapping(cast("Mapping[object, object]", obj), depth)
+        if isinstance(obj, (set, frozenset)):
+            return hash(("set", frozenset(cast("AbstractSet[object]", obj))))
+        # Arrays are compared element-wise by the differ, not walked.
+        attributes = None if is_array_like(obj) else _attributes(obj)
+        if attributes is None:
+            return _identity_hash(obj)
+        return hash((type(obj).__qualname__, self(attributes, depth + 1)))
+
+    def _sequence(self, obj: Sequence[object], depth: int) -> int:
+        try:
+            return hash((type(obj).__name__, tuple(obj)))
+        except TypeError:
+            items = tuple(self(item, depth + 1) for item in obj)
+            return hash((type(obj).__name__, items))
+
+    def _mapping(self, obj: Mapping[object, object], depth: int) -> int:
+        try:
+            return hash(("mapping", frozenset(obj.items())))
+        except TypeError:
+            # Order-independent, like mapping equality.
+            return sum(
+                hash((self(key, depth + 1), self(value, depth + 1)))
+                for key, value in obj.items()
+            )
+
+
+def _identity_hash(obj: object) -> int:
+    """Hash an object by value if possible, by identity otherwise.
+
+    Returns:
+        int: The hash.
+
+    """
+    try:
+        return hash(obj)
+    except TypeError:
+        return id(obj)
+
+
+def _equal(left: object, right: object) -> bool:
+    """Compare two values with `==`, treating errors and non-bool results as unequal.
+
+    Returns:
+        bool: True if the values compare equal.
+
+    """
+    try:
+        return bool(left == right)
+    except Exception:  # noqa: BLE001
+        return False
+
+
+def _attributes(obj: object) -> dict[str, object] | None:
+    """Return the instance attributes of an object, if it has a `__dict__`.
+
+    Returns:
+        dict[str, object] | None: The attributes, or None for objects without them.
+
+    """
+    try:
+        attributes: dict[str, object] = vars(obj)
+    except TypeError:
+        return None
+    return attributes
+
+
+class _Differ:
+    """Walks two objects and collects their differences."""
+
+    def __init__(self, max_depth: int, max_differences: int) -> None:
+        self._fingerprint: _Fingerprints = _Fingerprints(max_depth)
+        self._max_depth: int = max_depth
+        self._max_differences: int = max_differences
+        self.differences: list[Difference] = []
+
+    def _record(self, difference: Difference) -> None:
+        if len(self.differences) >= self._max_differences:
+            raise _DiffLimitReachedError
+        self.differences.append(difference)
+
+    def _same(self, left: object, right: object, *, fingerprint: bool) -> bool:
+        if left is right:
+            return True
+        if isinstance(left, _PRIMITIVES) and isinstance(right, _PRIMITIVES):
+            return type(left) is type(right) and left == right
+        if not fingerprint or self._fingerprint(left) != self._fingerprint(right):
+            return False
+        # Equal fingerprints may be a hash collision (e.g. `hash(-1) == hash(-2)`), so
+        # they only spare the walk once the values are confirmed equal.
+        return _equal(left, right)
+
+    def diff(self, left: object, right: object, path: str = "", depth: int = 0) -> None:
+        # The roots are compared through their children, so subtrees shared by both
+        # objects are skipped by identity without ever being fingerprinted.
+        if self._same(left, right, fingerprint=depth > 0):
+            return
+
+        if depth >= self._max_depth or type(left) is not type(right):
+            self._record(Difference(path, ChangeKind.CHANGED, left, right))
+            return
+
+        # Both sides have the same type from here on.
+        if is_array_like(left):
+            if not compare_arrays(left, right).identical:
+                self._record(Difference(path, ChangeKind.CHANGED, left, right))
+        elif isinstance(left, Mapping):
+            self._diff_mapping(
+                cast("Mapping[object, object]", left),
+                cast("Mapping[object, object]", right),
+                path,
+                depth,
+            )
+        elif isinstance(left, (list, tuple)):
+            self._diff_sequence(
+                cast("Sequence[object]", left),
+                cast("Sequence[object]", right),
+                path,
+                depth,
+            )
+        elif isinstance(left, (set, frozenset)):
+            self._diff_set(
+                cast("AbstractSet[object]", left),
+                cast("AbstractSet[object]", right),
+                path,
+            )
+        else:
+            left_attributes, right_attributes = _attributes(left), _attributes(right)
+            if left_attributes is None or right_attributes is None:
+                self._record(Difference(path, ChangeKind.CHANGED, left, right))
+            else:
+                self._diff_attributes(left_attributes, right_attributes, path, depth)
+
+    def _diff_mapping(
+        self,
+        left: Mapping[object, object],
+        right: Mapping[object, object],
+        path: str,
+        depth: int,
+    ) -> None:
+        for key, value in left.items():
+            if key not in right:
+                self._record(Difference(f"{path}[{key!r}]", ChangeKind.REMOVED, value))
+            else:
+                self.diff(value, right[key], f"{path}[{key!r}]", depth + 1)
+        for key, value in right.items():
+            if key not in left:
+                self._record(
+                    Difference(f"{path}[{key!r}]", ChangeKind.ADDED, right=value)
+                )
+
+    def _diff_sequence(
+        self,
+        left: Sequence[object],
+        right: Sequence[object],
+        path: str,
+        depth: int,
+    ) -> None:
+        for index, (left_item, right_item) in enumerate(zip(left, right, strict=False)):
+            self.diff(left_item, right_item, f"{path}[{index}]", depth + 1)
+        for index in range(len(right), len(left)):
+            self._record(
+                Difference(f"{path}[{index}]", ChangeKind.REMOVED, left[index])
+            )
+        for index in range(len(left), len(right)):
+            self._record(
+                Difference(f"{path}[{index}]", ChangeKind.ADDED, right=right[index])
+            )
+
+    def _diff_set(
+        self,
+        left: AbstractSet[object],
+        right: AbstractSet[object],
+        path: str,
+    ) -> None:
+        for item in left - right:
+            self._record(Difference(f"{path}{{{item!r}}}", ChangeKind.REMOVED, item))
+        for item in right - left:
+            self._record(
+                Difference(f"{path}{{{item!r}}}", ChangeKind.ADDED, right=item)
+            )
+
+    def _diff_attributes(
+        self,
+        left: dict[str, object],
+        right: dict[str, object],
+        path: str,
+        depth: int,
+    ) -> None:
+        for name in sorted(left.keys() | right.keys()):
+            if name not in right:
+                self._record(
+                    Difference(f"{path}.{name}", ChangeKind.REMOVED, left[name])
+                )
+            elif name not in left:
+                self._record(
+                    Difference(f"{path}.{name}", ChangeKind.ADDED, right=right[name])
+                )
+            else:
+                self.diff(left[name], right[name], f"{path}.{name}", depth + 1)
+
+
+def diff_objects(
+    left: object,
+    right: object,
+    *,
+    max_depth: int = MAX_DEPTH,
+    max_differences: int = MAX_DIFFERENCES,
+) -> DiffResult:
+    """Compute the structural differences between two objects.
+
+    >>> result = diff_objects({"a": 1, "b": [1, 2]}, {"a": 1, "b": [1, 3], "c": 0})
+    >>> [(d.path, d.kind.value) for d in result.differences]
+    [("['b'][1]", 'changed'), ("['c']", 'added')]
+
+    Args:
+        left (object): The first object.
+        right (object): The second object.
+        max_depth (int): Depth below which a differing subtree is reported as a
+                         single change.
+        max_differences (int): Number of differences after which the diff stops.
+
+    Returns:
+        DiffResult: The differences, in traversal order.
+
+    """
+    differ = _Differ(max_depth, max_differences)
+    try:
+        differ.diff(left, right)
+    except _DiffLimitReachedError:
+        return DiffResult(differ.differences, truncated=True)
+    return DiffResult(differ.differences)
@@ -0,0 +1,243 @@
+"""Entry point of the `dojo` command, with a fast path for `dojo run`.
+
+Building the typer application imports typer, click and rich, which costs more than
+running a short script. The common invocations of `dojo run` (a target and the
+`--config`, `--debugger`, `--verbose`, `--module`, `--exec`, `--no-cache` and `--warm`
+options) are parsed here without typer; anything else, such as `--help`, a profiling
+option or another command, goes to the typer application in `_cli`.
+
+The fast path accepts exactly what typer would parse the same way, and hands over
+otherwise: options of `dojo run` are also recognized after the target, so such an
+argument line is left to typer.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from debug_dojo._config_models import DebuggerType
+
+_FLAGS = {
+    "--verbose": "verbose",
+    "-v": "verbose",
+    "--module": "module",
+    "-m": "module",
+    "--exec": "executable",
+    "-e": "executable",
+    "--no-cache": "no_cache",
+    "--warm": "warm",
+}
+_VALUED = {
+    "--config": "config_path",
+    "-c": "config_path",
+    "--debugger": "debugger",
+    "-d": "debugger",
+}
+TYPER_ONLY_OPTIONS = frozenset(
+    {
+        "--cprofile",
+        "--cprofile-filter",
+        "--cprofile-output",
+        "--cprofile-sort",
+        "--help",
+        "--preload",
+        "--profile",
+        "--profile-output",
+        "--stats",
+        "--stats-output",
+        "--trace-malloc",
+        "--watch",
+    }
+)
+"""Options of `dojo run` that are left to typer."""
+FAST_OPTIONS = frozenset(_FLAGS.keys() | _VALUED.keys())
+"""Options of `dojo run` parsed by the fast path."""
+_SHORT_NAMES = frozenset(name[1] for name in FAST_OPTIONS if not name.startswith("--"))
+
+
+@dataclass
+class RunArguments:
+    """The arguments of a `dojo run` invocation parsed by the fast path."""
+
+    target_name: str
+    target_args: list[str] = field(default_factory=list)
+    config_path: Path | None = None
+    debugger: DebuggerType | None = None
+    verbose: bool = False
+    module: bool = False
+    executable: bool = False
+    no_cache: bool = False
+    warm: bool = False
+
+
+def _is_run_option(argument: str) -> bool:
+    """Check whether typer would take an argument for an option of `dojo run`.
+
+    Returns:
+        bool: True for the options of `dojo run`, with or without an `=value`, and
+              for short option clusters such as `-vm`.
+
+    """
+    if argument.startswith("--"):
+        name = argument.partition("=")[0]
+        return name in FAST_OPTIONS or name in TYPER_ONLY_OPTIONS
+    return bool(_SHORT_NAMES & set(argument[1:]))
+
+
+def _split(arguments: list[str]) -> tuple[dict[str, str | bool], list[str]] | None:
+    """Split the arguments following `dojo run` into its options and the target.
+
+    Returns:
+        tuple[dict[str, str | bool], list[str]] | None: The options by field name,
+            and the target followed by its arguments; None if typer has to parse
+            them.
+
+    """
+    options: dict[str, str | bool] = {}
+    remaining = iter(arguments)
+    for argument in remaining:
+        name, equals, value = (
+            argument.partition("=") if argument.startswith("--") else (argument, "", "")
+        )
+        if name in _VALUED:
+            value = value if equals else next(remaining, None)
+            if value is None:
+                return None
+            options[_VALUED[name]] = value
+        elif argument in _FLAGS:
+            options[_FLAGS[argument]] = True
+        elif argument.startswith("-"):
+            return None
+        else:
+            target = [argument, *remaining]
+            if any(
+                item == "--" or (item.startswith("-") and _is_run_option(item))
+                for item in target[1:]
+            ):
+                return None
+            return options, target
+    return None
+
+
+def parse_run(arguments: list[str]) -> RunArguments | None:
+    """Parse the arguments following `dojo run`, if the fast path can handle them.
+
+    Args:
+        arguments (list[str]): The command-line arguments after `run`.
+
+    Returns:
+        RunArguments | None: The parsed arguments, or None if typer has to parse them:
+            for unknown or profiling options before the target, `dojo run` options
+            after it, `--`, a missing target, an unknown debugger, or `--module`
+            together with `--exec`.
+
+    """
+    split = _split(arguments)
+    if split is None:
+        return None
+    options, (target_name, *target_args) = split
+    if options.get("module") and options.get("executable"):
+        return None
+    debugger = options.pop("debugger", None)
+    config_path = options.pop("config_path", None)
+    try:
+        return RunArguments(
+            target_name,
+            target_args,
+            config_path=Path(str(config_path)) if config_path else None,
+            debugger=DebuggerType(debugger) if debugger else None,
+            **{name: bool(value) for name, value in options.items()},
+        )
+    except ValueError:
+        return None
+
+
+def _without_warm(arguments: list[str]) -> list[str]:
+    """Return the `dojo run` arguments to forward to the warm server.
+
+    Returns:
+        list[str]: The arguments, without the first `--warm`.
+
+    """
+    forwarded = list(arguments)
+    forwarded.remove("--warm")
+    return forwarded
+
+
+def run(run_arguments: RunArguments, arguments: list[str]) -> None:
+    """Run `dojo run` with arguments parsed by the fast path.
+
+    Args:
+        run_arguments (RunArguments): The parsed arguments.
+        arguments (list[str]): The raw arguments, forwarded to a warm server.
+
+    """
+    from debug_dojo._config import load_config  # noqa: PLC0415
+    from debug_dojo._execution import ExecMode, execute_with_debug  # noqa: PLC0415
+
+    verbose = run_arguments.verbose
+    if run_arguments.warm:
+        from debug_dojo._server import default_socket_path, run_warm  # noqa: PLC0415
+
+        code = run_warm(_without_warm(arguments), default_socket_path())
+        if code is not None:
+            sys.exit(code)
+        if verbose:
+            from rich import print as rich_print  # noqa: PLC0415
+
+            rich_print(
+                "[yellow]No dojo server is running, running in-process.[/yellow]"
+            )
+
+    mode = (
+        ExecMode.EXECUTABLE
+        if run_arguments.executable
+        else ExecMode.MODULE
+        if run_arguments.module
+        else ExecMode.FILE
+    )
+    config = load_config(
+        run_arguments.config_path,
+        verbose=verbose,
+        debugger=run_arguments.debugger,
+        use_cache=not run_arguments.no_cache,
+    )
+    if verbose:
+        from rich import print as rich_print  # noqa: PLC0415
+
+        rich_print(f"[blue]Using debug-dojo configuration: {config} [/blue]")
+
+    execute_with_debug(
+        target_name=run_arguments.target_name,
+        target_mode=mode,
+        target_args=run_arguments.target_args,
+        verbose=verbose,
+        config=config,
+    )
+
+
+def main() -> None:
+    """Run the command-line interface.
+
+    Raises:
+        RuntimeError: Any error of the fast path other than `typer.Exit`.
+
+    """
+    arguments = sys.argv[1:]
+    run_arguments = parse_run(arguments[1:]) if arguments[:1] == ["run"] else None
+    if run_arguments is None:
+        from debug_dojo._cli import main as cli_main  # noqa: PLC0415
+
+        cli_main()
+        return
+
+    try:
+        run(run_arguments, arguments[1:])
+    except RuntimeError as e:  # typer.Exit, without importing typer up front.
+        from typer import Exit  # noqa: PLC0415
+
+        if not isinstance(e, Exit):
+            raise
+        sys.exit(e.exit_code)
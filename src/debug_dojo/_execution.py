@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import contextlib
+import cProfile
 import runpy
 import sys
 import traceback
@@ -11,16 +13,17 @@ from pathlib import Path
 from shutil import which
 from typing import TYPE_CHECKING
 
-import typer
-from rich import print as rich_print
-
+from debug_dojo._breakpoint import post_mortem
+from debug_dojo._children import propagated
 from debug_dojo._installers import install_by_config
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Generator
+    from contextlib import AbstractContextManager
     from typing import Any
 
     from debug_dojo._config_models import DebugDojoConfig
+    from debug_dojo._profiling import CallProfileOptions, SamplingProfiler
 
     Runner = Callable[..., dict[str, Any]]  # pyright: ignore[reportExplicitAny]
 
@@ -33,6 +36,18 @@ class ExecMode(Enum):
     EXECUTABLE = "executable"
 
 
+def _print(message: object) -> None:
+    """Print with rich, which is imported on first use only.
+
+    A plain `dojo run` of a target that succeeds prints nothing, so it pays for
+    neither rich nor typer, which is only imported to exit with an error.
+
+    """
+    from rich import print as rich_print
+
+    rich_print(message)
+
+
 def _configure_sys_argv(target_name: str, target_args: list[str]) -> None:
     """Configure sys.argv for the target script.
 
@@ -61,8 +76,8 @@ def _install_debug_tools(
 
     """
     if verbose:
-        rich_print(f"[blue]Installing debugging tools for {target_name}.[/blue]")
-        rich_print(f"[blue]Arguments for target: {target_args}[/blue]")
+        _print(f"[blue]Installing debugging tools for {target_name}.[/blue]")
+        _print(f"[blue]Arguments for target: {target_args}[/blue]")
 
     install_by_config(config)
 
@@ -92,15 +107,42 @@ def _get_runner_and_target(
         resolved_name = which(target_name) or target_name
 
     if not Path(resolved_name).exists():
-        rich_print(f"[red]File run mode couldn't resolve path {resolved_name}.[/red]")
-        raise typer.Exit(1)
+        from typer import Exit
+
+        _print(f"[red]File run mode couldn't resolve path {resolved_name}.[/red]")
+        raise Exit(1)
 
     return runpy.run_path, resolved_name
 
 
+_NO_TERMINAL = (
+    "Skipping post-mortem, as there is no terminal to debug in. "
+    "Saving the failing frames to a snapshot instead."
+)
+
+
+def _is_interactive() -> bool:
+    """Check whether a debugger prompt can be answered, i.e. stdin is a terminal.
+
+    Returns:
+        bool: True if the standard input is an open terminal.
+
+    """
+    try:
+        return sys.stdin.isatty()
+    except ValueError:  # closed
+        return False
+
+
 def _handle_exception(e: Exception, target_name: str, config: DebugDojoConfig) -> None:
     """Handle exceptions during execution, optionally entering post-mortem.
 
+    The post-mortem session uses the configured debugger. With `post_mortem_snapshot`,
+    the failing frames are written to a snapshot file for `dojo replay` instead, so
+    unattended runs do not block on a debugger prompt. Without a terminal to interact
+    with, the post-mortem session is skipped and a snapshot is written as well, so the
+    frames are not lost.
+
     Args:
         e (Exception): The exception that occurred.
         target_name (str): The name of the target being executed.
@@ -110,20 +152,47 @@ def _handle_exception(e: Exception, target_name: str, config: DebugDojoConfig) -
         typer.Exit: Always raises Exit(1) after handling.
 
     """
-    rich_print(f"[red]Error while running {target_name}:[/red]\n{e}")
-    rich_print(traceback.format_exc())
-    if config.exceptions.post_mortem:
-        import ipdb  # pyright: ignore[reportMissingTypeStubs]  # noqa: PLC0415, T100
+    from typer import Exit
+
+    _print(f"[red]Error while running {target_name}:[/red]\n{e}")
+    _print(traceback.format_exc())
+    snapshot = config.exceptions.post_mortem_snapshot
+    if not snapshot and config.exceptions.post_mortem and e.__traceback__ is not None:
+        if _is_interactive():
+            if not post_mortem(e.__traceback__):
+                _print("[yellow]The debugger has no post-mortem session.[/yellow]")
+        else:
+            _print(f"[yellow]{_NO_TERMINAL}[/yellow]")
+            snapshot = True
+    if snapshot:
+        _write_snapshot(e, Path(config.exceptions.snapshot_dir))
+    raise Exit(1) from e
+
+
+def _write_snapshot(e: Exception, directory: Path) -> None:
+    """Write the failing frames to a snapshot file for `dojo replay`.
+
+    Args:
+        e (Exception): The exception that occurred.
+        directory (Path): The directory to write the snapshot to.
+
+    """
+    from debug_dojo._snapshot import write_snapshot
 
-        rich_print("[blue]Entering post-mortem debugging session...[/blue]")
-        ipdb.post_mortem(e.__traceback__)  # pyright: ignore[reportUnknownMemberType]
-    raise typer.Exit(1) from e
+    try:
+        path = write_snapshot(e, directory)
+    except OSError as error:
+        _print(f"[yellow]Could not write the post-mortem snapshot: {error}[/yellow]")
+        return
+    replay = f"dojo replay {path}"
+    _print(f"[blue]Wrote post-mortem snapshot to {path}: `{replay}`[/blue]")
 
 
 def _safe_execute(
     runner: Runner,
     target_name: str,
     config: DebugDojoConfig,
+    profiler: AbstractContextManager[object] | None = None,
 ) -> None:
     """Execute the target safely, handling specific exceptions.
 
@@ -131,48 +200,207 @@ def _safe_execute(
         runner (Runner): The function to run the target.
         target_name (str): The name of the target.
         config (DebugDojoConfig): The configuration object.
+        profiler (AbstractContextManager[object] | None): A profiler to run the
+                                                          target under.
 
     Raises:
-        Exit: If an error occurs or the user interrupts the execution.
+        typer.Exit: If an error occurs or the user interrupts the execution.
 
     """
     try:
-        _ = runner(target_name, run_name="__main__")
+        with profiler or contextlib.nullcontext():
+            _ = runner(target_name, run_name="__main__")
     except ImportError as e:
-        rich_print(f"[red]Error importing {target_name}:[/red]\n{e}")
-        raise typer.Exit(1) from e
+        from typer import Exit
+
+        _print(f"[red]Error importing {target_name}:[/red]\n{e}")
+        raise Exit(1) from e
     except BdbQuit:
-        rich_print("[red]Debugging session terminated by user.[/red]")
-        raise typer.Exit(0) from None
+        from typer import Exit
+
+        _print("[red]Debugging session terminated by user.[/red]")
+        raise Exit(0) from None
     except KeyboardInterrupt:
-        rich_print("[red]Execution interrupted by user.[/red]")
-        raise typer.Exit(0) from None
+        from typer import Exit
+
+        _print("[red]Execution interrupted by user.[/red]")
+        raise Exit(0) from None
     except SystemExit as e:
         if e.code:
-            rich_print(f"[red]Script exited with code {e.code}.[/red]")
+            _print(f"[red]Script exited with code {e.code}.[/red]")
     except Exception as e:  # noqa: BLE001
         _handle_exception(e, target_name, config)
 
 
-def execute_with_debug(
+def _report_profile(profiler: SamplingProfiler, output: Path | None) -> None:
+    """Print the profile summary, or write the samples as collapsed stacks.
+
+    Args:
+        profiler (SamplingProfiler): The profiler that sampled the target.
+        output (Path | None): The file to write the collapsed stacks to, or None to
+                              print a summary.
+
+    """
+    if output is None:
+        _print(profiler.summary())
+        return
+    profiler.write_collapsed(output)
+    _print(f"[blue]Wrote {profiler.total} profile samples to {output}.[/blue]")
+
+
+def _report_call_profile(
+    profile: cProfile.Profile, options: CallProfileOptions
+) -> None:
+    """Dump the call statistics and print the top functions.
+
+    Args:
+        profile (cProfile.Profile): The profile of the target.
+        options (CallProfileOptions): Where to dump the statistics and which
+                                      functions to show.
+
+    """
+    from debug_dojo._profiling import call_stats_table
+
+    profile.dump_stats(options.output)
+    _print(
+        call_stats_table(
+            profile, sort=options.sort, prefix=options.prefix, limit=options.limit
+        )
+    )
+    _print(f"[blue]Wrote call statistics to {options.output}.[/blue]")
+
+
+@contextlib.contextmanager
+def _reporting_stats(config: DebugDojoConfig, output: Path | None) -> Generator[None]:
+    """Record the calls of the debugging tools, and report them on exit.
+
+    Args:
+        config (DebugDojoConfig): The configuration the tools were installed with.
+        output (Path | None): Write the statistics to this JSON file instead of
+                              printing them.
+
+    Yields:
+        None: While the target runs.
+
+    """
+    from debug_dojo._stats import recording
+
+    with recording(config) as stats:
+        try:
+            yield
+        finally:
+            if output is not None:
+                stats.write(output)
+                _print(f"[blue]Wrote debugging tool statistics to {output}.[/blue]")
+            elif stats.sites:
+                _print(stats.table())
+            else:
+                _print("[blue]No debugging tool calls recorded.[/blue]")
+
+
+def _execute_profiled(  # noqa: PLR0913
+    runner: Runner,
+    target_name: str,
+    config: DebugDojoConfig,
+    *,
+    profile: bool,
+    profile_output: Path | None,
+    call_profile: CallProfileOptions | None,
+) -> None:
+    """Execute the target, under the requested profiler if any.
+
+    Args:
+        runner (Runner): The function to run the target.
+        target_name (str): The resolved name of the target.
+        config (DebugDojoConfig): The configuration object.
+        profile (bool): If True, run the target under the sampling profiler.
+        profile_output (Path | None): Write the sampled profile to this file.
+        call_profile (CallProfileOptions | None): If given, run the target under
+                                                  `cProfile`.
+
+    """
+    if call_profile is not None:
+        profile_calls = cProfile.Profile()
+        try:
+            _safe_execute(runner, target_name, config, profile_calls)
+        finally:
+            _report_call_profile(profile_calls, call_profile)
+        return
+
+    if not (profile or profile_output):
+        _safe_execute(runner, target_name, config)
+        return
+
+    from debug_dojo._profiling import SamplingProfiler
+
+    profiler = SamplingProfiler()
+    try:
+        _safe_execute(runner, target_name, config, profiler)
+    finally:
+        _report_profile(profiler, profile_output)
+
+
+def execute_with_debug(  # noqa: PLR0913
     target_name: str,
     target_args: list[str],
     *,
     target_mode: ExecMode,
     verbose: bool,
     config: DebugDojoConfig,
+    profile: bool = False,
+    profile_output: Path | None = None,
+    call_profile: CallProfileOptions | None = None,
+    trace_malloc: bool = False,
+    stats: bool = False,
+    stats_output: Path | None = None,
 ) -> None:
     """Execute a target script or module with installed debugging tools.
 
+    With `subprocesses` set in the configuration, the tools are also installed in
+    the Python processes the target starts, e.g. pytest-xdist workers.
+
     Args:
         target_name (str): The name of the script, module, or executable to run.
         target_args (list[str]): Arguments to pass to the target.
         target_mode (ExecMode): The execution mode (FILE, MODULE, or EXECUTABLE).
         verbose (bool): If True, print verbose output.
         config (DebugDojoConfig): The debug-dojo configuration.
+        profile (bool): If True, run the target under the sampling profiler and
+                        report where the time went at exit.
+        profile_output (Path | None): Write the profile to this file as collapsed
+                                      stacks instead of printing a summary.
+        call_profile (CallProfileOptions | None): If given, run the target under
+                                                  `cProfile`, dump the statistics and
+                                                  print the top functions at exit.
+        trace_malloc (bool): If True, track memory allocations with `tracemalloc`
+                             and report them at start, at every `b()` hit and at
+                             exit.
+        stats (bool): If True, count and time the calls of the debugging tools per
+                      call site, and print them at exit.
+        stats_output (Path | None): Write the tool statistics to this JSON file
+                                    instead of printing them (implies `stats`).
 
     """
     _configure_sys_argv(target_name, target_args)
     _install_debug_tools(target_name, target_args, verbose=verbose, config=config)
     runner, resolved_target = _get_runner_and_target(target_name, target_mode)
-    _safe_execute(runner, resolved_target, config)
+    tracker: AbstractContextManager[object] = contextlib.nullcontext()
+    if trace_malloc:
+        from debug_dojo._memory import MemoryTracker
+
+        tracker = MemoryTracker(frames=config.memory.frames, top=config.memory.top)
+    children = propagated(config) if config.subprocesses else contextlib.nullcontext()
+    recorder: AbstractContextManager[object] = (
+        _reporting_stats(config, stats_output)
+        if stats or stats_output
+        else contextlib.nullcontext()
+    )
+    with children, tracker, recorder:
+        _execute_profiled(
+            runner,
+            resolved_target,
+            config,
+            profile=profile,
+            profile_output=profile_output,
+            call_profile=call_profile,
+        )
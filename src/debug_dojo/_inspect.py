@@ -0,0 +1,70 @@
+"""Bounded object inspection for the `i` tool.
+
+`rich.inspect` reads every attribute of an object, which runs arbitrary property code.
+When safe inspection, an attribute time budget, streaming or a member cap is
+configured, `i` renders the object's members with the comparer's listing instead, so
+inspection cost is bounded and computed members are not evaluated.
+
+At most `max_members` attributes and methods are evaluated. With `stream`, each line
+is printed as soon as its member is evaluated, so the first output appears in
+constant time however many members the object has; otherwise the listing is printed
+once complete. With `pager`, the output is shown in the console's pager instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+
+from rich.console import Console
+
+from debug_dojo._compare import (
+    MAX_MEMBERS,
+    MAX_REPR_LENGTH,
+    iter_simplified_object_info,
+)
+
+
+def inspect_object(  # noqa: PLR0913
+    obj: object,
+    *,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+    max_members: int | None = MAX_MEMBERS,
+    max_repr_length: int = MAX_REPR_LENGTH,
+    page: int = 0,
+    pager: bool = False,
+    stream: bool = True,
+    console: Console | None = None,
+) -> None:
+    """Display the attributes and methods of an object in the terminal.
+
+    Args:
+        obj (object): The object to inspect.
+        safe (bool): If True, show properties and other computed members as a
+                     placeholder instead of evaluating them.
+        attribute_timeout (float | None): Time budget in seconds for evaluating and
+                                          formatting a single attribute.
+        max_members (int | None): Number of attributes and of methods shown per page,
+                                  or None to show all of them.
+        max_repr_length (int): Size budget for the repr of each value.
+        page (int): The page of members to show.
+        pager (bool): If True, show the output in a pager.
+        stream (bool): If True, print each line as soon as its member is evaluated,
+                       else once all of them are.
+        console (Console | None): The console to print to, a new one by default.
+
+    """
+    lines = iter_simplified_object_info(
+        obj,
+        max_members=max_members,
+        max_repr_length=max_repr_length,
+        page=page,
+        safe=safe,
+        attribute_timeout=attribute_timeout,
+    )
+    if not stream:
+        lines = iter(list(lines))
+    main_console = console or Console()
+    with main_console.pager(styles=True) if pager else contextlib.nullcontext():
+        for line in lines:
+            main_console.print(line)
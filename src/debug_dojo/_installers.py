@@ -11,12 +11,15 @@ from __future__ import annotations
 import builtins
 import json
 import os
+import signal
 import sys
-from typing import Any, cast
+from dataclasses import replace
+from functools import partial
+from importlib import import_module
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, cast, final
 
-from rich import print as rich_print
-
-from debug_dojo._compare import inspect_objects_side_by_side
+from debug_dojo._breakpoint import Breakpoint, breakpointhook
 from debug_dojo._config_models import (
     DebugDojoConfig,
     DebuggersConfig,
@@ -24,13 +27,19 @@ from debug_dojo._config_models import (
     DebugpyConfig,
     ExceptionsConfig,
     FeaturesConfig,
+    InstallMode,
     IpdbConfig,
     PdbConfig,
     PudbConfig,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import FrameType, TracebackType
+
 BREAKPOINT_ENV_VAR = "PYTHONBREAKPOINT"
 IPDB_CONTEXT_SIZE = "IPDB_CONTEXT_SIZE"
+LISTEN_SIGNAL = "SIGUSR1"
 
 _NOT_INSTALLED = (
     "[yellow]{name} is not installed."
@@ -39,7 +48,131 @@ _NOT_INSTALLED = (
 )
 
 
-def use_pdb(config: PdbConfig) -> None:
+def _import_callable(module: str, attribute: str) -> Callable[..., object]:
+    """Import `module.attribute`.
+
+    Returns:
+        Callable[..., object]: The imported callable.
+
+    """
+    return cast("Callable[..., object]", getattr(import_module(module), attribute))
+
+
+@final
+class LazyCallable:
+    """Proxy for a callable that is imported only when first called.
+
+    Keeps `import debug_dojo.install` free of `rich`, debugger and comparer imports;
+    the real target is resolved once and cached on the first call.
+
+    >>> proxy = LazyCallable("operator", "add")
+    >>> proxy.resolved
+    False
+    >>> proxy(1, 2)
+    3
+    >>> proxy.resolved
+    True
+
+    """
+
+    __slots__ = ("_attribute", "_module", "_target")
+
+    def __init__(self, module: str, attribute: str) -> None:
+        """Create the proxy.
+
+        Args:
+            module (str): Dotted name of the module holding the callable.
+            attribute (str): Name of the callable within the module.
+
+        """
+        self._module: str = module
+        self._attribute: str = attribute
+        self._target: Callable[..., object] | None = None
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the target has already been imported."""
+        return self._target is not None
+
+    def resolve(self) -> Callable[..., object]:
+        """Import and cache the target callable.
+
+        Returns:
+            Callable[..., object]: The proxied callable.
+
+        """
+        if self._target is None:
+            self._target = _import_callable(self._module, self._attribute)
+        return self._target
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        """Call the proxied callable, importing it first if needed.
+
+        Returns:
+            object: Whatever the proxied callable returns.
+
+        """
+        return self.resolve()(*args, **kwargs)
+
+
+def _hook(module: str, attribute: str, *, lazy: bool) -> Callable[..., object]:
+    """Return `module.attribute`, or a lazy proxy for it.
+
+    Args:
+        module (str): Dotted name of the module holding the callable.
+        attribute (str): Name of the callable within the module.
+        lazy (bool): If True, defer the import until the first call.
+
+    Returns:
+        Callable[..., object]: The callable or its lazy proxy.
+
+    """
+    if lazy:
+        return LazyCallable(module, attribute)
+    return _import_callable(module, attribute)
+
+
+def _debugger_hook(module: str, attribute: str, *, lazy: bool) -> Callable[..., object]:
+    """Return the breakpoint hook `module.attribute`, or the lazy `breakpointhook`.
+
+    A `LazyCallable` would not do: the debugger would stop in the proxy rather than
+    in the caller of `breakpoint()`.
+
+    Args:
+        module (str): Dotted name of the debugger module.
+        attribute (str): Name of its breakpoint hook.
+        lazy (bool): If True, defer the import until the first breakpoint.
+
+    Returns:
+        Callable[..., object]: The hook.
+
+    """
+    if lazy:
+        return breakpointhook
+    return _import_callable(module, attribute)
+
+
+def _is_available(module: str) -> bool:
+    """Check whether a module can be imported without importing it.
+
+    Returns:
+        bool: True if the module is importable.
+
+    """
+    try:
+        return find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _warn_not_installed(name: str) -> None:
+    """Print a warning about a missing debugger."""
+    from rich import print as rich_print
+
+    rich_print(_NOT_INSTALLED.format(name=name))
+
+
+def use_pdb(config: PdbConfig, *, lazy: bool = False) -> None:
     """Set PDB as the default debugger.
 
     Configures `sys.breakpointhook` to use `pdb.set_trace` and sets the
@@ -47,15 +180,14 @@ def use_pdb(config: PdbConfig) -> None:
 
     Args:
         config (PdbConfig): Configuration for PDB.
+        lazy (bool): If True, import `pdb` only when the first breakpoint is hit.
 
     """
-    import pdb
-
     os.environ[BREAKPOINT_ENV_VAR] = config.set_trace_hook
-    sys.breakpointhook = cast(Any, pdb.set_trace)  # pyright: ignore[reportExplicitAny]
+    sys.breakpointhook = _debugger_hook("pdb", "set_trace", lazy=lazy)
 
 
-def use_pudb(config: PudbConfig) -> None:
+def use_pudb(config: PudbConfig, *, lazy: bool = False) -> None:
     """Set PuDB as the default debugger.
 
     Configures `sys.breakpointhook` to use `pudb.set_trace` and sets the
@@ -63,19 +195,18 @@ def use_pudb(config: PudbConfig) -> None:
 
     Args:
         config (PudbConfig): Configuration for PuDB.
+        lazy (bool): If True, import `pudb` only when the first breakpoint is hit.
 
     """
-    try:
-        import pudb  # pyright: ignore[reportMissingTypeStubs]
-    except ImportError:
-        rich_print(_NOT_INSTALLED.format(name="PuDB"))
+    if not _is_available("pudb"):
+        _warn_not_installed("PuDB")
         return
 
     os.environ[BREAKPOINT_ENV_VAR] = config.set_trace_hook
-    sys.breakpointhook = cast(Any, pudb.set_trace)  # pyright: ignore[reportExplicitAny]
+    sys.breakpointhook = _debugger_hook("pudb", "set_trace", lazy=lazy)
 
 
-def use_ipdb(config: IpdbConfig) -> None:
+def use_ipdb(config: IpdbConfig, *, lazy: bool = False) -> None:
     """Set IPDB as the default debugger.
 
     Configures `sys.breakpointhook` to use `ipdb.set_trace`, sets the
@@ -83,25 +214,27 @@ def use_ipdb(config: IpdbConfig) -> None:
 
     Args:
         config (IpdbConfig): Configuration for IPDB.
+        lazy (bool): If True, import `ipdb` (and IPython) only when the first
+                     breakpoint is hit.
 
     """
-    try:
-        import ipdb  # pyright: ignore[reportMissingTypeStubs]
-    except ImportError:
-        rich_print(_NOT_INSTALLED.format(name="IPDB"))
+    if not _is_available("ipdb"):
+        _warn_not_installed("IPDB")
         return
 
     os.environ[BREAKPOINT_ENV_VAR] = config.set_trace_hook
     os.environ[IPDB_CONTEXT_SIZE] = str(config.context_lines)
-    sys.breakpointhook = cast(Any, ipdb.set_trace)  # pyright: ignore[reportExplicitAny]
+    sys.breakpointhook = _debugger_hook("ipdb", "set_trace", lazy=lazy)
 
 
 def use_debugpy(config: DebugpyConfig) -> None:
     """Set Debugpy as the default debugger.
 
     Configures `sys.breakpointhook` to use `debugpy.breakpoint`, sets the
-    `PYTHONBREAKPOINT` environment variable, and starts a debugpy server
-    waiting for a client connection.
+    `PYTHONBREAKPOINT` environment variable, and starts a debugpy server, waiting
+    for a client connection if `wait_for_client` is set. With `listen_on_signal`,
+    the server is started only when the process receives SIGUSR1, see
+    `listen_on_signal`.
 
     Args:
         config (DebugpyConfig): Configuration for debugpy.
@@ -110,12 +243,28 @@ def use_debugpy(config: DebugpyConfig) -> None:
     try:
         import debugpy
     except ImportError:
-        rich_print(_NOT_INSTALLED.format(name="Debugpy"))
+        _warn_not_installed("Debugpy")
         return
 
     os.environ[BREAKPOINT_ENV_VAR] = config.set_trace_hook
     sys.breakpointhook = debugpy.breakpoint
 
+    if config.listen_on_signal:
+        listen_on_signal(config)
+    else:
+        _listen(config)
+
+
+def _listen(config: DebugpyConfig) -> None:
+    """Start the debugpy server and print how to attach to it.
+
+    Args:
+        config (DebugpyConfig): Configuration for debugpy.
+
+    """
+    import debugpy
+    from rich import print as rich_print
+
     launch_config = {
         "name": "debug-dojo",
         "type": "debugpy",
@@ -130,49 +279,149 @@ def use_debugpy(config: DebugpyConfig) -> None:
     rich_print(json.dumps(launch_config, indent=4))
 
     _ = debugpy.listen((config.host, config.port))
-    debugpy.wait_for_client()
+    if config.wait_for_client:
+        debugpy.wait_for_client()
 
 
-def rich_traceback(*, locals_in_traceback: bool) -> None:
-    """Install Rich Traceback for enhanced error reporting.
+def listen_on_signal(config: DebugpyConfig) -> None:
+    """Start the debugpy server when the process receives SIGUSR1.
+
+    Until then, debugpy is neither listening nor tracing, so the process runs at
+    full speed and `breakpoint()` does nothing; debugpy only starts tracing once
+    the server is up. The process never waits for the client, and further signals
+    are ignored. Must be called from the main thread. Where SIGUSR1 does not exist,
+    e.g. on Windows, the server is started right away instead.
 
     Args:
-        locals_in_traceback (bool): Whether to include local variables in the traceback.
+        config (DebugpyConfig): Configuration for debugpy.
 
     """
-    from rich import traceback
+    from rich import print as rich_print
+
+    config = replace(config, wait_for_client=False)
+    listen_signal = getattr(signal, LISTEN_SIGNAL, None)
+    if not isinstance(listen_signal, signal.Signals):
+        rich_print(f"[yellow]No {LISTEN_SIGNAL} here, starting debugpy now.[/yellow]")
+        _listen(config)
+        return
+
+    def start_listening(_signum: int, _frame: FrameType | None) -> None:
+        _ = signal.signal(listen_signal, signal.SIG_IGN)
+        _listen(config)
 
-    _ = traceback.install(show_locals=locals_in_traceback)
+    _ = signal.signal(listen_signal, start_listening)
+    command = f"kill -{listen_signal.name.removeprefix('SIG')} {os.getpid()}"
+    rich_print(f"[blue]Run `{command}` to start debugpy on port {config.port}.[/blue]")
+
+
+def rich_traceback(exceptions: ExceptionsConfig, *, lazy: bool = False) -> None:
+    """Install Rich Traceback for enhanced error reporting.
 
+    The traceback shows the locals of each frame if `locals_in_traceback` is set, and
+    represents them within the frame, local, repr length and container item limits of
+    the configuration, so large values in scope do not slow down the report.
+
+    Args:
+        exceptions (ExceptionsConfig): Configuration object for exception handling.
+        lazy (bool): If True, install a small `sys.excepthook` that imports
+                     `rich.traceback` only when the first exception is reported.
+
+    """
+    if not lazy:
+        from debug_dojo._traceback import TracebackLimits, install
+
+        install(
+            show_locals=exceptions.locals_in_traceback,
+            limits=TracebackLimits(
+                max_frames=exceptions.max_frames,
+                max_locals=exceptions.max_locals,
+                max_repr_length=exceptions.max_repr_length,
+                max_items=exceptions.max_container_items,
+                skip_types=frozenset(exceptions.skip_types),
+            ),
+        )
+        return
 
-def install_inspect(mnemonic: str = "i") -> None:
+    def excepthook(
+        exc_type: type[BaseException],
+        exc_value: BaseException,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Install Rich Traceback and let it report the exception."""
+        rich_traceback(exceptions)
+        sys.excepthook(exc_type, exc_value, exc_traceback)
+
+    sys.excepthook = excepthook
+
+
+def install_inspect(  # noqa: PLR0913
+    mnemonic: str = "i",
+    *,
+    lazy: bool = False,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+    stream: bool = False,
+    max_members: int | None = None,
+) -> None:
     """Injects `rich.inspect` into builtins under the given mnemonic.
 
+    With `safe`, `attribute_timeout`, `stream` or `max_members`, the bounded
+    inspector is installed instead, which lists at most `max_members` members, does
+    not evaluate computed members or interrupts slow ones, and with `stream` prints
+    each member as soon as it is evaluated.
+
     Args:
         mnemonic (str): The name to use for the inspect function in builtins.
                         If an empty string, the feature is not installed.
+        lazy (bool): If True, import `rich` only on the first call.
+        safe (bool): If True, do not evaluate properties and other computed members.
+        attribute_timeout (float | None): Time budget in seconds for a single
+                                          attribute.
+        stream (bool): If True, print members one by one as they are evaluated.
+        max_members (int | None): Number of attributes and of methods listed, or
+                                  None to list all of them.
 
     """
     if not mnemonic:
         return
 
-    from rich import inspect
+    if safe or attribute_timeout or stream or max_members:
+        builtins.__dict__[mnemonic] = partial(
+            _hook("debug_dojo._inspect", "inspect_object", lazy=lazy),
+            safe=safe,
+            attribute_timeout=attribute_timeout,
+            max_members=max_members,
+            stream=stream,
+        )
+        return
+
+    inspect = _hook("rich", "inspect", lazy=lazy)
 
     def inspect_with_defaults(obj: object, **kwargs: bool) -> None:
         """Inspect an object using Rich's inspect function."""
         if not kwargs:
             kwargs = {"methods": True, "private": True}
-        return inspect(obj, console=None, title="", **kwargs)
+        _ = inspect(obj, console=None, title="", **kwargs)
 
     builtins.__dict__[mnemonic] = inspect_with_defaults
 
 
-def install_compare(mnemonic: str = "c") -> None:
+def install_compare(
+    mnemonic: str = "c",
+    *,
+    lazy: bool = False,
+    safe: bool = False,
+    attribute_timeout: float | None = None,
+) -> None:
     """Injects the side-by-side object comparison function into builtins.
 
     Args:
         mnemonic (str): The name to use for the compare function in builtins.
                         If an empty string, the feature is not installed.
+        lazy (bool): If True, import the comparer (and `rich`) only on the first call.
+        safe (bool): If True, do not evaluate properties and other computed members.
+        attribute_timeout (float | None): Time budget in seconds for a single
+                                          attribute.
 
     >>> install_compare()
     >>> import builtins
@@ -183,11 +432,18 @@ def install_compare(mnemonic: str = "c") -> None:
     if not mnemonic:
         return
 
-    builtins.__dict__[mnemonic] = inspect_objects_side_by_side
+    compare = _hook("debug_dojo._compare", "inspect_objects_side_by_side", lazy=lazy)
+    if safe or attribute_timeout:
+        compare = partial(compare, safe=safe, attribute_timeout=attribute_timeout)
+    builtins.__dict__[mnemonic] = compare
 
 
 def install_breakpoint(mnemonic: str = "b") -> None:
-    """Inject the`breakpoint()` function into builtins under the given mnemonic.
+    """Inject a conditional `breakpoint()` into builtins under the given mnemonic.
+
+    Besides stopping like `breakpoint()`, it accepts a condition and hit counts, e.g.
+    `b(x > 3)`, `b(every=10000)`, `b(after=5)` or `b(once=True)`, and can be turned
+    into a no-op with `b.disable()`.
 
     Args:
         mnemonic (str): The name to use for the breakpoint function in builtins.
@@ -202,15 +458,16 @@ def install_breakpoint(mnemonic: str = "b") -> None:
     if not mnemonic:
         return
 
-    builtins.__dict__[mnemonic] = breakpoint
+    builtins.__dict__[mnemonic] = Breakpoint()
 
 
-def install_rich_print(mnemonic: str = "p") -> None:
+def install_rich_print(mnemonic: str = "p", *, lazy: bool = False) -> None:
     """Injects `rich.print` into builtins under the given mnemonic.
 
     Args:
         mnemonic (str): The name to use for the print function in builtins.
                         If an empty string, the feature is not installed.
+        lazy (bool): If True, import `rich` only on the first call.
 
     >>> install_rich_print()
     >>> import builtins
@@ -223,66 +480,138 @@ def install_rich_print(mnemonic: str = "p") -> None:
     if not mnemonic:
         return
 
-    from rich import print as rich_print
-
-    builtins.__dict__[mnemonic] = rich_print
+    builtins.__dict__[mnemonic] = _hook("rich", "print", lazy=lazy)
 
 
-def install_features(features: FeaturesConfig) -> None:
+def install_features(features: FeaturesConfig, *, lazy: bool = False) -> None:
     """Installs debugging features based on the provided configuration.
 
     Args:
         features (FeaturesConfig): Configuration object specifying which features
                                    to install and their mnemonics.
+        lazy (bool): If True, install proxies that import their backends on first use.
 
     """
-    install_inspect(features.rich_inspect)
-    install_rich_print(features.rich_print)
-    install_compare(features.comparer)
+    safe = features.safe_inspect
+    attribute_timeout = features.attribute_timeout_ms / 1000 or None
+
+    install_inspect(
+        features.rich_inspect,
+        lazy=lazy,
+        safe=safe,
+        attribute_timeout=attribute_timeout,
+        stream=features.stream_inspect,
+        max_members=features.inspect_max_members or None,
+    )
+    install_rich_print(features.rich_print, lazy=lazy)
+    install_compare(
+        features.comparer,
+        lazy=lazy,
+        safe=safe,
+        attribute_timeout=attribute_timeout,
+    )
     install_breakpoint(features.breakpoint)
 
 
-def set_debugger(config: DebuggersConfig) -> None:
+def set_debugger(config: DebuggersConfig, *, lazy: bool = False) -> None:
     """Set the default debugger based on the provided configuration.
 
     Args:
         config (DebuggersConfig): Configuration object for debuggers.
+        lazy (bool): If True, import the debugger only when the first breakpoint is
+                     hit. Debugpy is always started eagerly, as it has to listen for
+                     a client from the start.
 
     """
     debugger = config.default
 
     if debugger == DebuggerType.PDB:
-        use_pdb(config.pdb)
+        use_pdb(config.pdb, lazy=lazy)
     if debugger == DebuggerType.PUDB:
-        use_pudb(config.pudb)
+        use_pudb(config.pudb, lazy=lazy)
     if debugger == DebuggerType.IPDB:
-        use_ipdb(config.ipdb)
+        use_ipdb(config.ipdb, lazy=lazy)
     if debugger == DebuggerType.DEBUGPY:
         use_debugpy(config.debugpy)
 
     sys.ps1 = config.prompt_name
 
 
-def set_exceptions(exceptions: ExceptionsConfig) -> None:
+def set_exceptions(exceptions: ExceptionsConfig, *, lazy: bool = False) -> None:
     """Configure exception handling based on the provided configuration.
 
     Args:
         exceptions (ExceptionsConfig): Configuration object for exception handling.
+        lazy (bool): If True, import `rich.traceback` only when an exception occurs.
 
     """
     if exceptions.rich_traceback:
-        rich_traceback(locals_in_traceback=exceptions.locals_in_traceback)
+        rich_traceback(exceptions, lazy=lazy)
+
+
+def _noop(*_args: object, **_kwargs: object) -> None:
+    """Do nothing, in place of a debugging tool that is disabled."""
+
+
+def install_noops(features: FeaturesConfig) -> None:
+    """Install no-op stubs for all debugging features and for `breakpoint()`.
+
+    Stray `b()`, `p()`, `i()` and `c()` calls then cost a single function call, and
+    neither `rich` nor any debugger is imported.
+
+    Args:
+        features (FeaturesConfig): Configuration object specifying the mnemonics of
+                                   the features.
+
+    >>> install_noops(FeaturesConfig())
+    >>> import builtins
+    >>> builtins.b() is None
+    True
+
+    """
+    for mnemonic in (
+        features.breakpoint,
+        features.comparer,
+        features.rich_inspect,
+        features.rich_print,
+    ):
+        if mnemonic:
+            builtins.__dict__[mnemonic] = _noop
+    sys.breakpointhook = _noop
+
+
+def tools_disabled(config: DebugDojoConfig) -> bool:
+    """Check whether the tools are installed as no-op stubs.
+
+    Returns:
+        bool: True in the disabled install mode, or with `PYTHONBREAKPOINT=0`.
+
+    """
+    return (
+        config.install_mode is InstallMode.DISABLED
+        or os.environ.get(BREAKPOINT_ENV_VAR) == "0"
+    )
 
 
 def install_by_config(config: DebugDojoConfig) -> None:
     """Installs all debugging tools and features based on the given configuration.
 
-    This is the main entry point for applying `debug-dojo` settings.
+    This is the main entry point for applying `debug-dojo` settings. In the default
+    lazy install mode only small proxies are installed, so neither `rich` nor the
+    debugger is imported before the first `b()`, `p()`, `i()` or `c()` call. In the
+    disabled install mode, or when breakpoints are disabled with `PYTHONBREAKPOINT=0`,
+    only no-op stubs are installed.
 
     Args:
         config (DebugDojoConfig): The complete debug-dojo configuration object.
 
     """
-    set_debugger(config.debuggers)
-    set_exceptions(config.exceptions)
-    install_features(config.features)
+    if tools_disabled(config):
+        install_noops(config.features)
+        return
+
+    lazy = config.install_mode is InstallMode.LAZY
+
+    set_debugger(config.debuggers, lazy=lazy)
+    set_exceptions(config.exceptions, lazy=lazy)
+    install_features(config.features, lazy=lazy)
@@ -0,0 +1,244 @@
+"""Memory allocation tracking for `dojo run --trace-malloc`.
+
+`tracemalloc` records where each block of memory still alive was allocated. The tracker
+takes a snapshot when the target starts, at every `b()` breakpoint hit and when the
+target exits or fails, and reports the top allocation sites of each snapshot along with
+the sites that grew the most since the previous one, which is where a leak shows up.
+
+Allocations made by `tracemalloc` itself, by import machinery, by `rich` and by
+debug-dojo are left out of the snapshots, so reporting does not show up as growth.
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING, final
+
+import rich
+from rich.console import Console
+from rich.table import Table
+
+from debug_dojo._breakpoint import on_hit
+
+if TYPE_CHECKING:
+    from types import FrameType, TracebackType
+
+TRACEBACK_FRAMES = 1
+"""Default number of frames stored per allocation."""
+TOP_SITES = 10
+"""Default number of allocation sites shown per report."""
+
+_FILTERS = (
+    tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<frozen importlib.*>"),
+    tracemalloc.Filter(inclusive=False, filename_pattern="<unknown>"),
+    tracemalloc.Filter(
+        inclusive=False,
+        filename_pattern=str(Path(rich.__file__).parent / "*"),
+        all_frames=True,
+    ),
+    tracemalloc.Filter(
+        inclusive=False, filename_pattern=str(Path(__file__).parent / "*")
+    ),
+)
+"""Allocations left out of the snapshots: the tracker's own, rich's and imports'."""
+
+
+def format_size(size: float) -> str:
+    """Format a number of bytes with a binary unit.
+
+    >>> format_size(512)
+    '512 B'
+    >>> format_size(-3 * 1024 * 1024)
+    '-3.0 MiB'
+
+    Returns:
+        str: The size, e.g. `1.5 KiB`.
+
+    """
+    if abs(size) < 1024:  # noqa: PLR2004
+        return f"{size:.0f} B"
+    for unit in ("KiB", "MiB"):
+        size /= 1024
+        if abs(size) < 1024:  # noqa: PLR2004
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} GiB"
+
+
+def _location(traceback: tracemalloc.Traceback) -> str:
+    """Format an allocation traceback, most recent frame first.
+
+    Returns:
+        str: The `file:line` of each frame, joined by arrows.
+
+    """
+    return " ← ".join(
+        f"{Path(frame.filename).name}:{frame.lineno}" for frame in reversed(traceback)
+    )
+
+
+@final
+class MemoryTracker:
+    """Track memory allocations with `tracemalloc` and report them with rich.
+
+    Use it as a context manager around the code to track: snapshots are taken on
+    entering, at every `b()` hit and on exiting the context.
+    """
+
+    def __init__(
+        self,
+        *,
+        frames: int = TRACEBACK_FRAMES,
+        top: int = TOP_SITES,
+        console: Console | None = None,
+    ) -> None:
+        """Create a stopped tracker.
+
+        Args:
+            frames (int): Number of frames stored per allocation. With more than one,
+                          allocation sites are told apart by their full traceback.
+            top (int): Number of allocation sites shown per report.
+            console (Console | None): The console to report to, a new one by default.
+
+        """
+        self.frames: int = frames
+        self.top: int = top
+        self.console: Console = console or Console()
+        self._previous: tuple[str, tracemalloc.Snapshot] | None = None
+        self._hooks: ExitStack = ExitStack()
+
+    @property
+    def _key_type(self) -> str:
+        """The `tracemalloc` grouping of allocations into sites."""
+        return "traceback" if self.frames > 1 else "lineno"
+
+    def start(self) -> None:
+        """Start tracing allocations and take the first snapshot."""
+        tracemalloc.start(self.frames)
+        self._hooks.enter_context(on_hit(self._on_hit))
+        _ = self.snapshot("start")
+
+    def stop(self, label: str = "exit") -> None:
+        """Take the last snapshot and stop tracing allocations.
+
+        Args:
+            label (str): The name of the last snapshot.
+
+        """
+        self._hooks.close()
+        _ = self.snapshot(label)
+        tracemalloc.stop()
+
+    def __enter__(self) -> MemoryTracker:
+        """Start tracking.
+
+        Returns:
+            MemoryTracker: The started tracker.
+
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop tracking, naming the last snapshot after the exception if any."""
+        self.stop("exit" if exc_type is None else f"exit ({exc_type.__name__})")
+
+    def _on_hit(self, frame: FrameType) -> None:
+        """Take a snapshot at a breakpoint hit."""
+        name = Path(frame.f_code.co_filename).name
+        _ = self.snapshot(f"b() at {name}:{frame.f_lineno}")
+
+    def snapshot(self, label: str) -> tracemalloc.Snapshot:
+        """Take a snapshot and report it, with the growth since the previous one.
+
+        Only the latest snapshot is kept, so a breakpoint hit in a loop does not make
+        the tracker itself grow.
+
+        Args:
+            label (str): The name of the snapshot in the report.
+
+        Returns:
+            tracemalloc.Snapshot: The snapshot, without the tracker's own allocations.
+
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+        self.console.print(self.sites_table(label, snapshot))
+        if self._previous is not None:
+            previous_label, previous = self._previous
+            self.console.print(self.growth_table(previous_label, previous, snapshot))
+        self._previous = (label, snapshot)
+        return snapshot
+
+    def sites_table(self, label: str, snapshot: tracemalloc.Snapshot) -> Table:
+        """Tabulate the allocation sites holding the most memory.
+
+        Args:
+            label (str): The name of the snapshot.
+            snapshot (tracemalloc.Snapshot): The snapshot to report.
+
+        Returns:
+            Table: The top allocation sites with their size and number of blocks.
+
+        """
+        statistics = snapshot.statistics(self._key_type)
+        total = sum(statistic.size for statistic in statistics)
+        table = Table(
+            title=f"Memory at {label}: {format_size(total)}", title_style="bold"
+        )
+        table.add_column("Size", justify="right")
+        table.add_column("Blocks", justify="right")
+        table.add_column("Allocated at", style="cyan")
+        for statistic in statistics[: self.top]:
+            table.add_row(
+                format_size(statistic.size),
+                f"{statistic.count}",
+                _location(statistic.traceback),
+            )
+        return table
+
+    def growth_table(
+        self,
+        previous_label: str,
+        previous: tracemalloc.Snapshot,
+        snapshot: tracemalloc.Snapshot,
+    ) -> Table:
+        """Tabulate the allocation sites that grew the most between two snapshots.
+
+        Args:
+            previous_label (str): The name of the earlier snapshot.
+            previous (tracemalloc.Snapshot): The earlier snapshot.
+            snapshot (tracemalloc.Snapshot): The later snapshot.
+
+        Returns:
+            Table: The sites whose memory changed the most, largest growth first.
+
+        """
+        differences = snapshot.compare_to(previous, self._key_type)
+        growth = sum(difference.size_diff for difference in differences)
+        table = Table(
+            title=f"Growth since {previous_label}: {format_size(growth)}",
+            title_style="bold",
+        )
+        table.add_column("Growth", justify="right", style="yellow")
+        table.add_column("Size", justify="right")
+        table.add_column("Blocks", justify="right")
+        table.add_column("Allocated at", style="cyan")
+        changed = [difference for difference in differences if difference.size_diff]
+        changed.sort(key=lambda difference: -difference.size_diff)
+        for difference in changed[: self.top]:
+            table.add_row(
+                f"+{format_size(difference.size_diff)}"
+                if difference.size_diff > 0
+                else format_size(difference.size_diff),
+                format_size(difference.size),
+                f"{difference.count_diff:+}",
+                _location(difference.traceback),
+            )
+        return table
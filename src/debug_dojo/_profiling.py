@@ -0,0 +1,368 @@
+"""Sampling profiler for `dojo run --profile`.
+
+A background thread samples the call stack of the profiled thread at a fixed interval
+with `sys._current_frames`, so the target runs without any `sys.settrace` or
+`sys.setprofile` hook and its overhead does not grow with the number of calls. As the
+sampling thread needs the GIL, CPU-bound code is sampled at most once per
+`sys.getswitchinterval()` (5 ms by default). Each
+stack is stored as a tuple of code objects with a sample count, which keeps the
+aggregate small however long the target runs.
+
+At exit, the samples are either summarized as a call tree, where each node shows the
+share of samples spent in it and its callees, or written as collapsed stacks
+(`outer;inner;leaf count` per line), the input format of flame graph tools.
+
+For exact call counts, `dojo run --cprofile` runs the target under `cProfile` instead,
+dumps the statistics as a `.pstats` file and shows the top functions by cumulative or
+self time, optionally only those of modules under a given prefix.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import runpy
+import sys
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from functools import cache
+from pathlib import Path
+from types import CodeType
+from typing import TYPE_CHECKING, final
+
+from rich.table import Table
+from rich.tree import Tree
+
+if TYPE_CHECKING:
+    from _lsprof import profiler_entry
+    from collections.abc import Iterator
+    from cProfile import Profile
+    from types import FrameType, TracebackType
+
+SAMPLE_INTERVAL = 0.005
+"""Default time between two samples, in seconds."""
+MIN_FRACTION = 0.01
+"""Default share of samples below which a call is left out of the summary."""
+TOP_FUNCTIONS = 25
+"""Default number of functions in the call statistics table."""
+PSTATS_FILE = Path("dojo.pstats")
+"""Default file the call statistics are dumped to."""
+
+_Stack = tuple["CodeType", ...]
+"""A sampled call stack, from the outermost call to the leaf."""
+
+
+def _label(code: CodeType) -> str:
+    """Name a sampled function for display.
+
+    Returns:
+        str: The function name with its file and first line.
+
+    """
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+@final
+class _Node:
+    """A call in the summary tree, with the samples spent in it and its callees."""
+
+    __slots__ = ("children", "samples")
+
+    def __init__(self) -> None:
+        self.samples: int = 0
+        self.children: dict[CodeType, _Node] = {}
+
+
+@final
+class SamplingProfiler:
+    """Statistical profiler sampling the stack of one thread from another thread.
+
+    Use it as a context manager around the code to profile; only the frames below the
+    one entering the context are recorded.
+
+    >>> with SamplingProfiler(interval=0.001) as profiler:
+    ...     _ = sum(range(10))
+    >>> profiler.total >= 0
+    True
+
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL) -> None:
+        """Create a stopped profiler.
+
+        Args:
+            interval (float): Time between two samples, in seconds.
+
+        """
+        self.interval: float = interval
+        self.samples: dict[_Stack, int] = {}
+        self._stopped: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._target_id: int = 0
+        self._root: FrameType | None = None
+
+    @property
+    def total(self) -> int:
+        """The number of samples taken in the profiled code."""
+        return sum(count for _stack, count in self._stacks())
+
+    def start(self) -> None:
+        """Start sampling the calling thread below the calling frame."""
+        self._start(sys._getframe(1))  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+    def _start(self, root: FrameType) -> None:
+        """Start sampling the current thread below the given frame."""
+        self._target_id = threading.get_ident()
+        self._root = root
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="debug-dojo-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampling thread to finish."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._root = None
+
+    def __enter__(self) -> SamplingProfiler:
+        """Start sampling the thread and frame entering the context.
+
+        Returns:
+            SamplingProfiler: The started profiler.
+
+        """
+        self._start(sys._getframe(1))  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop sampling."""
+        self.stop()
+
+    def _run(self) -> None:
+        """Take a sample every interval until stopped."""
+        samples = self.samples
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._target_id)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+            root = self._root
+            stack: list[CodeType] = []
+            while frame is not None and frame is not root:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                key = tuple(reversed(stack))
+                samples[key] = samples.get(key, 0) + 1
+
+    def _stacks(self) -> Iterator[tuple[_Stack, int]]:
+        """Yield the sampled stacks without the frames of `runpy` and the profiler.
+
+        Samples taken while the profiler itself runs, e.g. when stopping, are dropped.
+
+        Yields:
+            tuple[_Stack, int]: A stack and its number of samples.
+
+        """
+        for stack, count in self.samples.items():
+            trimmed: list[CodeType] = []
+            for code in stack:
+                if code.co_filename == __file__:
+                    break
+                if code.co_filename != runpy.__file__:
+                    trimmed.append(code)
+            else:
+                if trimmed:
+                    yield tuple(trimmed), count
+
+    def collapsed_stacks(self) -> list[str]:
+        """Format the samples as collapsed stacks.
+
+        Returns:
+            list[str]: One `outer;inner;leaf count` line per distinct stack.
+
+        """
+        counts: dict[str, int] = {}
+        for stack, count in self._stacks():
+            line = ";".join(map(_label, stack))
+            counts[line] = counts.get(line, 0) + count
+        return [f"{line} {count}" for line, count in sorted(counts.items())]
+
+    def write_collapsed(self, path: Path) -> None:
+        """Write the samples to a file as collapsed stacks.
+
+        Args:
+            path (Path): The file to write.
+
+        """
+        lines = "".join(f"{line}\n" for line in self.collapsed_stacks())
+        _ = path.write_text(lines, encoding="utf-8")
+
+    def summary(self, min_fraction: float = MIN_FRACTION) -> Tree:
+        """Summarize the samples as a call tree.
+
+        Args:
+            min_fraction (float): Share of samples below which a call is not shown.
+
+        Returns:
+            Tree: The call tree, with the share of samples spent in each call.
+
+        """
+        root = _Node()
+        for stack, count in self._stacks():
+            root.samples += count
+            node = root
+            for code in stack:
+                node = node.children.setdefault(code, _Node())
+                node.samples += count
+
+        interval_ms = self.interval * 1000
+        tree = Tree(
+            f"[bold]{root.samples} samples every {interval_ms:g} ms[/bold]",
+            guide_style="dim",
+        )
+        if root.samples:
+            _add_children(tree, root, root.samples * min_fraction, root.samples)
+        return tree
+
+
+def _add_children(tree: Tree, node: _Node, threshold: float, total: int) -> None:
+    """Add the callees of a node to the summary tree, most sampled first.
+
+    Args:
+        tree (Tree): The tree branch of the node.
+        node (_Node): The node whose callees are added.
+        threshold (float): Number of samples below which a callee is not shown.
+        total (int): The total number of samples.
+
+    """
+    children = sorted(node.children.items(), key=lambda item: -item[1].samples)
+    for code, child in children:
+        if child.samples < threshold:
+            continue
+        share = child.samples / total
+        branch = tree.add(f"[yellow]{share:6.1%}[/yellow] {_label(code)}")
+        _add_children(branch, child, threshold, total)
+
+
+class CallSort(Enum):
+    """Order of the functions in the call statistics table."""
+
+    CUMULATIVE = "cumulative"
+    SELF = "self"
+    CALLS = "calls"
+
+
+@dataclass(frozen=True)
+class CallProfileOptions:
+    """Options for profiling a target with `cProfile`."""
+
+    output: Path = PSTATS_FILE
+    """The `.pstats` file the statistics are dumped to."""
+    sort: CallSort = CallSort.CUMULATIVE
+    """The order of the functions in the table."""
+    prefix: str | None = None
+    """Only show functions of modules starting with this prefix."""
+    limit: int = TOP_FUNCTIONS
+    """The number of functions in the table."""
+
+
+@cache
+def _module_name(filename: str) -> str:
+    """Derive the dotted module name of a source file from `sys.path`.
+
+    Returns:
+        str: The module name, or the file's stem if it is not under `sys.path`.
+
+    """
+    path = Path(filename).resolve()
+    roots = [Path(entry or os.curdir).resolve() for entry in sys.path]
+    root = max(
+        (root for root in roots if path.is_relative_to(root)),
+        key=lambda root: len(root.parts),
+        default=None,
+    )
+    relative = path.relative_to(root) if root else Path(path.name)
+    names = [part for part in relative.with_suffix("").parts if part != "__init__"]
+    return ".".join(names)
+
+
+def _entry_module(entry: profiler_entry) -> str:
+    """Get the module of a profiled function; built-in functions are in `builtins`.
+
+    Returns:
+        str: The dotted module name.
+
+    """
+    code = entry.code
+    return _module_name(code.co_filename) if isinstance(code, CodeType) else "builtins"
+
+
+def _entry_label(entry: profiler_entry) -> str:
+    """Name a profiled function for display.
+
+    Returns:
+        str: The function name with its file and first line.
+
+    """
+    code = entry.code
+    return _label(code) if isinstance(code, CodeType) else code
+
+
+def call_stats_table(
+    profile: Profile,
+    *,
+    sort: CallSort = CallSort.CUMULATIVE,
+    prefix: str | None = None,
+    limit: int = TOP_FUNCTIONS,
+) -> Table:
+    """Tabulate the functions that took the most time in a `cProfile` run.
+
+    Args:
+        profile (Profile): The profile to summarize.
+        sort (CallSort): The order of the functions.
+        prefix (str | None): Only show functions of modules starting with this
+                             prefix, e.g. `my_package.io`.
+        limit (int): The number of functions shown.
+
+    Returns:
+        Table: The top functions, with their call counts, self and cumulative time.
+
+    """
+    entries = profile.getstats()
+    if prefix:
+        entries = [e for e in entries if _entry_module(e).startswith(prefix)]
+    if sort is CallSort.CALLS:
+        top = heapq.nlargest(limit, entries, key=lambda entry: entry.callcount)
+    elif sort is CallSort.SELF:
+        top = heapq.nlargest(limit, entries, key=lambda entry: entry.inlinetime)
+    else:
+        top = heapq.nlargest(limit, entries, key=lambda entry: entry.totaltime)
+
+    table = Table(
+        title=f"Top {len(top)} of {len(entries)} functions by {sort.value}"
+        + ("" if sort is CallSort.CALLS else " time"),
+        title_style="bold",
+    )
+    table.add_column("Calls", justify="right")
+    table.add_column("Self (s)", justify="right")
+    table.add_column("Cumulative (s)", justify="right")
+    table.add_column("Function", style="cyan")
+    for entry in top:
+        calls = f"{entry.callcount}"
+        if entry.reccallcount:
+            calls = f"{calls}/{entry.callcount - entry.reccallcount}"
+        table.add_row(
+            calls,
+            f"{entry.inlinetime:.4f}",
+            f"{entry.totaltime:.4f}",
+            _entry_label(entry),
+        )
+    return table
@@ -0,0 +1,443 @@
+"""Warm server for `dojo run --warm`.
+
+Every `dojo run` starts a fresh interpreter and imports typer, rich, the debugger and
+the configuration before the target even starts. `dojo serve` pays that cost once: it
+imports everything up front and listens on a Unix socket. `dojo run --warm` sends its
+arguments, working directory, environment and standard streams to the server, which
+forks a child from its warm image to run them, so each run starts in milliseconds.
+
+The child reads and writes the client's own terminal, joins the client's process
+group when it can (so Ctrl-C and job control reach it), and reports its exit status
+back to the client. The server and the client have to run as the same user; the
+socket is created with owner-only permissions.
+
+The server is single-threaded, so a child is never forked while another thread holds
+a lock: it waits on the socket and on `SIGCHLD` at once, and reports the exit status
+of finished children between requests. Each child discovers and loads the
+configuration of its own working directory afresh.
+
+Forking and passing file descriptors over sockets are POSIX features, so on other
+platforms `dojo run --warm` runs in-process as usual.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import select
+import signal
+import socket
+import struct
+import sys
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from debug_dojo._cache import cache_dir
+from debug_dojo._config import forget_discoveries
+from debug_dojo._config_models import DebuggerType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from debug_dojo._config_models import DebugDojoConfig
+
+SOCKET_ENV_VAR = "DEBUG_DOJO_SOCKET"
+"""Environment variable overriding the socket of the server."""
+SOCKET_FILE = "dojo.sock"
+"""Name of the default socket, in the debug-dojo cache directory."""
+
+WARM_MODULES = (
+    "rich.console",
+    "rich.pretty",
+    "rich.traceback",
+    "debug_dojo._compare",
+    "debug_dojo._inspect",
+    "debug_dojo._traceback",
+)
+"""Modules imported by the server, on top of those of the CLI."""
+
+_DEBUGGER_MODULES = {
+    DebuggerType.IPDB: "ipdb",
+    DebuggerType.PDB: "pdb",
+    DebuggerType.PUDB: "pudb",
+}
+_HEADER = struct.Struct("!I")
+_STREAMS = 3
+
+
+@dataclass(frozen=True)
+class _Request:
+    """A `dojo run --warm` invocation, as sent to the server."""
+
+    argv: list[str]
+    cwd: str
+    env: dict[str, str]
+    pgid: int
+
+
+def default_socket_path() -> Path:
+    """Return the socket the server listens on by default.
+
+    Returns:
+        Path: `DEBUG_DOJO_SOCKET` if set, else `dojo.sock` in the debug-dojo cache
+              directory.
+
+    """
+    if env_path := os.environ.get(SOCKET_ENV_VAR):
+        return Path(env_path)
+    return cache_dir() / SOCKET_FILE
+
+
+def is_supported() -> bool:
+    """Check whether the platform can fork and pass file descriptors over sockets.
+
+    Returns:
+        bool: True on POSIX systems with Unix sockets.
+
+    """
+    return hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+
+def warm_up(config: DebugDojoConfig) -> list[str]:
+    """Import the modules that every run would import, and the configured debugger.
+
+    Debugpy is not imported, as its server is started per run.
+
+    Args:
+        config (DebugDojoConfig): The configuration whose debugger to import.
+
+    Returns:
+        list[str]: The modules that could not be imported.
+
+    """
+    modules: list[str] = list(WARM_MODULES)
+    if debugger := _DEBUGGER_MODULES.get(config.debuggers.default):
+        modules.append(debugger)
+    return [module for module in modules if not _imported(module)]
+
+
+def _imported(module: str) -> bool:
+    """Import a module, reporting whether it is available.
+
+    Returns:
+        bool: True if the module could be imported.
+
+    """
+    try:
+        _ = import_module(module)
+    except ImportError:
+        return False
+    return True
+
+
+def _read_exactly(connection: socket.socket, size: int) -> bytes:
+    """Read a number of bytes from a connection.
+
+    Returns:
+        bytes: The bytes read.
+
+    Raises:
+        ConnectionError: If the connection is closed early.
+
+    """
+    chunks: list[bytes] = []
+    while size:
+        chunk = connection.recv(size)
+        if not chunk:
+            msg = "Connection closed before the request was complete."
+            raise ConnectionError(msg)
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _receive_request(connection: socket.socket) -> tuple[_Request, list[int]]:
+    """Receive a run request and the client's standard streams.
+
+    Returns:
+        tuple[_Request, list[int]]: The request and the stream descriptors.
+
+    Raises:
+        ConnectionError: If the request or its streams are incomplete or malformed.
+
+    """
+    from dacite import DaciteError, from_dict  # noqa: PLC0415
+
+    received = socket.recv_fds(connection, _HEADER.size, _STREAMS)
+    header, fds = received[0], received[1]
+    msg = "Malformed request."
+    if len(header) != _HEADER.size or len(fds) != _STREAMS:
+        _close_all(fds)
+        raise ConnectionError(msg)
+    size = int(_HEADER.unpack(header)[0])  # pyright: ignore[reportAny]
+    try:
+        data = json.loads(_read_exactly(connection, size))  # pyright: ignore[reportAny]
+        request = from_dict(_Request, data)  # pyright: ignore[reportAny]
+    except (DaciteError, ValueError) as e:
+        _close_all(fds)
+        raise ConnectionError(msg) from e
+    except ConnectionError:
+        _close_all(fds)
+        raise
+    return request, fds
+
+
+def _close_all(fds: list[int]) -> None:
+    """Close file descriptors."""
+    for fd in fds:
+        os.close(fd)
+
+
+def _send(connection: socket.socket, message: dict[str, int]) -> None:
+    """Send a status line to the client, ignoring a client that went away."""
+    with contextlib.suppress(OSError):
+        connection.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _run_child(
+    request: _Request, fds: list[int], run: Callable[[list[str]], int]
+) -> int:
+    """Take over the client's streams, directory and environment, then run.
+
+    Returns:
+        int: The exit code of the run.
+
+    """
+    with contextlib.suppress(OSError):
+        os.setpgid(0, request.pgid)
+    _ = signal.set_wakeup_fd(-1)
+    _ = signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    for target, fd in enumerate(fds):
+        _ = os.dup2(fd, target)
+        os.close(fd)
+    os.chdir(request.cwd)
+    os.environ.clear()
+    os.environ.update(request.env)
+    _ = signal.signal(signal.SIGINT, signal.default_int_handler)
+    _ = signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    if "rich" in sys.modules:
+        import rich  # noqa: PLC0415
+
+        # The console was set up for the server's streams.
+        rich.reconfigure()
+
+    # The server's discoveries are stale for a dojo.toml added or removed since.
+    forget_discoveries()
+    sys.argv = ["dojo", "run", *request.argv]
+    return run(request.argv)
+
+
+def _fork_run(
+    connection: socket.socket,
+    run: Callable[[list[str]], int],
+    inherited: list[socket.socket],
+) -> int | None:
+    """Fork a child running one request.
+
+    Args:
+        connection (socket.socket): The connection of the client.
+        run (Callable[[list[str]], int]): Runs `dojo run` arguments, returns the
+                                          exit code.
+        inherited (list[socket.socket]): Sockets of the server, closed in the child.
+
+    Returns:
+        int | None: The pid of the child, or None for a malformed request.
+
+    """
+    try:
+        request, fds = _receive_request(connection)
+    except OSError:
+        connection.close()
+        return None
+
+    _ = sys.stdout.flush()
+    _ = sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:  # The child.
+        code = 1
+        try:
+            for sock in (*inherited, connection):
+                sock.close()
+            code = _run_child(request, fds, run)
+        finally:
+            with contextlib.suppress(Exception):
+                _ = sys.stdout.flush()
+                _ = sys.stderr.flush()
+            os._exit(code)
+
+    _close_all(fds)
+    # Also set by the child; doing it here first tells the client reliably.
+    with contextlib.suppress(OSError):
+        os.setpgid(pid, request.pgid)
+    _send(connection, {"pid": pid})
+    return pid
+
+
+def _report_exits(children: dict[int, socket.socket]) -> None:
+    """Send the exit status of every finished child to its client."""
+    while children:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if not pid:
+            return
+        if connection := children.pop(pid, None):
+            _send(connection, {"exit": os.waitstatus_to_exitcode(status)})
+            connection.close()
+
+
+def _serve(server: socket.socket, run: Callable[[list[str]], int]) -> None:
+    """Fork a child per request, and report exits, until interrupted.
+
+    Args:
+        server (socket.socket): The listening socket.
+        run (Callable[[list[str]], int]): Runs `dojo run` arguments in a forked
+                                          child and returns the exit code.
+
+    """
+    children: dict[int, socket.socket] = {}
+    wakeup, wakeup_writer = socket.socketpair()
+    wakeup.setblocking(False)  # noqa: FBT003
+    wakeup_writer.setblocking(False)  # noqa: FBT003
+    previous_wakeup = signal.set_wakeup_fd(wakeup_writer.fileno())
+    previous_handler = signal.signal(signal.SIGCHLD, lambda _signum, _frame: None)
+    try:
+        while True:
+            readable = select.select([server, wakeup], [], [])[0]
+            if wakeup in readable:
+                with contextlib.suppress(BlockingIOError):
+                    while wakeup.recv(512):
+                        pass
+                _report_exits(children)
+            if server in readable:
+                connection = server.accept()[0]
+                inherited = [server, wakeup, wakeup_writer, *children.values()]
+                if pid := _fork_run(connection, run, inherited):
+                    children[pid] = connection
+    finally:
+        _ = signal.signal(signal.SIGCHLD, previous_handler)
+        _ = signal.set_wakeup_fd(previous_wakeup)
+        wakeup.close()
+        wakeup_writer.close()
+        for connection in children.values():
+            connection.close()
+
+
+def serve_forever(
+    path: Path,
+    run: Callable[[list[str]], int],
+    *,
+    ready: Callable[[], object] | None = None,
+) -> None:
+    """Serve `dojo run --warm` requests until interrupted.
+
+    A stale socket left by a server that is gone is replaced. Must be called from
+    the main thread, which receives `SIGCHLD`.
+
+    Args:
+        path (Path): The Unix socket to listen on.
+        run (Callable[[list[str]], int]): Runs `dojo run` arguments in a forked
+                                          child and returns the exit code.
+        ready (Callable[[], object] | None): Called once the server listens.
+
+    Raises:
+        OSError: If another server already listens on the socket.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        with socket.socket(socket.AF_UNIX) as probe:
+            try:
+                probe.connect(str(path))
+            except OSError:
+                path.unlink()
+            else:
+                msg = f"A dojo server already listens on {path}."
+                raise OSError(msg)
+
+    _ = signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with socket.socket(socket.AF_UNIX) as server:
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(str(path))
+        finally:
+            _ = os.umask(previous_umask)
+        server.listen()
+        if ready is not None:
+            _ = ready()
+        try:
+            _serve(server, run)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def run_warm(argv: list[str], path: Path) -> int | None:
+    """Run `dojo run` arguments in a forked child of the server.
+
+    The client's standard streams are handed over to the child. Ctrl-C is forwarded
+    to the child unless it already shares the client's process group.
+
+    Args:
+        argv (list[str]): The `dojo run` arguments, without `--warm`.
+        path (Path): The socket of the server.
+
+    Returns:
+        int | None: The exit code of the run, or None if no server is listening.
+
+    """
+    if not is_supported():
+        return None
+    client = socket.socket(socket.AF_UNIX)
+    try:
+        client.connect(str(path))
+    except OSError:
+        client.close()
+        return None
+
+    request = _Request(
+        argv=argv, cwd=str(Path.cwd()), env=dict(os.environ), pgid=os.getpgrp()
+    )
+    payload = json.dumps(asdict(request)).encode()
+    with client, client.makefile("r", encoding="utf-8") as replies:
+        _ = socket.send_fds(client, [_HEADER.pack(len(payload))], [0, 1, 2])
+        client.sendall(payload)
+        code = 1
+        pid = 0
+        previous = signal.getsignal(signal.SIGINT)
+        try:
+            for line in replies:
+                reply: dict[str, int] = json.loads(line)  # pyright: ignore[reportAny]
+                if "pid" in reply:
+                    pid = reply["pid"]
+                    _forward_interrupts(pid)
+                if "exit" in reply:
+                    code = reply["exit"]
+                    break
+        finally:
+            _ = signal.signal(signal.SIGINT, previous)
+        return code
+
+
+def _forward_interrupts(pid: int) -> None:
+    """Forward Ctrl-C to a child that is not in the client's process group."""
+    try:
+        shared = os.getpgid(pid) == os.getpgrp()
+    except OSError:
+        return
+    if shared:
+        # The terminal interrupts the child itself; the client just waits for it.
+        _ = signal.signal(signal.SIGINT, signal.SIG_IGN)
+        return
+
+    def forward(_signum: int, _frame: object) -> None:
+        with contextlib.suppress(OSError):
+            os.kill(pid, signal.SIGINT)
+
+    _ = signal.signal(signal.SIGINT, forward)
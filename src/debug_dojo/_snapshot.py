@@ -0,0 +1,381 @@
+"""Post-mortem snapshots for unattended runs, and `dojo replay` to browse them.
+
+An interactive post-mortem blocks forever without a terminal. Instead, the frames of a
+failing traceback can be written to a snapshot file: for each frame its code location,
+a few lines of source around it and the bounded reprs of its locals. Values are never
+pickled, so a snapshot is small, safe to load anywhere and does not keep large objects
+alive.
+
+`dojo replay <file>` prints the failure and opens a small pdb-like browser to move
+between frames and look at their locals offline.
+"""
+
+from __future__ import annotations
+
+import cmd
+import gzip
+import json
+import linecache
+import os
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, cast, final
+
+from dacite import from_dict
+from rich.console import Console
+from rich.markup import escape
+from rich.syntax import Syntax
+from rich.table import Table
+from rich.text import Text
+
+from debug_dojo._compare import bounded_repr
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import TracebackType
+
+SNAPSHOT_SUFFIX = ".json.gz"
+MAX_FRAMES = 30
+"""Number of innermost frames kept in a snapshot."""
+MAX_LOCALS = 50
+"""Number of locals kept per frame."""
+MAX_REPR_LENGTH = 200
+"""Size budget, in characters, for the repr of a single local."""
+CONTEXT_LINES = 3
+"""Lines of source kept before and after the line of each frame."""
+
+
+@dataclass
+class FrameSnapshot:
+    """A frame of a failing traceback."""
+
+    filename: str
+    """The source file of the frame's code."""
+    lineno: int
+    """The line being executed."""
+    function: str
+    """The name of the function."""
+    first_context_line: int = 0
+    """The line number of the first line of `context`."""
+    context: list[str] = field(default_factory=list)
+    """The lines of source around `lineno`."""
+    locals: dict[str, str] = field(default_factory=dict)
+    """Bounded reprs of the frame's local variables."""
+    omitted_locals: int = 0
+    """The number of locals left out of the snapshot."""
+
+
+@dataclass
+class Snapshot:
+    """A failing traceback, with its frames from the outermost to the innermost."""
+
+    exception: str
+    """The exception type and message."""
+    traceback: str
+    """The formatted traceback, including chained exceptions."""
+    frames: list[FrameSnapshot]
+    """The innermost frames of the traceback."""
+    omitted_frames: int = 0
+    """The number of outer frames left out of the snapshot."""
+    created: str = ""
+    """When the snapshot was taken, in ISO 8601 format."""
+    argv: list[str] = field(default_factory=list)
+    """The command line of the failing process."""
+
+
+def _frame_snapshot(frame_traceback: TracebackType) -> FrameSnapshot:
+    """Capture a frame of a traceback with bounded locals.
+
+    Returns:
+        FrameSnapshot: The frame's location, source context and local reprs.
+
+    """
+    frame = frame_traceback.tb_frame
+    code = frame.f_code
+    lineno = frame_traceback.tb_lineno
+    first = max(1, lineno - CONTEXT_LINES)
+    context = [
+        linecache.getline(code.co_filename, line).rstrip("\n")
+        for line in range(first, lineno + CONTEXT_LINES + 1)
+    ]
+    while context and not context[-1]:
+        _ = context.pop()
+
+    frame_locals = cast("dict[str, object]", frame.f_locals)
+    names = list(frame_locals)
+    local_reprs = {
+        name: bounded_repr(frame_locals[name], MAX_REPR_LENGTH)
+        for name in names[:MAX_LOCALS]
+    }
+    return FrameSnapshot(
+        filename=code.co_filename,
+        lineno=lineno,
+        function=code.co_name,
+        first_context_line=first,
+        context=context,
+        locals=local_reprs,
+        omitted_locals=max(0, len(names) - MAX_LOCALS),
+    )
+
+
+def take_snapshot(exception: BaseException) -> Snapshot:
+    """Capture the frames of an exception's traceback.
+
+    Only the `MAX_FRAMES` innermost frames are kept, each with at most `MAX_LOCALS`
+    locals, represented within `MAX_REPR_LENGTH` characters.
+
+    Args:
+        exception (BaseException): The exception to capture.
+
+    Returns:
+        Snapshot: The snapshot of the failure.
+
+    """
+    tracebacks: list[TracebackType] = []
+    current = exception.__traceback__
+    while current is not None:
+        tracebacks.append(current)
+        current = current.tb_next
+
+    kept = tracebacks[-MAX_FRAMES:]
+    return Snapshot(
+        exception="".join(
+            traceback.format_exception_only(type(exception), exception)
+        ).strip(),
+        traceback="".join(
+            traceback.format_exception(type(exception), exception, None)
+        ).strip(),
+        frames=[_frame_snapshot(frame_traceback) for frame_traceback in kept],
+        omitted_frames=len(tracebacks) - len(kept),
+        created=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        argv=list(sys.argv),
+    )
+
+
+def write_snapshot(exception: BaseException, directory: Path) -> Path:
+    """Write a snapshot of an exception's traceback to a new file.
+
+    Args:
+        exception (BaseException): The exception to capture.
+        directory (Path): The directory to write the snapshot to, created if needed.
+
+    Returns:
+        Path: The written snapshot file.
+
+    """
+    snapshot = take_snapshot(exception)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = directory / f"dojo-snapshot-{stamp}-{os.getpid()}{SNAPSHOT_SUFFIX}"
+    data = json.dumps(asdict(snapshot), separators=(",", ":")).encode()
+    _ = path.write_bytes(gzip.compress(data))
+    return path
+
+
+def load_snapshot(path: Path) -> Snapshot:
+    """Load a snapshot written by `write_snapshot`.
+
+    Args:
+        path (Path): The snapshot file.
+
+    Returns:
+        Snapshot: The snapshot.
+
+    """
+    data = json.loads(gzip.decompress(path.read_bytes()))  # pyright: ignore[reportAny]
+    return from_dict(Snapshot, data)  # pyright: ignore[reportAny]
+
+
+@final
+class SnapshotBrowser(cmd.Cmd):
+    """A pdb-like browser for the frames of a snapshot.
+
+    Frames are numbered from the outermost, and the innermost is selected first.
+    """
+
+    intro = "Browsing snapshot frames. Type `help` for commands, `quit` to leave."
+    prompt = "(replay) "
+
+    def __init__(self, snapshot: Snapshot, console: Console | None = None) -> None:
+        """Create a browser on the innermost frame.
+
+        Args:
+            snapshot (Snapshot): The snapshot to browse.
+            console (Console | None): The console to print to, a new one by default.
+
+        """
+        super().__init__()
+        self.snapshot = snapshot
+        self.console = console or Console()
+        self.index = len(snapshot.frames) - 1
+
+    def _select(self, index: int) -> None:
+        """Select a frame, if it exists, and show where it is."""
+        if not 0 <= index < len(self.snapshot.frames):
+            self.console.print("[red]No such frame.[/red]")
+            return
+        self.index = index
+        self.console.print(frame_header(self.snapshot.frames[index], index))
+
+    def do_where(self, _arg: str) -> None:
+        """List the frames, marking the selected one."""
+        print_frames(self.snapshot, self.console, selected=self.index)
+
+    def do_up(self, _arg: str) -> None:
+        """Select the caller of the selected frame."""
+        self._select(self.index - 1)
+
+    def do_down(self, _arg: str) -> None:
+        """Select the frame called by the selected frame."""
+        self._select(self.index + 1)
+
+    def do_frame(self, arg: str) -> None:
+        """Select a frame by number: frame N."""
+        try:
+            self._select(int(arg))
+        except ValueError:
+            self.console.print("[red]Usage: frame N[/red]")
+
+    def do_list(self, _arg: str) -> None:
+        """Show the source around the line of the selected frame."""
+        self.console.print(frame_source(self.snapshot.frames[self.index]))
+
+    def do_locals(self, _arg: str) -> None:
+        """Show the locals of the selected frame."""
+        self.console.print(locals_table(self.snapshot.frames[self.index]))
+
+    def do_print(self, arg: str) -> None:
+        """Show the repr of a local of the selected frame: print NAME."""
+        frame = self.snapshot.frames[self.index]
+        if arg in frame.locals:
+            self.console.print(frame.locals[arg], markup=False, highlight=True)
+        else:
+            self.console.print(
+                f"[red]No local named {escape(repr(arg))} in this frame.[/red]"
+            )
+
+    def do_traceback(self, _arg: str) -> None:
+        """Show the full traceback."""
+        self.console.print(self.snapshot.traceback, markup=False, highlight=False)
+
+    def do_quit(self, _arg: str) -> bool:  # noqa: PLR6301
+        """Leave the browser.
+
+        Returns:
+            bool: True, to stop the command loop.
+
+        """
+        return True
+
+    do_EOF = do_quit  # noqa: N815
+    do_w = do_where
+    do_u = do_up
+    do_d = do_down
+    do_l = do_list
+    do_p = do_print
+    do_q = do_quit
+
+    def emptyline(self) -> bool:  # pyright: ignore[reportImplicitOverride]  # noqa: PLR6301
+        """Do nothing on an empty line, instead of repeating the last command.
+
+        Returns:
+            bool: False, to keep the command loop running.
+
+        """
+        return False
+
+
+def frame_header(frame: FrameSnapshot, index: int) -> str:
+    """Format the location of a frame.
+
+    Returns:
+        str: The frame number, function, file and line, as rich markup.
+
+    """
+    return (
+        f"[bold]#{index}[/bold] [cyan]{escape(frame.function)}[/cyan] "
+        f"at {escape(frame.filename)}:{frame.lineno}"
+    )
+
+
+def frame_source(frame: FrameSnapshot) -> Syntax | str:
+    """Render the source around the line of a frame.
+
+    Returns:
+        Syntax | str: The highlighted source, or a notice if none was captured.
+
+    """
+    if not frame.context:
+        return "[dim]No source captured for this frame.[/dim]"
+    return Syntax(
+        "\n".join(frame.context),
+        "python",
+        line_numbers=True,
+        start_line=frame.first_context_line,
+        highlight_lines={frame.lineno},
+    )
+
+
+def locals_table(frame: FrameSnapshot) -> Table:
+    """Tabulate the locals of a frame.
+
+    Returns:
+        Table: The locals and their reprs.
+
+    """
+    title = f"Locals of {escape(frame.function)}"
+    if frame.omitted_locals:
+        title += f" ({frame.omitted_locals} more not captured)"
+    table = Table(title=title, title_style="bold")
+    table.add_column("Name", style="cyan")
+    table.add_column("Value", overflow="fold")
+    for name, value in frame.locals.items():
+        table.add_row(Text(name), Text(value))
+    return table
+
+
+def print_frames(
+    snapshot: Snapshot, console: Console, selected: int | None = None
+) -> None:
+    """Print the frames of a snapshot from the outermost to the innermost.
+
+    Args:
+        snapshot (Snapshot): The snapshot.
+        console (Console): The console to print to.
+        selected (int | None): The frame to mark as selected.
+
+    """
+    if snapshot.omitted_frames:
+        console.print(f"[dim]... {snapshot.omitted_frames} outer frames omitted[/dim]")
+    for index, frame in enumerate(snapshot.frames):
+        marker = ">" if index == selected else " "
+        console.print(f"{marker} {frame_header(frame, index)}")
+
+
+def replay_snapshot(
+    path: Path, *, browse: bool = True, console: Console | None = None
+) -> None:
+    """Show a snapshot's failure and innermost frame, then browse its frames.
+
+    Args:
+        path (Path): The snapshot file.
+        browse (bool): If True, open the frame browser after the summary.
+        console (Console | None): The console to print to, a new one by default.
+
+    """
+    console = console or Console()
+    snapshot = load_snapshot(path)
+    console.print(f"[bold red]{escape(snapshot.exception)}[/bold red]", highlight=False)
+    command = escape(" ".join(snapshot.argv))
+    console.print(f"[dim]Captured {escape(snapshot.created)}: {command}[/dim]")
+    if not snapshot.frames:
+        return
+
+    innermost = len(snapshot.frames) - 1
+    print_frames(snapshot, console, selected=innermost)
+    console.print(frame_source(snapshot.frames[innermost]))
+    console.print(locals_table(snapshot.frames[innermost]))
+    if browse:
+        _ = SnapshotBrowser(snapshot, console).cmdloop()
@@ -0,0 +1,277 @@
+"""Usage statistics of the debugging tools, for `dojo run --stats`.
+
+Leftover debug calls in long runs can cost more than expected: a `b()` in a hot loop,
+a `p()` of a large value, or the first breakpoint of a run that imports IPython. While
+recording, the `b`, `p`, `i` and `c` builtins and `sys.breakpointhook` are wrapped to
+count calls per call site and to time them. A debugger entry is a `b()` call that
+stops or a `breakpoint()` call; its time is the debugger's start-up, as the debugger
+prompts only after the call returned. The first entry of a site shows the cost of
+importing the debugger or `rich`.
+
+Counters are plain attributes updated without a lock: with several threads calling
+the same site at once, a count can come out slightly low. Nothing is wrapped, and
+nothing costs anything, unless recording is requested.
+"""
+
+from __future__ import annotations
+
+import builtins
+import contextlib
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, final
+
+from debug_dojo._breakpoint import Breakpoint, on_hit, start_debugger
+from debug_dojo._installers import tools_disabled
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from pathlib import Path
+    from types import FrameType
+
+    from rich.table import Table
+
+    from debug_dojo._config_models import DebugDojoConfig
+
+BREAKPOINT_TOOL = "breakpoint()"
+"""Name under which `breakpoint()` calls are recorded."""
+
+
+@dataclass(slots=True)
+class CallSite:
+    """Statistics of the calls of one tool at one call site."""
+
+    tool: str
+    """The tool, e.g. `b` or `breakpoint()`."""
+    file: str
+    """The file of the call site."""
+    line: int
+    """The line of the call site."""
+    calls: int = 0
+    """Number of calls."""
+    entries: int = 0
+    """Number of debugger entries, or of calls for `p`, `i` and `c`."""
+    first_entry_ns: int = 0
+    """Duration of the first entry."""
+    total_ns: int = 0
+    """Total duration of all calls."""
+    max_ns: int = 0
+    """Duration of the slowest call."""
+
+
+@dataclass
+class ToolStats:
+    """Statistics of all call sites of the debugging tools."""
+
+    sites: dict[tuple[str, str, int], CallSite] = field(default_factory=dict)
+
+    def record(
+        self, tool: str, frame: FrameType, elapsed_ns: int, *, entered: bool
+    ) -> None:
+        """Record a call of a tool.
+
+        Args:
+            tool (str): The tool called.
+            frame (FrameType): The frame that called it.
+            elapsed_ns (int): The duration of the call.
+            entered (bool): Whether the call entered the debugger, or for `p`, `i`
+                            and `c`, whether it ran at all.
+
+        """
+        key = (tool, frame.f_code.co_filename, frame.f_lineno)
+        site = self.sites.get(key)
+        if site is None:
+            site = self.sites[key] = CallSite(*key)
+        site.calls += 1
+        site.total_ns += elapsed_ns
+        site.max_ns = max(site.max_ns, elapsed_ns)
+        if entered:
+            if not site.entries:
+                site.first_entry_ns = elapsed_ns
+            site.entries += 1
+
+    def write(self, path: Path) -> None:
+        """Write the statistics to a JSON file."""
+        data = {"sites": [asdict(site) for site in self.sites.values()]}
+        _ = path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> ToolStats:
+        """Load statistics written by `write`.
+
+        Returns:
+            ToolStats: The statistics.
+
+        """
+        from dacite import from_dict  # noqa: PLC0415
+
+        data = json.loads(path.read_text(encoding="utf-8"))  # pyright: ignore[reportAny]
+        sites = [from_dict(CallSite, site) for site in data["sites"]]  # pyright: ignore[reportAny]
+        return cls({(site.tool, site.file, site.line): site for site in sites})
+
+    def table(self) -> Table:
+        """Tabulate the call sites, the most expensive first.
+
+        Returns:
+            Table: The call sites with their calls, entries and durations.
+
+        """
+        from rich.table import Table  # noqa: PLC0415
+
+        table = Table(title="Debugging tool calls", title_style="bold")
+        table.add_column("Tool", style="cyan")
+        table.add_column("Call site")
+        table.add_column("Calls", justify="right")
+        table.add_column("Entries", justify="right")
+        table.add_column("First entry (ms)", justify="right")
+        table.add_column("Total (ms)", justify="right")
+        table.add_column("Max (ms)", justify="right")
+        for site in sorted(
+            self.sites.values(), key=lambda site: site.total_ns, reverse=True
+        ):
+            table.add_row(
+                site.tool,
+                f"{site.file}:{site.line}",
+                f"{site.calls}",
+                f"{site.entries}",
+                f"{site.first_entry_ns / 1e6:.3f}" if site.entries else "-",
+                f"{site.total_ns / 1e6:.3f}",
+                f"{site.max_ns / 1e6:.3f}",
+            )
+        return table
+
+
+@final
+class _Recorded:
+    """Wrapper recording the calls of a tool in builtins; other attributes pass."""
+
+    __slots__ = ("_breakpoint", "_entries", "_stats", "_target", "_tool")
+
+    def __init__(
+        self, tool: str, target: Callable[..., object] | Breakpoint, stats: ToolStats
+    ) -> None:
+        """Wrap a tool."""
+        self._tool: str = tool
+        self._target: Callable[..., object] = target
+        self._breakpoint: Breakpoint | None = (
+            target if isinstance(target, Breakpoint) else None
+        )
+        self._stats: ToolStats = stats
+        self._entries: int = 0
+
+    def count_entry(self, _frame: FrameType) -> None:
+        """Count a debugger entry of `b`, from an `on_hit` callback."""
+        self._entries += 1
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        """Call the tool and record the call.
+
+        Returns:
+            object: Whatever the tool returns.
+
+        """
+        frame = sys._getframe(1)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        entries = self._entries
+        start = perf_counter_ns()
+        try:
+            if self._breakpoint is not None:
+                # Counted and stopped in the caller's frame, not in this wrapper.
+                return self._breakpoint.hit(frame, *args, **kwargs)
+            return self._target(*args, **kwargs)
+        finally:
+            elapsed = perf_counter_ns() - start
+            entered = self._breakpoint is None or self._entries != entries
+            self._stats.record(self._tool, frame, elapsed, entered=entered)
+
+    def __getattr__(self, name: str) -> object:
+        """Forward other attributes, e.g. `b.disable`, to the tool.
+
+        Returns:
+            object: The attribute of the tool.
+
+        """
+        return getattr(self._target, name)  # pyright: ignore[reportAny]
+
+
+def _breakpointhook(
+    hook: Callable[..., object], stats: ToolStats
+) -> Callable[..., object]:
+    """Wrap `sys.breakpointhook` to record `breakpoint()` calls.
+
+    Without arguments, the debugger stops in the caller of `breakpoint()` rather
+    than in the wrapper.
+
+    Returns:
+        Callable[..., object]: The recording hook.
+
+    """
+
+    def recording_hook(*args: object, **kwargs: object) -> object:
+        """Start the debugger and record the call.
+
+        Returns:
+            object: Whatever the hook returns, when called with arguments.
+
+        """
+        frame = sys._getframe(1)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+        start = perf_counter_ns()
+        try:
+            if args or kwargs:
+                return hook(*args, **kwargs)
+            start_debugger(frame, hook)
+            return None
+        finally:
+            stats.record(
+                BREAKPOINT_TOOL, frame, perf_counter_ns() - start, entered=True
+            )
+
+    return recording_hook
+
+
+@contextlib.contextmanager
+def recording(config: DebugDojoConfig) -> Generator[ToolStats]:
+    """Record the calls of the installed debugging tools, while in the context.
+
+    The tools have to be installed already; they are restored on exit. No-op stubs
+    installed for disabled tools are left alone, and nothing is recorded.
+
+    Args:
+        config (DebugDojoConfig): The configuration the tools were installed with.
+
+    Yields:
+        ToolStats: The statistics, complete on exit.
+
+    """
+    stats = ToolStats()
+    if tools_disabled(config):
+        yield stats
+        return
+
+    features = config.features
+    namespace = builtins.__dict__
+    mnemonics = [
+        mnemonic
+        for mnemonic in (
+            features.breakpoint,
+            features.rich_print,
+            features.rich_inspect,
+            features.comparer,
+        )
+        if mnemonic and mnemonic in namespace
+    ]
+    originals: dict[str, object] = {name: namespace[name] for name in mnemonics}
+    hook = sys.breakpointhook
+    with contextlib.ExitStack() as stack:
+        for name in mnemonics:
+            recorded = _Recorded(name, namespace[name], stats)  # pyright: ignore[reportAny]
+            namespace[name] = recorded
+            if name == features.breakpoint:
+                stack.enter_context(on_hit(recorded.count_entry))
+        sys.breakpointhook = _breakpointhook(hook, stats)
+        try:
+            yield stats
+        finally:
+            sys.breakpointhook = hook
+            namespace.update(originals)
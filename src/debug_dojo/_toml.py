@@ -0,0 +1,186 @@
+"""Read-only TOML loading for debug-dojo configuration files.
+
+debug-dojo never writes configuration back, so files are parsed with the stdlib
+`tomllib` (Python 3.11+) instead of the round-trip `tomlkit` parser, which is only used
+as a fallback on older Pythons. For `pyproject.toml`, only the requested table is cut
+out of the document and parsed, so the rest of a large file is never materialised.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_TABLE_HEADER = re.compile(
+    r"^[ \t]*\[\[?[ \t]*(?P<key>[^\[\]\n]+?)[ \t]*\]\]?[ \t]*(?:#.*)?$",
+    re.MULTILINE,
+)
+"""Matches `[table]` and `[[array.of.tables]]` header lines."""
+
+_MULTILINE_STRING = re.compile(r"\"\"\"|'''")
+"""Matches multiline string delimiters; such strings may contain header-like lines."""
+
+
+def _dotted_key(name: str) -> re.Pattern[str]:
+    """Build a pattern for key lines with `name` as a part of a dotted key.
+
+    >>> bool(_dotted_key("dojo").search('dojo.mode = "lazy"'))
+    True
+    >>> bool(_dotted_key("dojo").search('name = "dojo.mode"'))
+    False
+
+    Returns:
+        re.Pattern[str]: Matches the key of a key/value line, up to its `=`.
+
+    """
+    return re.compile(
+        rf"^[ \t]*(?=[^\s\[#])[^=\n]*?\b{re.escape(name)}\b[\"']?[ \t]*[.=]",
+        re.MULTILINE,
+    )
+
+
+def loads(text: str) -> dict[str, object]:
+    """Parse a TOML document into plain Python objects.
+
+    Args:
+        text (str): The TOML document.
+
+    Returns:
+        dict[str, object]: The parsed document.
+
+    Raises:
+        ValueError: If the document is not valid TOML.
+
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib  # noqa: PLC0415  # pyright: ignore[reportUnreachable]
+
+        return tomllib.loads(text)
+
+    from tomlkit import parse  # noqa: PLC0415
+    from tomlkit.exceptions import TOMLKitError  # noqa: PLC0415
+
+    try:
+        return cast(dict[str, object], parse(text).unwrap())
+    except TOMLKitError as e:
+        raise ValueError(str(e)) from e
+
+
+def _normalize_key(key: str) -> tuple[str, ...]:
+    """Split a dotted TOML key into its parts, dropping whitespace and quotes.
+
+    >>> _normalize_key('tool . "debug_dojo"')
+    ('tool', 'debug_dojo')
+
+    Returns:
+        tuple[str, ...]: The key parts.
+
+    """
+    return tuple(part.strip().strip("\"'") for part in key.split("."))
+
+
+def extract_table(text: str, table: str) -> str | None:
+    r"""Cut the sections of a table (and its sub-tables) out of a TOML document.
+
+    >>> doc = "[a]\nx = 1\n[tool.dojo]\ny = 2\n[tool.dojo.sub]\nz = 3\n[b]\n"
+    >>> print(extract_table(doc, "tool.dojo"))
+    [tool.dojo]
+    y = 2
+    [tool.dojo.sub]
+    z = 3
+    <BLANKLINE>
+
+    Args:
+        text (str): The TOML document.
+        table (str): The dotted name of the table to extract.
+
+    Returns:
+        str | None: A TOML document with only the table's sections, or None if the
+            table is not defined through `[table]` headers only, or if a multiline
+            string may hide or fake one of its headers.
+
+    """
+    prefix = _normalize_key(table)
+    headers = list(_TABLE_HEADER.finditer(text))
+    sections: list[str] = []
+    stop = 0
+
+    for index, header in enumerate(headers):
+        key = _normalize_key(header.group("key"))
+        if key[: len(prefix)] != prefix:
+            continue
+        stop = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+        sections.append(text[header.start() : stop])
+
+    if not sections or _MULTILINE_STRING.search(text, 0, stop):
+        return None
+    # Dotted keys, e.g. `debug_dojo.install_mode = ...` under `[tool]`, add to the
+    # table outside of its own headers.
+    if _dotted_key(prefix[-1]).search(text):
+        return None
+    return "".join(sections)
+
+
+def _get_table(document: dict[str, object], table: str) -> dict[str, object] | None:
+    """Look up a dotted table name in a parsed document.
+
+    Returns:
+        dict[str, object] | None: The table, or None if it is not defined.
+
+    """
+    node = document
+    for part in _normalize_key(table):
+        child = node.get(part)
+        if not isinstance(child, dict):
+            return None
+        node = cast("dict[str, object]", child)
+    return node
+
+
+def read_toml(path: Path) -> dict[str, object]:
+    """Read and parse a TOML file.
+
+    Args:
+        path (Path): The file to read.
+
+    Returns:
+        dict[str, object]: The parsed document.
+
+    """
+    return loads(path.read_text(encoding="utf-8"))
+
+
+def read_toml_table(path: Path, table: str) -> dict[str, object]:
+    """Read a single table from a TOML file without parsing the whole document.
+
+    Falls back to parsing the full file when the table is not declared with plain
+    headers (e.g. as an inline table or dotted keys), when a multiline string may hide
+    or fake one of its headers, or when the excerpt does not parse on its own.
+
+    Args:
+        path (Path): The file to read.
+        table (str): The dotted name of the table, e.g. `tool.debug_dojo`.
+
+    Returns:
+        dict[str, object]: The table, or an empty dict if it is not defined.
+
+    """
+    text = path.read_text(encoding="utf-8")
+    name = _normalize_key(table)[-1]
+    if name not in text:
+        return {}
+
+    excerpt = extract_table(text, table)
+    if excerpt is not None:
+        try:
+            found = _get_table(loads(excerpt), table)
+        except ValueError:
+            found = None
+        if found is not None:
+            return found
+
+    return _get_table(loads(text), table) or {}
@@ -0,0 +1,228 @@
+"""Rich tracebacks whose locals are rendered within a fixed budget.
+
+`rich.traceback.install(show_locals=True)` builds the repr of every local in every
+frame before anything is printed, and only then hides the frames past `max_frames`. With
+large data frames or buffers in scope, rendering one traceback can take seconds and
+gigabytes.
+
+Here the trace is extracted without locals, and the locals are then represented only for
+the frames that will be shown, at most `max_locals` per frame, each within a repr length
+and container item budget. Values of the skipped types are not represented at all.
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import traceback
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
+
+from rich.console import Console
+from rich.pretty import Node
+from rich.traceback import Traceback
+
+from debug_dojo._compare import bounded_repr
+
+if TYPE_CHECKING:
+    from types import FrameType, TracebackType
+
+    from rich.traceback import Frame, Trace
+
+MAX_FRAMES = 20
+"""Default number of frames shown per traceback."""
+MAX_LOCALS = 20
+"""Default number of locals shown per frame."""
+MAX_REPR_LENGTH = 80
+"""Default size budget, in characters, for the repr of a local."""
+MAX_ITEMS = 10
+"""Default number of items shown per container."""
+
+
+@dataclass(frozen=True)
+class TracebackLimits:
+    """Limits on the locals rendered in a traceback."""
+
+    max_frames: int = MAX_FRAMES
+    """Frames shown per traceback, half at each end; 0 shows all frames."""
+    max_locals: int = MAX_LOCALS
+    """Locals shown per frame."""
+    max_repr_length: int = MAX_REPR_LENGTH
+    """Size budget, in characters, for the repr of a local."""
+    max_items: int = MAX_ITEMS
+    """Items shown per container."""
+    skip_types: frozenset[str] = field(default_factory=frozenset)
+    """Types, by name or qualified name (e.g. `pandas.DataFrame`), whose values are
+    not represented, including subclasses."""
+
+
+def _skipped_type(value: object, skip_types: frozenset[str]) -> str | None:
+    """Find whether a value's type, or one of its bases, is to be skipped.
+
+    Returns:
+        str | None: The name of the value's type if it is skipped, else None.
+
+    """
+    if not skip_types:
+        return None
+    for cls in type(value).__mro__:
+        if cls.__qualname__ in skip_types or (
+            f"{cls.__module__}.{cls.__qualname__}" in skip_types
+        ):
+            return type(value).__qualname__
+    return None
+
+
+def _bounded_locals(frame: FrameType, limits: TracebackLimits) -> dict[str, Node]:
+    """Represent the locals of a frame within the limits.
+
+    Like rich, dunder names, functions and classes are left out.
+
+    Returns:
+        dict[str, Node]: The locals' reprs, as rich pretty nodes.
+
+    """
+    frame_locals = cast("dict[str, object]", frame.f_locals)
+    shown: dict[str, Node] = {}
+    omitted = 0
+    for name, value in frame_locals.items():
+        if name.startswith("__") or inspect.isfunction(value) or inspect.isclass(value):
+            continue
+        if len(shown) >= limits.max_locals:
+            omitted += 1
+            continue
+        skipped = _skipped_type(value, limits.skip_types)
+        text = (
+            f"<{skipped} not shown>"
+            if skipped
+            else bounded_repr(value, limits.max_repr_length, limits.max_items)
+        )
+        shown[name] = Node(value_repr=text)
+    if omitted:
+        shown["..."] = Node(value_repr=f"<{omitted} more locals>")
+    return shown
+
+
+def _chained_frames(
+    exception: BaseException, exc_traceback: TracebackType | None
+) -> list[list[FrameType]]:
+    """List the frames of an exception and its causes, as rich orders its stacks.
+
+    Returns:
+        list[list[FrameType]]: The frames of each exception, outermost first.
+
+    """
+    chain: list[list[FrameType]] = []
+    seen: set[int] = set()
+    current: BaseException | None = exception
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        chain.append(
+            [
+                frame
+                for frame, _lineno in traceback.walk_tb(
+                    exc_traceback if current is exception else current.__traceback__
+                )
+                if not frame.f_locals.get("_rich_traceback_omit", False)
+            ]
+        )
+        if current.__cause__ is not None:
+            current = current.__cause__
+        elif current.__context__ is not None and not current.__suppress_context__:
+            current = current.__context__
+        else:
+            current = None
+    return chain
+
+
+def _shown(index: int, count: int, max_frames: int) -> bool:
+    """Check whether rich shows a frame, given how it hides the middle frames.
+
+    Returns:
+        bool: True if the frame at `index` of `count` frames is shown.
+
+    """
+    if not max_frames:
+        return True
+    half = max_frames // 2
+    return index < half or index >= count - half
+
+
+def _add_locals(
+    trace: Trace, chain: list[list[FrameType]], limits: TracebackLimits
+) -> None:
+    """Fill in the locals of the shown frames of a trace extracted without locals.
+
+    Frames are matched from the innermost, as rich drops the frames above a
+    `_rich_traceback_guard`; a frame that does not match keeps no locals.
+    """
+    for stack, frames in zip(trace.stacks, chain, strict=False):
+        shown_frames: list[Frame] = stack.frames
+        count = len(shown_frames)
+        for index, (rich_frame, frame) in enumerate(
+            zip(reversed(shown_frames), reversed(frames), strict=False)
+        ):
+            if frame.f_code.co_name != rich_frame.name or not _shown(
+                count - 1 - index, count, limits.max_frames
+            ):
+                continue
+            rich_frame.locals = _bounded_locals(frame, limits)
+
+
+def bounded_traceback(
+    exc_type: type[BaseException],
+    exc_value: BaseException,
+    exc_traceback: TracebackType | None,
+    *,
+    show_locals: bool = False,
+    limits: TracebackLimits | None = None,
+) -> Traceback:
+    """Build a rich traceback whose locals are rendered within limits.
+
+    Args:
+        exc_type (type[BaseException]): The type of the exception.
+        exc_value (BaseException): The exception to render.
+        exc_traceback (TracebackType | None): The traceback of the exception.
+        show_locals (bool): Show the locals of each shown frame.
+        limits (TracebackLimits | None): Limits on the frames and locals shown.
+
+    Returns:
+        Traceback: The renderable traceback.
+
+    """
+    limits = limits or TracebackLimits()
+    trace = Traceback.extract(exc_type, exc_value, exc_traceback, show_locals=False)
+    if show_locals:
+        _add_locals(trace, _chained_frames(exc_value, exc_traceback), limits)
+    return Traceback(trace, max_frames=limits.max_frames)
+
+
+def install(
+    *, show_locals: bool = False, limits: TracebackLimits | None = None
+) -> None:
+    """Report uncaught exceptions with a bounded rich traceback.
+
+    Args:
+        show_locals (bool): Show the locals of each shown frame.
+        limits (TracebackLimits | None): Limits on the frames and locals shown.
+
+    """
+    console = Console(stderr=True)
+
+    def excepthook(
+        exc_type: type[BaseException],
+        exc_value: BaseException,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Print the exception as a bounded rich traceback."""
+        console.print(
+            bounded_traceback(
+                exc_type,
+                exc_value,
+                exc_traceback,
+                show_locals=show_locals,
+                limits=limits,
+            )
+        )
+
+    sys.excepthook = excepthook
@@ -0,0 +1,218 @@
+"""Watch mode of `dojo run`: run the target again whenever its source changes.
+
+The watching process loads the configuration once and then forks a child for every
+run, so debug-dojo, the configuration and everything imported before the fork are
+never loaded again. After each run, the child reports which modules it imported:
+the project modules (files under the project root) are added to the watched files.
+
+With `preload`, the third-party packages reported are imported by the watching process
+too, so that the next child starts with them already loaded and only imports the
+project's own code. This is opt-in, as not every package survives a fork: one that
+starts threads, opens connections or initializes a GPU or an event loop on import
+leaves the children with locks held by threads that no longer exist, or with
+descriptors shared with the watching process, and may hang or misbehave in them.
+
+The standard library has no file system notifications, so the watched files are
+polled for modification times. A change made while the target runs, including to a
+module it imports for the first time, is picked up as soon as it finishes. Forking is
+a POSIX feature, so watch mode is not available on Windows.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import signal
+import sys
+import time
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+POLL_INTERVAL_S = 0.25
+"""Interval between two checks of the watched files."""
+
+_THIRD_PARTY_DIRS = frozenset({"site-packages", "dist-packages"})
+
+
+def is_supported() -> bool:
+    """Check whether the platform can fork.
+
+    Returns:
+        bool: True on POSIX systems.
+
+    """
+    return hasattr(os, "fork")
+
+
+def loaded_modules(root: Path) -> tuple[list[str], list[str]]:
+    """Classify the imported modules into project files and third-party packages.
+
+    Args:
+        root (Path): The project root; modules below it that are not installed
+                     packages are project modules.
+
+    Returns:
+        tuple[list[str], list[str]]: The files of the project modules, and the names
+            of the top-level third-party packages, debug-dojo excluded.
+
+    """
+    root = root.resolve()
+    project: set[str] = set()
+    third_party: set[str] = set()
+    for name, module in list(sys.modules.items()):
+        file: object = getattr(module, "__file__", None)
+        if not isinstance(file, str) or name.startswith("debug_dojo"):
+            continue
+        path = Path(file).resolve()
+        if _THIRD_PARTY_DIRS.intersection(path.parts):
+            third_party.add(name.partition(".")[0])
+        elif path.is_relative_to(root):
+            project.add(str(path))
+    third_party.discard("__main__")
+    return sorted(project), sorted(third_party)
+
+
+def _modification_time(file: Path) -> int:
+    """Read the modification time of a file.
+
+    Returns:
+        int: The modification time in nanoseconds, 0 for a missing file.
+
+    """
+    try:
+        return file.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _modification_times(files: Iterable[Path]) -> dict[Path, int]:
+    """Read the modification times of files.
+
+    Returns:
+        dict[Path, int]: The modification time in nanoseconds per file.
+
+    """
+    return {file: _modification_time(file) for file in files}
+
+
+def _run_child(run: Callable[[], int], root: Path, report_fd: int) -> None:
+    """Run the target in the forked child and report its imports, then exit.
+
+    Args:
+        run (Callable[[], int]): Runs the target and returns the exit code.
+        root (Path): The project root.
+        report_fd (int): The pipe to write the imported modules to.
+
+    """
+    code = 1
+    try:
+        _ = signal.signal(signal.SIGINT, signal.default_int_handler)
+        code = run()
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    finally:
+        with contextlib.suppress(Exception):
+            project, third_party = loaded_modules(root)
+            report = json.dumps({"project": project, "third_party": third_party})
+            with os.fdopen(report_fd, "w", encoding="utf-8") as pipe:
+                _ = pipe.write(report)
+            _ = sys.stdout.flush()
+            _ = sys.stderr.flush()
+        os._exit(code)
+
+
+def _run_forked(run: Callable[[], int], root: Path) -> tuple[int, list[str], list[str]]:
+    """Run the target in a forked child, ignoring Ctrl-C in the watching process.
+
+    Returns:
+        tuple[int, list[str], list[str]]: The exit code, and the project files and
+            third-party packages imported by the child.
+
+    """
+    read_fd, write_fd = os.pipe()
+    _ = sys.stdout.flush()
+    _ = sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:  # The child.
+        os.close(read_fd)
+        _run_child(run, root, write_fd)
+    os.close(write_fd)
+
+    # Ctrl-C interrupts the target only; the watching process keeps going.
+    previous = signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        with os.fdopen(read_fd, encoding="utf-8") as pipe:
+            data = pipe.read()
+        status = os.waitpid(pid, 0)[1]
+    finally:
+        _ = signal.signal(signal.SIGINT, previous)
+
+    try:
+        report: dict[str, list[str]] = json.loads(data)  # pyright: ignore[reportAny]
+    except ValueError:
+        report = {}
+    return (
+        os.waitstatus_to_exitcode(status),
+        report.get("project", []),
+        report.get("third_party", []),
+    )
+
+
+def _import_all(names: Iterable[str]) -> None:
+    """Import packages so that the next forked child finds them loaded."""
+    for name in names:
+        with contextlib.suppress(Exception):
+            _ = import_module(name)
+
+
+def watch(  # noqa: PLR0913
+    run: Callable[[], int],
+    files: Iterable[Path],
+    *,
+    root: Path,
+    notify: Callable[[str], object] = print,
+    interval: float = POLL_INTERVAL_S,
+    preload: bool = False,
+) -> None:
+    """Run the target in a forked child, and again whenever a watched file changes.
+
+    Runs until interrupted with Ctrl-C while waiting for a change; Ctrl-C during a
+    run only interrupts the target.
+
+    Args:
+        run (Callable[[], int]): Runs the target and returns the exit code.
+        files (Iterable[Path]): The files to watch from the start, e.g. the script.
+        root (Path): The project root; the project modules imported by the target
+                     are watched as well.
+        notify (Callable[[str], object]): Shows a status message.
+        interval (float): Seconds between two checks of the watched files.
+        preload (bool): Import the third-party packages imported by a run in the
+                        watching process, so that the next run starts with them
+                        loaded. Only safe for packages that do not start threads or
+                        open resources on import.
+
+    """
+    watched = {file.resolve() for file in files}
+    while True:
+        before = _modification_times(watched)
+        started = time.time_ns()
+        code, project, third_party = _run_forked(run, root)
+        new_files = {Path(file) for file in project} - watched
+        # Modules first imported by this run may have been edited during it.
+        before.update(
+            (file, -1 if mtime > started else mtime)
+            for file, mtime in _modification_times(new_files).items()
+        )
+        watched |= new_files
+        if preload:
+            _import_all(third_party)
+
+        _ = notify(f"Exit code {code}. Watching {len(watched)} files, Ctrl-C to stop.")
+        while _modification_times(watched) == before:
+            time.sleep(interval)
+        _ = notify("Change detected, running again.")
@@ -0,0 +1,23 @@
+"""A CPU-bound target for profiling tests."""
+
+import time
+
+RUN_SECONDS = 0.3
+
+
+def spin() -> int:
+    """Burn CPU time for a while.
+
+    Returns:
+        int: A meaningless sum.
+
+    """
+    deadline = time.perf_counter() + RUN_SECONDS
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+if __name__ == "__main__":
+    _ = spin()
@@ -0,0 +1,12 @@
+"""A target that reports which debugging tools a child Python process has."""
+
+import subprocess  # noqa: S404
+import sys
+
+CHILD = "import builtins; print(type(getattr(builtins, 'b', None)).__name__)"
+
+if __name__ == "__main__":
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", CHILD], capture_output=True, check=True, text=True
+    )
+    print(f"child b: {result.stdout.strip()}")
@@ -28,3 +28,14 @@ def test_config_print_file(runner: CliRunner, test_config_path: str) -> None:
     rich.print(result.output)
 
     assert result.exit_code == 0
+
+
+def test_config_clear_cache(runner: CliRunner, test_config_path: str) -> None:
+    """Test clearing the configuration cache from CLI."""
+    _ = runner.invoke(cli, ["config", "--config", test_config_path])
+    result = runner.invoke(
+        cli, ["config", "--config", test_config_path, "--clear-cache"]
+    )
+
+    assert result.exit_code == 0
+    assert "Removed 1 cache file(s)." in result.output
@@ -0,0 +1,94 @@
+"""Tests for the fast path of `dojo run`, which bypasses typer."""
+
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+import pytest
+from typer.core import TyperGroup
+from typer.main import get_command
+
+from debug_dojo._cli import cli
+from debug_dojo._config_models import DebuggerType
+from debug_dojo._entry import FAST_OPTIONS, TYPER_ONLY_OPTIONS, RunArguments, parse_run
+
+
+def test_options_cover_run_command() -> None:
+    """Test that every option of the typer `run` command is known to the fast path."""
+    group = get_command(cli)
+    assert isinstance(group, TyperGroup)
+    typer_options = {
+        name
+        for parameter in group.commands["run"].params
+        for name in parameter.opts
+        if name.startswith("-")
+    }
+
+    assert typer_options | {"--help"} == FAST_OPTIONS | TYPER_ONLY_OPTIONS
+
+
+@pytest.mark.parametrize(
+    ("arguments", "expected"),
+    [
+        pytest.param(
+            ["script.py", "--flag", "-x", "value"],
+            RunArguments("script.py", ["--flag", "-x", "value"]),
+            id="target-arguments",
+        ),
+        pytest.param(
+            ["-v", "--config=dojo.toml", "-d", "pdb", "--no-cache", "-m", "package"],
+            RunArguments(
+                "package",
+                config_path=Path("dojo.toml"),
+                debugger=DebuggerType.PDB,
+                verbose=True,
+                module=True,
+                no_cache=True,
+            ),
+            id="options",
+        ),
+        pytest.param(
+            ["--warm", "-e", "pytest", "-q"],
+            RunArguments("pytest", ["-q"], executable=True, warm=True),
+            id="executable",
+        ),
+    ],
+)
+def test_parse_run(arguments: list[str], expected: RunArguments) -> None:
+    """Test that common `dojo run` invocations are parsed without typer."""
+    assert parse_run(arguments) == expected
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        pytest.param([], id="no-target"),
+        pytest.param(["--help"], id="help"),
+        pytest.param(["--profile", "script.py"], id="profile"),
+        pytest.param(["--unknown", "script.py"], id="unknown-option"),
+        pytest.param(["script.py", "-v"], id="option-after-target"),
+        pytest.param(["script.py", "-xv"], id="short-cluster-after-target"),
+        pytest.param(["script.py", "--config=dojo.toml"], id="long-after-target"),
+        pytest.param(["--", "script.py"], id="double-dash"),
+        pytest.param(["-d", "gdb", "script.py"], id="unknown-debugger"),
+        pytest.param(["-c"], id="missing-value"),
+        pytest.param(["-m", "-e", "pytest"], id="module-and-exec"),
+    ],
+)
+def test_parse_run_falls_back(arguments: list[str]) -> None:
+    """Test that anything typer would parse differently is left to typer."""
+    assert parse_run(arguments) is None
+
+
+def test_fast_path_exit_code(tmp_path: Path) -> None:
+    """Test that errors of the fast path end `dojo` with their exit code."""
+    result = subprocess.run(
+        [sys.executable, "-m", "debug_dojo", "run", "missing.py"],
+        capture_output=True,
+        check=False,
+        cwd=tmp_path,
+        text=True,
+    )
+
+    assert result.returncode == 1
+    assert "couldn't resolve path missing.py" in result.stdout
@@ -1,5 +1,9 @@
 """Tests for debug-dojo CLI config print command."""
 
+import pstats
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 from typer.testing import CliRunner
 
@@ -26,3 +30,121 @@ def test_target(
 
     assert result.exit_code == 0
     assert expected_dict_output in result.output
+
+
+def test_target_child_processes(runner: CliRunner, tmp_path: Path) -> None:
+    """Test that Python processes started by the target get the tools on request."""
+    config_path = tmp_path / "dojo.toml"
+    _ = config_path.write_text("subprocesses = true\n", encoding="utf-8")
+
+    result = runner.invoke(
+        cli, ["run", "-c", str(config_path), "tests/assets/main_children.py"]
+    )
+    default = runner.invoke(cli, ["run", "tests/assets/main_children.py"])
+
+    assert result.exit_code == 0
+    assert "child b: Breakpoint" in result.output
+    assert "child b: Breakpoint" not in default.output
+
+
+def test_target_profile(runner: CliRunner, test_target_busy: str) -> None:
+    """Test that a profiled target prints a summary of where the time went."""
+    result = runner.invoke(cli, ["run", "--profile", test_target_busy])
+
+    assert result.exit_code == 0
+    assert "samples every" in result.output
+    assert "spin (main_busy.py" in result.output
+
+
+def test_target_profile_output(
+    runner: CliRunner, test_target_busy: str, tmp_path: Path
+) -> None:
+    """Test that the profile can be written as collapsed stacks."""
+    output = tmp_path / "profile.txt"
+
+    result = runner.invoke(
+        cli, ["run", "--profile-output", str(output), test_target_busy]
+    )
+
+    assert result.exit_code == 0
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert any(";spin (main_busy.py" in line for line in lines)
+
+
+def test_target_cprofile(
+    runner: CliRunner, test_target_busy: str, tmp_path: Path
+) -> None:
+    """Test that a target can be profiled with cProfile."""
+    output = tmp_path / "busy.pstats"
+
+    result = runner.invoke(
+        cli,
+        ["run", "--cprofile", "--cprofile-output", str(output), test_target_busy],
+    )
+
+    assert result.exit_code == 0
+    assert "spin (main_busy.py" in result.output
+    assert pstats.Stats(str(output)).total_calls  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+
+
+def test_target_profilers_exclusive(runner: CliRunner, test_target_busy: str) -> None:
+    """Test that the sampling profiler and cProfile cannot be used together."""
+    result = runner.invoke(cli, ["run", "--profile", "--cprofile", test_target_busy])
+
+    assert result.exit_code == 1
+
+
+def test_target_trace_malloc(runner: CliRunner, test_target_busy: str) -> None:
+    """Test that memory allocations are reported at start and exit."""
+    result = runner.invoke(cli, ["run", "--trace-malloc", test_target_busy])
+
+    assert result.exit_code == 0
+    assert "Memory at start" in result.output
+    assert "Growth since start" in result.output
+
+
+def test_target_post_mortem_snapshot(
+    runner: CliRunner, test_target_exception: str, tmp_path: Path
+) -> None:
+    """Test that a failing target writes a snapshot that can be replayed."""
+    snapshot_dir = tmp_path / "snapshots"
+    config_path = tmp_path / "dojo.toml"
+    lines = [
+        "[exceptions]",
+        "post_mortem_snapshot = true",
+        f"snapshot_dir = {str(snapshot_dir)!r}",
+    ]
+    _ = config_path.write_text("\n".join(lines), encoding="utf-8")
+
+    result = runner.invoke(cli, ["run", "-c", str(config_path), test_target_exception])
+
+    assert result.exit_code == 1
+    assert "Wrote post-mortem snapshot" in result.output
+    (snapshot,) = snapshot_dir.iterdir()
+
+    result = runner.invoke(cli, ["replay", "--no-browse", str(snapshot)])
+
+    assert result.exit_code == 0
+    assert "ValueError" in result.output
+    assert "Locals of main" in result.output
+
+
+def test_target_post_mortem_without_terminal(
+    runner: CliRunner, test_target_exception: str, tmp_path: Path
+) -> None:
+    """Test that without a terminal, a snapshot is written instead of a session."""
+    snapshot_dir = tmp_path / "snapshots"
+    config_path = tmp_path / "dojo.toml"
+    lines = ["[exceptions]", f"snapshot_dir = {str(snapshot_dir)!r}"]
+    _ = config_path.write_text("\n".join(lines), encoding="utf-8")
+
+    with patch("ipdb.post_mortem") as session:
+        result = runner.invoke(
+            cli, ["run", "-c", str(config_path), test_target_exception]
+        )
+
+    assert result.exit_code == 1
+    assert "Skipping post-mortem" in result.output
+    assert "Wrote post-mortem snapshot" in result.output
+    assert len(list(snapshot_dir.iterdir())) == 1
+    session.assert_not_called()
@@ -1,11 +1,30 @@
 """Provide constants for tests."""
 
+from pathlib import Path
+
 import pytest
 from typer.testing import CliRunner
 
+from debug_dojo._cache import CACHE_DIR_ENV_VAR
 from debug_dojo._config_models import DebugDojoConfig
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Path:
+    """Point the debug-dojo cache to a temporary directory.
+
+    Returns:
+        Path: The temporary cache directory.
+
+    """
+    cache_path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(cache_path))
+    return cache_path
+
+
 @pytest.fixture
 def config() -> DebugDojoConfig:
     """Provide a default config for tests.
@@ -39,6 +58,28 @@ def test_target_inspect() -> str:
     return "tests/assets/main_inspect.py"
 
 
+@pytest.fixture
+def test_target_busy() -> str:
+    """Provide a path to a CPU-bound test target file for profiling.
+
+    Returns:
+        str: The path to a test target script that keeps the CPU busy.
+
+    """
+    return "tests/assets/main_busy.py"
+
+
+@pytest.fixture
+def test_target_exception() -> str:
+    """Provide a path to a test target file that raises an exception.
+
+    Returns:
+        str: The path to a test target script that fails.
+
+    """
+    return "tests/assets/main_exception.py"
+
+
 @pytest.fixture
 def expected_dict_output() -> str:
     """Provide the expected output of the example_dict inspection.
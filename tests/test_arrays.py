@@ -0,0 +1,172 @@
+"""Test the element-wise comparison of arrays and tables."""
+
+from __future__ import annotations
+
+import io
+from array import array
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+from debug_dojo._arrays import compare_arrays, is_array_like, is_tabular
+from debug_dojo._compare import inspect_objects_side_by_side
+from debug_dojo._diff import ChangeKind, diff_objects
+
+LARGE_SIZE = 1_000_000
+MAX_OUTPUT_LENGTH = 5_000
+"""Upper bound on the rendered comparison of two large arrays, in characters."""
+
+
+class _ArrayWrapper:
+    """A duck-typed array exposing `__array__`, like NumPy-backed containers."""
+
+    def __init__(self, values: array[float], dtype: str = "float64") -> None:
+        self._values: array[float] = values
+        self.dtype: str = dtype
+
+    def __array__(self) -> memoryview:  # noqa: PLW3201
+        return memoryview(self._values)
+
+
+class _Table:
+    """A duck-typed table with named columns, like a DataFrame."""
+
+    def __init__(
+        self, labelled: dict[object, list[float]] | None = None, /, **named: list[float]
+    ) -> None:
+        columns: dict[object, list[float]] = {**(labelled or {}), **named}
+        self._columns: dict[object, _ArrayWrapper] = {
+            label: _ArrayWrapper(array("d", values))
+            for label, values in columns.items()
+        }
+        rows = max(map(len, columns.values()), default=0)
+        self.shape: tuple[int, int] = (rows, len(columns))
+
+    @property
+    def columns(self) -> list[object]:
+        """The column labels."""
+        return list(self._columns)
+
+    def __array__(self) -> memoryview:  # noqa: PLW3201
+        return memoryview(array("d"))
+
+    def __getitem__(self, label: object) -> _ArrayWrapper:
+        return self._columns[label]
+
+
+def test_detection() -> None:
+    """Test that arrays and tables are detected by duck typing."""
+    assert is_array_like(array("i", [1]))
+    assert is_array_like(memoryview(b"ab"))
+    assert is_array_like(_ArrayWrapper(array("d")))
+    assert not is_array_like([1, 2])
+    assert not is_array_like(_ArrayWrapper)
+    assert is_tabular(_Table(a=[1.0]))
+    assert not is_tabular(_ArrayWrapper(array("d")))
+
+
+def test_identical_arrays() -> None:
+    """Test that equal arrays, including NaNs in the same place, are identical."""
+    left = array("d", [1.0, float("nan"), 3.0])
+    right = array("d", [1.0, float("nan"), 3.0])
+
+    comparison = compare_arrays(left, right)
+
+    assert comparison.identical
+    assert comparison.size == len(left)
+
+
+def test_differing_elements() -> None:
+    """Test the count, maximal difference and sample of differing elements."""
+    left = array("d", range(10))
+    right = array("d", range(10))
+    right[3] = 30.0
+    right[7] = float("nan")
+
+    comparison = compare_arrays(left, right, sample_size=1)
+
+    assert comparison.differing == 2  # noqa: PLR2004
+    assert comparison.max_abs_difference == pytest.approx(27.0)
+    assert comparison.sample == ((3,),)
+
+
+def test_multidimensional_indices() -> None:
+    """Test that differing indices are reported per dimension."""
+    left = memoryview(array("i", range(6))).cast("B").cast("i", (2, 3))
+    right = memoryview(array("i", [0, 1, 2, 3, 9, 5])).cast("B").cast("i", (2, 3))
+
+    comparison = compare_arrays(left, right)
+
+    assert comparison.left_shape == (2, 3)
+    assert comparison.sample == ((1, 1),)
+
+
+def test_shape_mismatch() -> None:
+    """Test that arrays of different shapes are not compared element-wise."""
+    comparison = compare_arrays(array("d", [1.0]), array("d", [1.0, 2.0]))
+
+    assert comparison.differing is None
+    assert not comparison.identical
+
+
+def test_array_interface_dtype() -> None:
+    """Test that `__array__` objects are converted and report their dtype."""
+    left = _ArrayWrapper(array("d", [1.0, 2.0]))
+    right = _ArrayWrapper(array("d", [1.0, 2.5]), dtype="float32")
+
+    comparison = compare_arrays(left, right)
+
+    assert (comparison.left_dtype, comparison.right_dtype) == ("float64", "float32")
+    assert comparison.differing == 1
+
+
+def test_tables_aligned_by_column() -> None:
+    """Test that tables are compared column by column."""
+    left = _Table(price=[1.0, 2.0], volume=[10.0, 20.0], legacy=[0.0, 0.0])
+    right = _Table(volume=[10.0, 25.0], price=[1.0, 2.0], added=[1.0, 1.0])
+
+    comparison = compare_arrays(left, right)
+
+    assert comparison.left_only == ("legacy",)
+    assert comparison.right_only == ("added",)
+    assert comparison.differing == 1
+    assert comparison.sample == ((1, "volume"),)
+
+
+def test_tables_with_non_string_labels() -> None:
+    """Test that columns are looked up by their labels, not by their names."""
+    left = _Table({0: [1.0, 2.0], 1: [3.0, 4.0]})
+    right = _Table({0: [1.0, 2.0], 1: [3.0, 5.0], 2: [0.0, 0.0]})
+
+    comparison = compare_arrays(left, right)
+
+    assert comparison.differing == 1
+    assert comparison.sample == ((1, "1"),)
+    assert comparison.right_only == ("2",)
+
+
+def test_nested_arrays_in_diff() -> None:
+    """Test that the structural diff compares nested arrays by value."""
+    left = SimpleNamespace(same=array("d", [1.0]), changed=array("d", [1.0]))
+    right = SimpleNamespace(same=array("d", [1.0]), changed=array("d", [2.0]))
+
+    differences = diff_objects(left, right).differences
+
+    assert [(d.path, d.kind) for d in differences] == [(".changed", ChangeKind.CHANGED)]
+
+
+def test_inspect_side_by_side_summarizes_arrays() -> None:
+    """Test that large arrays are summarized instead of rendered."""
+    left = array("d", range(LARGE_SIZE))
+    right = array("d", range(LARGE_SIZE))
+    right[-1] = -1.0
+    output = io.StringIO()
+
+    inspect_objects_side_by_side(left, right, console=Console(file=output, width=120))
+
+    rendered = output.getvalue()
+    assert "Array comparison" in rendered
+    assert "1 of 1,000,000" in rendered
+    assert "[999999]" in rendered
+    assert len(rendered) < MAX_OUTPUT_LENGTH
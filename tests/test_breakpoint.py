@@ -0,0 +1,175 @@
+"""Test the conditional breakpoints installed as `b`."""
+
+import os
+import sys
+from collections.abc import Iterator
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from debug_dojo._breakpoint import Breakpoint, post_mortem
+
+HITS = 100
+EVERY = 10
+AFTER = 45
+
+
+@pytest.fixture
+def debugger() -> Iterator[MagicMock]:
+    """Replace the debugger entry point, recording the frames it is started in.
+
+    Yields:
+        MagicMock: The mocked entry point.
+
+    """
+    with patch("debug_dojo._breakpoint._enter_debugger") as mock:
+        yield mock
+
+
+def test_condition(debugger: MagicMock) -> None:
+    """Test that the breakpoint stops only when its condition holds."""
+    b = Breakpoint()
+
+    b(False)  # noqa: FBT003
+    b(0)
+    b([1])
+
+    debugger.assert_called_once()
+
+
+def test_every(debugger: MagicMock) -> None:
+    """Test that `every` stops on every n-th hit of the call site."""
+    b = Breakpoint()
+
+    for _ in range(HITS):
+        b(every=EVERY)
+
+    assert debugger.call_count == HITS // EVERY
+
+
+def test_after_counts_conditional_hits(debugger: MagicMock) -> None:
+    """Test that `after` skips the first hits, counting only those that held."""
+    b = Breakpoint()
+
+    for index in range(HITS):
+        b(index % 2 == 0, after=AFTER)
+
+    assert debugger.call_count == HITS // 2 - AFTER
+
+
+def test_once_per_call_site(debugger: MagicMock) -> None:
+    """Test that `once` stops a single time at each call site."""
+    b = Breakpoint()
+
+    for _ in range(HITS):
+        b(once=True)
+        b(once=True)
+
+    assert debugger.call_count == 2  # noqa: PLR2004
+
+    b.reset()
+    b(once=True)
+    assert debugger.call_count == 3  # noqa: PLR2004
+
+
+def test_disable(debugger: MagicMock) -> None:
+    """Test that a disabled breakpoint never stops until enabled again."""
+    b = Breakpoint()
+
+    b.disable()
+    b()
+    debugger.assert_not_called()
+
+    b.enable()
+    b()
+    debugger.assert_called_once()
+
+
+@patch("pdb.Pdb")
+def test_pdb_stops_in_caller(mock_pdb: MagicMock) -> None:
+    """Test that PDB is started in the frame calling `b`, not inside it."""
+    with patch.dict(os.environ, {"PYTHONBREAKPOINT": "pdb.set_trace"}):
+        Breakpoint()()
+
+    set_trace = cast("MagicMock", mock_pdb.return_value.set_trace)  # pyright: ignore[reportAny]
+    set_trace.assert_called_once_with(sys._getframe())  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+@patch("pudb._get_debugger")
+def test_pudb_stops_in_caller(get_debugger: MagicMock) -> None:
+    """Test that PuDB is started in the frame calling `b`, not inside it."""
+    with (
+        patch.dict(os.environ, {"PYTHONBREAKPOINT": "pudb.set_trace"}),
+        patch("pudb.set_interrupt_handler"),
+    ):
+        Breakpoint()()
+
+    set_trace = cast("MagicMock", get_debugger.return_value.set_trace)  # pyright: ignore[reportAny]
+    set_trace.assert_called_once_with(sys._getframe())  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+@patch("debugpy.server.api._settrace")
+def test_debugpy_stops_in_caller(settrace: MagicMock) -> None:
+    """Test that Debugpy suspends in the frame calling `b`, not inside it."""
+    with (
+        patch.dict(os.environ, {"PYTHONBREAKPOINT": "debugpy.breakpoint"}),
+        patch("debugpy.server.api.is_client_connected", return_value=True),
+    ):
+        Breakpoint()()
+
+    assert settrace.call_args.kwargs["stop_at_frame"] is sys._getframe()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def test_other_debugger_started_by_name() -> None:
+    """Test that a debugger without frame support is started through its hook."""
+    with (
+        patch.dict(os.environ, {"PYTHONBREAKPOINT": "string.capwords"}),
+        patch("string.capwords") as hook,
+    ):
+        Breakpoint()()
+
+    hook.assert_called_once_with()
+
+
+def test_breakpoints_disabled_by_environment() -> None:
+    """Test that `PYTHONBREAKPOINT=0` disables the breakpoint like `breakpoint()`."""
+    with (
+        patch.dict(os.environ, {"PYTHONBREAKPOINT": "0"}),
+        patch("sys.breakpointhook") as hook,
+    ):
+        Breakpoint()()
+
+    hook.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("hook", "entry_point"),
+    [
+        pytest.param("pdb.set_trace", "pdb.post_mortem", id="pdb"),
+        pytest.param("ipdb.set_trace", "ipdb.post_mortem", id="ipdb"),
+        pytest.param("pudb.set_trace", "pudb.post_mortem", id="pudb"),
+    ],
+)
+def test_post_mortem_uses_configured_debugger(hook: str, entry_point: str) -> None:
+    """Test that the post-mortem session is started by the selected debugger."""
+    traceback = MagicMock()
+    with (
+        patch.dict(os.environ, {"PYTHONBREAKPOINT": hook}),
+        patch(entry_point) as session,
+    ):
+        assert post_mortem(traceback)
+
+    session.assert_called_once_with(traceback)
+
+
+@pytest.mark.parametrize("hook", ["0", "debugpy.breakpoint"])
+def test_post_mortem_unavailable(hook: str) -> None:
+    """Test that no session is started when the debugger cannot have one."""
+    with (
+        patch.dict(os.environ, {"PYTHONBREAKPOINT": hook}),
+        patch("pdb.post_mortem") as session,
+    ):
+        assert not post_mortem(MagicMock())
+
+    session.assert_not_called()
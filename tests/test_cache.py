@@ -0,0 +1,101 @@
+"""Test the `_cache` module."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from debug_dojo._cache import (
+    clear_cache,
+    load_cached_config,
+    store_cached_config,
+)
+from debug_dojo._config import load_config
+from debug_dojo._config_models import DebugDojoConfig, DebuggerType
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    """Create a config file.
+
+    Returns:
+        Path: The path to the created configuration file.
+
+    """
+    config_path = tmp_path / "dojo.toml"
+    _ = config_path.write_text('[debuggers]\ndefault = "pudb"\n', encoding="utf-8")
+    return config_path.resolve()
+
+
+def test_store_and_load(config_file: Path) -> None:
+    """Test that a stored configuration is loaded back."""
+    config = DebugDojoConfig()
+    config.debuggers.default = DebuggerType.PDB
+    store_cached_config(config_file, config)
+
+    assert load_cached_config(config_file) == config
+
+
+def test_miss_without_entry(config_file: Path) -> None:
+    """Test that a missing entry is a cache miss."""
+    assert load_cached_config(config_file) is None
+
+
+def test_invalidated_on_change(config_file: Path) -> None:
+    """Test that modifying the configuration file invalidates the entry."""
+    store_cached_config(config_file, DebugDojoConfig())
+    _ = config_file.write_text('[debuggers]\ndefault = "ipdb"\n', encoding="utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_cached_config(config_file) is None
+
+
+def test_corrupted_entry(config_file: Path, isolated_cache: Path) -> None:
+    """Test that a corrupted entry is treated as a cache miss."""
+    store_cached_config(config_file, DebugDojoConfig())
+    for entry in isolated_cache.rglob("*.pickle"):
+        _ = entry.write_bytes(b"not a pickle")
+
+    assert load_cached_config(config_file) is None
+
+
+def test_clear_cache(config_file: Path) -> None:
+    """Test that clearing the cache removes entries."""
+    store_cached_config(config_file, DebugDojoConfig())
+
+    assert clear_cache() == 1
+    assert load_cached_config(config_file) is None
+
+
+@patch("debug_dojo._config.load_raw_config")
+def test_load_config_skips_parsing(
+    mock_load_raw_config: MagicMock, config_file: Path
+) -> None:
+    """Test that a cached configuration is neither parsed nor validated again."""
+    mock_load_raw_config.return_value = {"debuggers": {"default": "pudb"}}
+    first = load_config(config_file)
+    second = load_config(config_file)
+
+    assert first == second
+    mock_load_raw_config.assert_called_once()
+
+
+@patch("debug_dojo._config.load_raw_config")
+def test_load_config_no_cache(
+    mock_load_raw_config: MagicMock, config_file: Path
+) -> None:
+    """Test that the cache can be bypassed."""
+    mock_load_raw_config.return_value = {"debuggers": {"default": "pudb"}}
+    _ = load_config(config_file, use_cache=False)
+    _ = load_config(config_file, use_cache=False)
+
+    assert mock_load_raw_config.call_count == 2  # noqa: PLR2004
+
+
+def test_override_does_not_leak_into_cache(config_file: Path) -> None:
+    """Test that a debugger override is not stored in the cache."""
+    _ = load_config(config_file, debugger=DebuggerType.PDB)
+
+    assert load_config(config_file).debuggers.default == DebuggerType.PUDB
@@ -0,0 +1,101 @@
+"""Test installing debug-dojo in child processes."""
+
+import os
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+
+import pytest
+
+from debug_dojo._children import CHILD_CONFIG_ENV_VAR, child_config, propagated
+from debug_dojo._config_models import DebugDojoConfig, DebuggerType, InstallMode
+
+CHILD = (
+    "import builtins, sys;"
+    "print(type(getattr(builtins, 'b', None)).__name__);"
+    "print(getattr(builtins, 'chained', False));"
+    "print(any('debug-dojo-' in entry for entry in sys.path));"
+    "print(any(name in sys.modules for name in ('dacite', 'tomlkit', 'typer')))"
+)
+
+
+def _run_child() -> list[str]:
+    """Run a child interpreter and report its tools.
+
+    Returns:
+        list[str]: The type of `b`, whether a project `sitecustomize` ran, whether
+            the bootstrap directory is left on `sys.path`, and whether the
+            configuration was parsed again.
+
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", CHILD], capture_output=True, check=True, text=True
+    )
+    return result.stdout.split()
+
+
+def test_child_has_tools() -> None:
+    """Test that a child gets the tools without parsing the configuration again."""
+    with propagated(DebugDojoConfig()):
+        assert _run_child() == ["Breakpoint", "False", "False", "False"]
+
+
+def test_child_uses_install_mode() -> None:
+    """Test that the child installs the tools of the parent's configuration."""
+    config = DebugDojoConfig(install_mode=InstallMode.DISABLED)
+
+    with propagated(config):
+        assert _run_child()[0] == "function"
+
+
+def test_project_sitecustomize_still_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a `sitecustomize` shadowed by the bootstrap one is run as well."""
+    _ = (tmp_path / "sitecustomize.py").write_text(
+        "import builtins\nbuiltins.chained = True\n", encoding="utf-8"
+    )
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+
+    with propagated(DebugDojoConfig()):
+        assert _run_child()[:2] == ["Breakpoint", "True"]
+
+
+def test_project_sitecustomize_runs_without_debug_dojo(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the shadowed `sitecustomize` runs where debug-dojo is missing."""
+    project, unavailable = tmp_path / "project", tmp_path / "unavailable"
+    (unavailable / "debug_dojo").mkdir(parents=True)
+    project.mkdir()
+    _ = (unavailable / "debug_dojo" / "__init__.py").write_text(
+        "raise ImportError\n", encoding="utf-8"
+    )
+    _ = (project / "sitecustomize.py").write_text(
+        "import builtins\nbuiltins.chained = True\n", encoding="utf-8"
+    )
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([str(unavailable), str(project)]))
+
+    with propagated(DebugDojoConfig()):
+        assert _run_child()[:2] == ["NoneType", "True"]
+
+
+def test_environment_restored(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the environment and the temporary directory are cleaned up."""
+    monkeypatch.delenv("PYTHONPATH", raising=False)
+
+    with propagated(DebugDojoConfig()) as directory:
+        assert os.environ["PYTHONPATH"] == str(directory)
+
+    assert "PYTHONPATH" not in os.environ
+    assert CHILD_CONFIG_ENV_VAR not in os.environ
+    assert not directory.exists()
+
+
+def test_debugpy_children_use_pdb() -> None:
+    """Test that children of a debugpy run do not try to listen on its port."""
+    config = DebugDojoConfig()
+    config.debuggers.default = DebuggerType.DEBUGPY
+
+    assert child_config(config).debuggers.default is DebuggerType.PDB
+    assert config.debuggers.default is DebuggerType.DEBUGPY
@@ -1,13 +1,40 @@
 """Test the compare utilities."""
 
+import gc
+import io
+import time
+import timeit
+from collections.abc import Callable
+from functools import cached_property
+from itertools import islice
+from types import SimpleNamespace
+from typing import cast
+
+import pytest
+from rich.console import Console
 from rich.text import Text
 
 from debug_dojo._compare import (
+    _TYPE_MEMBERS,  # pyright: ignore[reportPrivateUsage]
+    bounded_repr,
     get_object_attributes,
     get_object_methods,
     get_simplified_object_info,
+    inspect_objects_side_by_side,
+    iter_simplified_object_info,
 )
 
+FLAT_LATENCY_FACTOR = 10
+"""Allowed slowdown when the inspected object grows a thousandfold."""
+FLAT_LATENCY_SLACK = 0.01
+"""Absolute time, in seconds, below which timings are considered noise."""
+MEMBER_CACHE_SPEEDUP = 3
+"""Required speedup of cached member listing over a plain `dir` walk."""
+SLOW_PROPERTY_SECONDS = 2
+"""Duration of a property that must be interrupted by the time budget."""
+STREAMED_LINES = 5
+"""Lines taken from a streamed inspection: class, blank, title and 2 attributes."""
+
 
 def test_get_object_attributes() -> None:
     """Test that object attributes are correctly extracted."""
@@ -72,3 +99,309 @@ def test_get_simplified_object_info_custom_object() -> None:
     assert any(isinstance(line, Text) and "MyClass" in line.plain for line in info)
     assert any(isinstance(line, Text) and "x=10" in line.plain for line in info)
     assert any(isinstance(line, Text) and "my_method" in line.plain for line in info)
+
+
+def test_get_object_attributes_paged() -> None:
+    """Test that attributes are capped per page with a marker for the rest."""
+    obj = SimpleNamespace(**{f"attr_{index:02}": index for index in range(25)})
+
+    first_page = get_object_attributes(obj, max_members=10)
+    last_page = get_object_attributes(obj, max_members=10, page=2)
+
+    assert first_page[0] == "attr_00=0"
+    assert first_page[-1] == "... 15 more (page=1)"
+    assert len(first_page) == 11  # noqa: PLR2004
+    assert last_page == [f"attr_{index}={index}" for index in range(20, 25)]
+
+
+def test_get_object_attributes_truncated() -> None:
+    """Test that attribute values are truncated to the repr budget."""
+    obj = SimpleNamespace(data="x" * 10_000)
+
+    (attribute,) = get_object_attributes(obj, max_repr_length=50)
+
+    assert attribute.startswith("data='xxx")
+    assert len(attribute) == len("data=") + 50
+
+
+def test_bounded_repr_unsortable() -> None:
+    """Test that containers are truncated without sorting them."""
+    assert bounded_repr({3: "c", 1: "a", 2: "b"}) == "{3: 'c', 1: 'a', 2: 'b'}"
+    assert bounded_repr(set(range(100))) == "{0, 1, 2, 3, 4, 5, ...}"
+
+
+def test_inspect_objects_side_by_side_paged() -> None:
+    """Test that side-by-side output is rendered page by page."""
+    obj = SimpleNamespace(**{f"attr_{index:02}": index for index in range(25)})
+    console = Console(file=io.StringIO(), width=120)
+
+    inspect_objects_side_by_side(obj, obj, max_members=10, page=1, console=console)
+
+    output = cast(io.StringIO, console.file).getvalue()
+    assert "attr_10=10" in output
+    assert "attr_00=0" not in output
+    assert "5 more (page=2)" in output
+
+
+def _info_time(obj: object) -> float:
+    """Measure the time to build the simplified info of an object.
+
+    Returns:
+        float: The best time out of a few runs, in seconds.
+
+    """
+    return min(
+        timeit.repeat(lambda: get_simplified_object_info(obj), number=1, repeat=3)
+    )
+
+
+def _large_dict(size: int) -> object:
+    return dict.fromkeys(range(size), "value")
+
+
+def _large_set(size: int) -> object:
+    return set(range(size))
+
+
+def _large_object(size: int) -> object:
+    return SimpleNamespace(
+        data=list(range(size)), index={str(i): i for i in range(size)}
+    )
+
+
+@pytest.mark.parametrize("factory", [_large_dict, _large_set, _large_object])
+def test_benchmark_flat_latency(factory: Callable[[int], object]) -> None:
+    """Benchmark that rendering cost does not grow with the size of the object."""
+    small = _info_time(factory(1_000))
+    large = _info_time(factory(1_000_000))
+
+    assert large < max(small * FLAT_LATENCY_FACTOR, FLAT_LATENCY_SLACK)
+
+
+class _Member:
+    """A class with methods, a property, slots-free instance state and a callable."""
+
+    kind: str = "member"
+
+    def __init__(self) -> None:
+        self.value: int = 1
+        self.handler: Callable[..., None] = print
+
+    @property
+    def doubled(self) -> int:
+        """Twice the value."""
+        return self.value * 2
+
+    def run(self) -> None:
+        """Do something."""
+
+
+def _uncached_members(obj: object) -> tuple[list[str], list[str]]:
+    """List attributes and methods the way `dir` and `getattr` see them.
+
+    Returns:
+        tuple[list[str], list[str]]: Attribute names and method names.
+
+    """
+    values: dict[str, object] = {name: getattr(obj, name) for name in sorted(dir(obj))}
+    attributes = [
+        n for n, v in values.items() if not n.startswith("__") and not callable(v)
+    ]
+    methods = [n for n, v in values.items() if not n.startswith("_") and callable(v)]
+    return attributes, methods
+
+
+@pytest.mark.parametrize("obj", [_Member(), _Member, SimpleNamespace(a=1), io])
+def test_member_cache_matches_dir(obj: object) -> None:
+    """Test that the per-type cache lists the same members as a plain `dir` walk."""
+    attributes, methods = _uncached_members(obj)
+
+    for _ in range(2):
+        listed = get_object_attributes(obj)
+        assert [item.partition("=")[0] for item in listed] == attributes
+        assert get_object_methods(obj) == methods
+
+
+def test_member_cache_instance_state() -> None:
+    """Test that instance attributes shadowing methods are fetched per instance."""
+    plain, shadowed = _Member(), _Member()
+    shadowed.run = 42  # pyright: ignore[reportAttributeAccessIssue]
+    _ = get_object_methods(plain)
+
+    assert "run" in get_object_methods(plain)
+    assert "run" not in get_object_methods(shadowed)
+    assert "run=42" in get_object_attributes(shadowed)
+    assert "doubled=2" in get_object_attributes(plain)
+    assert "handler" in get_object_methods(plain)
+
+
+def test_member_cache_follows_patched_class() -> None:
+    """Test that members added to or removed from a class after caching are listed."""
+    cls = type("Patched", (_Member,), {"method": _Member.run})
+    obj = cls()
+    _ = get_object_methods(obj)
+
+    cls.added = _Member.run  # pyright: ignore[reportAttributeAccessIssue]
+    del cls.method  # pyright: ignore[reportAttributeAccessIssue]
+
+    assert "added" in get_object_methods(obj)
+    assert "method" not in get_object_methods(obj)
+
+
+def test_member_cache_evicted_with_type() -> None:
+    """Test that cached members are dropped when their class is garbage-collected."""
+    cls = type("Transient", (), {"method": _Member.run})
+    _ = get_object_methods(cls())
+    assert cls in _TYPE_MEMBERS
+
+    del cls
+    _ = gc.collect()
+
+    assert not any(key.__name__ == "Transient" for key in _TYPE_MEMBERS)
+
+
+def test_benchmark_member_cache() -> None:
+    """Benchmark listing members of many instances against a plain `dir` walk."""
+    namespace: dict[str, object] = {f"method_{i}": _Member.run for i in range(200)}
+    domain = type("Domain", (_Member,), namespace)
+    instances = [domain() for _ in range(200)]
+
+    def listed() -> None:
+        for obj in instances:
+            _ = get_object_methods(obj)
+
+    def walked() -> None:
+        for obj in instances:
+            _ = _uncached_members(obj)
+
+    cached_time = min(timeit.repeat(listed, number=1, repeat=3))
+    uncached_time = min(timeit.repeat(walked, number=1, repeat=3))
+
+    assert uncached_time / cached_time > MEMBER_CACHE_SPEEDUP
+
+
+class _Expensive:
+    """A class whose properties must not run in safe mode."""
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+        self.plain: int = 1
+
+    @property
+    def query(self) -> int:
+        """A property with a side effect."""
+        self.calls += 1
+        return 42
+
+    @cached_property
+    def aggregate(self) -> int:
+        """A cached property with a side effect."""
+        self.calls += 1
+        return 7
+
+    @property
+    def slow(self) -> int:
+        """A property that takes far too long."""
+        time.sleep(SLOW_PROPERTY_SECONDS)
+        return 0
+
+
+def test_safe_mode_skips_computed_members() -> None:
+    """Test that safe mode shows properties without evaluating them."""
+    obj = _Expensive()
+
+    attributes = get_object_attributes(obj, safe=True)
+    methods = get_object_methods(obj, safe=True)
+
+    assert obj.calls == 0
+    assert "query=<property>" in attributes
+    assert "aggregate=<cached_property>" in attributes
+    assert "plain=1" in attributes
+    assert "query" not in methods
+
+
+def test_safe_mode_reads_cached_values() -> None:
+    """Test that an already computed cached property is shown by value."""
+    obj = _Expensive()
+    _ = obj.aggregate
+
+    assert "aggregate=7" in get_object_attributes(obj, safe=True)
+    assert obj.calls == 1
+
+
+class _Counted:
+    """A class counting the evaluations of its property."""
+
+    def __init__(self) -> None:
+        self.calls: int = 0
+
+    @property
+    def query(self) -> int:
+        """A property with a side effect."""
+        self.calls += 1
+        return 42
+
+
+@pytest.mark.parametrize(
+    "info",
+    [get_simplified_object_info, iter_simplified_object_info],
+    ids=["full", "stream"],
+)
+def test_properties_evaluated_once(info: Callable[[object], object]) -> None:
+    """Test that listing attributes and methods evaluates each property once."""
+    obj = _Counted()
+
+    lines = [str(line) for line in cast("list[Text]", list(info(obj)))]  # pyright: ignore[reportArgumentType]
+
+    assert "  query=42" in lines
+    assert obj.calls == 1
+
+
+def test_attribute_timeout() -> None:
+    """Test that a slow attribute is interrupted after its time budget."""
+    started = time.monotonic()
+
+    attributes = get_object_attributes(_Expensive(), attribute_timeout=0.05)
+
+    assert time.monotonic() - started < SLOW_PROPERTY_SECONDS
+    assert "slow=<timed out after 0.05s>" in attributes
+    assert "query=42" in attributes
+
+
+def test_streamed_info_matches_list() -> None:
+    """Test that streaming produces the same lines as the eager inspection."""
+    obj = _Expensive()
+
+    streamed = [line.plain for line in iter_simplified_object_info(obj, safe=True)]
+    listed = [line.plain for line in get_simplified_object_info(obj, safe=True)]
+
+    assert streamed == listed
+
+
+def test_streamed_info_is_lazy() -> None:
+    """Test that streamed members are evaluated only when their line is reached."""
+    calls: list[str] = []
+
+    def counted(name: str) -> property:
+        def getter(_: object) -> None:
+            calls.append(name)
+
+        return property(getter)
+
+    namespace = {f"value_{index:04}": counted(f"{index}") for index in range(1000)}
+    obj = cast("object", type("Wide", (), namespace)())
+
+    lines = list(islice(iter_simplified_object_info(obj), STREAMED_LINES))
+
+    assert lines[-1].plain == "  value_0001=None"
+    assert calls == ["0", "1"]
+
+
+def test_streamed_info_capped() -> None:
+    """Test that streaming stops after `max_members` members with a marker."""
+    obj = SimpleNamespace(**{f"value_{index}": index for index in range(10)})
+
+    lines = [line.plain for line in iter_simplified_object_info(obj, max_members=3)]
+
+    assert "  value_3=3" not in lines
+    assert "  ... more (page=1)" in lines
@@ -1,18 +1,30 @@
 """Test the `_config` module."""
 
+import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from typer import Exit
 
 from debug_dojo._config import (
+    detect_config_version,
+    discover_config_path,
     load_config,
     load_raw_config,
     resolve_config_path,
     validated_and_updated_config,
 )
-from debug_dojo._config_models import DebugDojoConfig, DebuggerType
+from debug_dojo._config_models import (
+    DebugDojoConfig,
+    DebuggersConfig,
+    DebuggerType,
+    InstallMode,
+)
+
+INSPECT_TIMEOUT_MS = 5
+INSPECT_MAX_MEMBERS = 7
+DOCS_CONFIGURATION = Path(__file__).parents[1] / "docs" / "configuration.md"
 
 
 @pytest.fixture
@@ -32,6 +44,26 @@ default = "pudb"
     return config_path
 
 
+@pytest.fixture
+def fresh_discovery(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reset the in-process memo of discovered configuration paths."""
+    monkeypatch.setattr("debug_dojo._config._discovered", {})
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> Path:
+    """Create a repository with a nested package directory.
+
+    Returns:
+        Path: The repository root.
+
+    """
+    root = tmp_path / "repo"
+    (root / ".git").mkdir(parents=True)
+    (root / "package" / "module").mkdir(parents=True)
+    return root
+
+
 def test_resolve_config_path_exists(tmp_path: Path) -> None:
     """Test that the config path is resolved correctly when it exists."""
     config_path = tmp_path / "dojo.toml"
@@ -67,12 +99,94 @@ def test_validated_and_updated_config_invalid() -> None:
         _ = validated_and_updated_config(raw_config, verbose=False)
 
 
+@pytest.mark.parametrize(
+    ("raw_config", "version"),
+    [
+        pytest.param({}, 3, id="empty"),
+        pytest.param({"install_mode": "eager"}, 3, id="v3"),
+        pytest.param({"gamification": False}, 2, id="v2"),
+        pytest.param(
+            {"gamification": True, "install_mode": "eager"}, 3, id="v3-gamification"
+        ),
+        pytest.param({"features": {"safe_inspect": True}}, 3, id="v3-bool-features"),
+        pytest.param({"debugger": "pdb"}, 1, id="v1-debugger"),
+        pytest.param({"features": {"comparer": False}}, 1, id="v1-features"),
+        pytest.param({"version": 2, "features": {"comparer": "c"}}, 2, id="explicit"),
+    ],
+)
+def test_detect_config_version(raw_config: dict[str, object], version: int) -> None:
+    """Test that the schema version is detected from the raw configuration."""
+    assert detect_config_version(raw_config) == version  # pyright: ignore[reportArgumentType]
+
+
+def test_validated_v3_only_field() -> None:
+    """Test that a field only present in the current model validates."""
+    raw_config = {"install_mode": "eager"}
+    config = validated_and_updated_config(raw_config, verbose=False)
+    assert config.install_mode == InstallMode.EAGER
+
+
+def test_validated_and_updated_config_v1() -> None:
+    """Test that a version 1 configuration is upgraded."""
+    raw_config = {"debugger": "pdb", "features": {"comparer": False}}
+    config = validated_and_updated_config(raw_config, verbose=False)
+    assert config.debuggers.default == DebuggerType.PDB
+    assert not config.features.comparer
+
+
+def test_validated_and_updated_config_explicit_version() -> None:
+    """Test that an explicit version key selects the model and is not validated."""
+    raw_config = {"version": 2, "gamification": False}
+    config = validated_and_updated_config(raw_config, verbose=False)
+    assert isinstance(config, DebugDojoConfig)
+
+
+def test_validated_and_updated_config_unknown_version() -> None:
+    """Test that an unsupported version key is rejected."""
+    with pytest.raises(Exit):
+        _ = validated_and_updated_config({"version": 99}, verbose=False)
+
+
 def test_load_config(mock_config_file: Path) -> None:
     """Test that the config is loaded correctly."""
     config = load_config(mock_config_file)
     assert config.debuggers.default == DebuggerType.PUDB
 
 
+def test_load_documented_example(tmp_path: Path) -> None:
+    """Test that the example `dojo.toml` of the documentation loads."""
+    text = DOCS_CONFIGURATION.read_text(encoding="utf-8")
+    example = text.split("``` toml\n", 1)[1].split("```", 1)[0]
+    config_path = tmp_path / "dojo.toml"
+    _ = config_path.write_text(example, encoding="utf-8")
+
+    config = load_config(config_path, use_cache=False)
+
+    assert config == DebugDojoConfig(debuggers=DebuggersConfig(prompt_name="my-dojo> "))
+
+
+@pytest.mark.parametrize("version", ["", "version = 3\n"], ids=["inferred", "v3"])
+def test_load_inspection_features(tmp_path: Path, version: str) -> None:
+    """Test that the inspection settings of `[features]` load from a TOML file."""
+    config_path = tmp_path / "dojo.toml"
+    _ = config_path.write_text(
+        version
+        + "[features]\n"
+        + "safe_inspect = true\n"
+        + "attribute_timeout_ms = 5\n"
+        + "stream_inspect = true\n"
+        + "inspect_max_members = 7\n",
+        encoding="utf-8",
+    )
+
+    features = load_config(config_path, use_cache=False).features
+
+    assert features.safe_inspect
+    assert features.attribute_timeout_ms == INSPECT_TIMEOUT_MS
+    assert features.stream_inspect
+    assert features.inspect_max_members == INSPECT_MAX_MEMBERS
+
+
 def test_load_config_no_file() -> None:
     """Test that the default config is loaded when no file is found."""
     with patch("pathlib.Path.exists", return_value=False):
@@ -84,3 +198,80 @@ def test_load_config_override_debugger() -> None:
     """Test that the debugger can be overridden."""
     config = load_config(debugger=DebuggerType.IPDB)
     assert config.debuggers.default == DebuggerType.IPDB
+
+
+@pytest.mark.usefixtures("fresh_discovery")
+def test_discover_walks_up(repository: Path) -> None:
+    """Test that the configuration is found in a parent directory."""
+    config_path = repository / "dojo.toml"
+    config_path.touch()
+
+    start = repository / "package" / "module"
+    assert discover_config_path(start, use_cache=False) == config_path
+
+
+@pytest.mark.usefixtures("fresh_discovery")
+def test_discover_stops_at_vcs_root(repository: Path) -> None:
+    """Test that the search does not leave the repository."""
+    (repository.parent / "dojo.toml").touch()
+
+    start = repository / "package" / "module"
+    assert discover_config_path(start, use_cache=False) is None
+
+
+@pytest.mark.usefixtures("fresh_discovery")
+def test_discover_skips_unrelated_pyproject(repository: Path) -> None:
+    """Test that a `pyproject.toml` without a debug-dojo table is skipped."""
+    _ = (repository / "package" / "pyproject.toml").write_text(
+        '[project]\nname = "package"\ndependencies = ["debug_dojo"]\n',
+        encoding="utf-8",
+    )
+    root_pyproject = repository / "pyproject.toml"
+    _ = root_pyproject.write_text(
+        '[tool.debug_dojo.debuggers]\ndefault = "pdb"\n', encoding="utf-8"
+    )
+
+    start = repository / "package" / "module"
+    assert discover_config_path(start, use_cache=False) == root_pyproject
+
+
+@pytest.mark.usefixtures("fresh_discovery")
+def test_discover_memoized(repository: Path) -> None:
+    """Test that parents visited once are not searched again in-process."""
+    (repository / "dojo.toml").touch()
+    _ = discover_config_path(repository / "package" / "module", use_cache=False)
+
+    with patch("debug_dojo._config._directory_config") as mock_directory_config:
+        _ = discover_config_path(repository / "package", use_cache=False)
+        mock_directory_config.assert_not_called()
+
+
+def test_discover_disk_cache(
+    repository: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the on-disk memo is reused and invalidated by new files."""
+    start = repository / "package" / "module"
+    monkeypatch.setattr("debug_dojo._config._discovered", {})
+    assert discover_config_path(start) is None
+
+    monkeypatch.setattr("debug_dojo._config._discovered", {})
+    with patch("debug_dojo._config._directory_config") as mock_directory_config:
+        assert discover_config_path(start) is None
+        mock_directory_config.assert_not_called()
+
+    config_path = repository / "package" / "dojo.toml"
+    config_path.touch()
+    stat = config_path.parent.stat()
+    os.utime(config_path.parent, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000))
+
+    monkeypatch.setattr("debug_dojo._config._discovered", {})
+    assert discover_config_path(start) == config_path
+
+
+@patch("debug_dojo._config.discover_config_path")
+def test_resolve_config_path_discovers(mock_discover: MagicMock) -> None:
+    """Test that without an explicit path the configuration is discovered."""
+    mock_discover.return_value = None
+    assert resolve_config_path(None, use_cache=False) is None
+    mock_discover.assert_called_once_with(Path.cwd().resolve(), use_cache=False)
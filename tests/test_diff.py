@@ -0,0 +1,143 @@
+"""Test the structural diff engine."""
+
+import io
+import timeit
+from types import SimpleNamespace
+
+from rich.console import Console
+
+from debug_dojo._compare import inspect_objects_side_by_side
+from debug_dojo._diff import ChangeKind, Difference, diff_objects
+
+SKIP_SPEEDUP_THRESHOLD = 5
+"""Required speedup of a shared-subtree diff over a fully differing one."""
+TRUNCATED_DIFFERENCES = 10
+
+
+def _paths(left: object, right: object) -> list[tuple[str, ChangeKind]]:
+    return [(d.path, d.kind) for d in diff_objects(left, right).differences]
+
+
+def test_identical_objects_have_no_differences() -> None:
+    """Test that equal but distinct structures produce an empty diff."""
+    left = {"a": [1, 2, {"b": {3, 4}}], "c": SimpleNamespace(x=1)}
+    right = {"a": [1, 2, {"b": {3, 4}}], "c": SimpleNamespace(x=1)}
+
+    assert diff_objects(left, right).differences == []
+
+
+def test_attributes_aligned_by_name() -> None:
+    """Test that object attributes are matched by name, not by position."""
+    left = SimpleNamespace(a=1, b=2, c=3)
+    right = SimpleNamespace(c=3, b=20, d=4)
+
+    assert _paths(left, right) == [
+        (".a", ChangeKind.REMOVED),
+        (".b", ChangeKind.CHANGED),
+        (".d", ChangeKind.ADDED),
+    ]
+
+
+def test_nested_containers() -> None:
+    """Test recursion into nested dicts, lists, tuples and sets."""
+    left = {"hosts": ["a", "b", "c"], "ports": (1, 2), "tags": {"x", "y"}}
+    right = {"hosts": ["a", "B"], "ports": (1, 2, 3), "tags": {"x", "z"}}
+
+    assert _paths(left, right) == [
+        ("['hosts'][1]", ChangeKind.CHANGED),
+        ("['hosts'][2]", ChangeKind.REMOVED),
+        ("['ports'][2]", ChangeKind.ADDED),
+        ("['tags']{'y'}", ChangeKind.REMOVED),
+        ("['tags']{'z'}", ChangeKind.ADDED),
+    ]
+
+
+def test_changed_values_are_reported() -> None:
+    """Test that a difference carries both values."""
+    result = diff_objects(SimpleNamespace(x=[1]), SimpleNamespace(x=[2]))
+
+    assert result.differences == [Difference(".x[0]", ChangeKind.CHANGED, 1, 2)]
+
+
+def test_hash_collisions_are_not_equal() -> None:
+    """Test that subtrees with colliding fingerprints are still compared."""
+    assert hash(-1) == hash(-2)
+
+    result = diff_objects({"a": [-1]}, {"a": [-2]})
+
+    assert result.differences == [Difference("['a'][0]", ChangeKind.CHANGED, -1, -2)]
+
+
+def test_type_mismatch_is_a_single_change() -> None:
+    """Test that values of different types are not recursed into."""
+    assert _paths({"a": [1, 2]}, {"a": (1, 2)}) == [("['a']", ChangeKind.CHANGED)]
+    assert _paths(1, 1.0) == [("", ChangeKind.CHANGED)]
+
+
+def test_cycles_terminate() -> None:
+    """Test that self-referencing structures are diffed without recursing forever."""
+    left: list[object] = [1]
+    left.append(left)
+    right: list[object] = [2]
+    right.append(right)
+
+    assert ("[0]", ChangeKind.CHANGED) in _paths(left, right)
+
+
+def test_max_differences_truncates() -> None:
+    """Test that the diff stops after `max_differences` differences."""
+    result = diff_objects(
+        list(range(100)), [-1] * 100, max_differences=TRUNCATED_DIFFERENCES
+    )
+
+    assert len(result.differences) == TRUNCATED_DIFFERENCES
+    assert result.truncated
+
+
+def test_identical_subtrees_are_skipped() -> None:
+    """Test that a diff does not walk branches shared by both objects."""
+    shared = [{"value": index, "items": list(range(20))} for index in range(2000)]
+    left = {"payload": shared, "version": 1}
+    right = {"payload": shared, "version": 2}
+    changed = {"payload": [{**item, "value": -1} for item in shared], "version": 2}
+
+    skip_time = min(
+        timeit.repeat(lambda: diff_objects(left, right), number=1, repeat=3)
+    )
+    full_time = min(
+        timeit.repeat(
+            lambda: diff_objects(left, changed, max_differences=10_000),
+            number=1,
+            repeat=3,
+        )
+    )
+
+    assert _paths(left, right) == [("['version']", ChangeKind.CHANGED)]
+    assert full_time / skip_time > SKIP_SPEEDUP_THRESHOLD
+
+
+def test_inspect_side_by_side_shows_diff() -> None:
+    """Test that the comparer renders only the differing paths."""
+    output = io.StringIO()
+    console = Console(file=output, width=160)
+
+    inspect_objects_side_by_side(
+        SimpleNamespace(same=1, changed="old"),
+        SimpleNamespace(same=1, changed="new"),
+        console=console,
+    )
+
+    rendered = output.getvalue()
+    assert "Differences" in rendered
+    assert ".changed" in rendered
+    assert ".same" not in rendered
+
+
+def test_inspect_side_by_side_identical() -> None:
+    """Test that identical objects are reported as such."""
+    output = io.StringIO()
+    console = Console(file=output, width=160)
+
+    inspect_objects_side_by_side([1, 2], [1, 2], console=console)
+
+    assert "No differences found." in output.getvalue()
@@ -2,28 +2,38 @@
 
 import builtins
 import os
+import signal
 import sys
-from collections.abc import Iterator
+import timeit
+from functools import partial
+from collections.abc import Callable, Iterator
+from typing import cast
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from debug_dojo._breakpoint import breakpointhook
 from debug_dojo._config_models import (
     DebugDojoConfig,
     DebuggerType,
     DebugpyConfig,
+    InstallMode,
     IpdbConfig,
     PdbConfig,
     PudbConfig,
 )
+from debug_dojo._inspect import inspect_object
 from debug_dojo._installers import (
     BREAKPOINT_ENV_VAR,
     IPDB_CONTEXT_SIZE,
+    LISTEN_SIGNAL,
+    LazyCallable,
     install_breakpoint,
     install_by_config,
     install_compare,
     install_features,
     install_inspect,
+    install_noops,
     install_rich_print,
     set_debugger,
     use_debugpy,
@@ -32,6 +42,9 @@ from debug_dojo._installers import (
     use_pudb,
 )
 
+NOOP_OVERHEAD_FACTOR = 2
+"""Allowed slowdown of a disabled tool call over calling an empty function."""
+
 
 @pytest.fixture(autouse=True)
 def cleanup_builtins() -> Iterator[None]:
@@ -71,6 +84,28 @@ def test_use_ipdb(mock_set_trace: MagicMock) -> None:
     assert sys.breakpointhook == mock_set_trace
 
 
+def test_use_ipdb_lazy() -> None:
+    """Test that the lazy IPDB hook leaves importing ipdb to the first breakpoint."""
+    use_ipdb(IpdbConfig(), lazy=True)
+    assert sys.breakpointhook is breakpointhook
+    assert os.environ[BREAKPOINT_ENV_VAR] == "ipdb.set_trace"
+
+
+@patch("pdb.Pdb")
+def test_lazy_hook_stops_in_caller(
+    mock_pdb: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that `breakpoint()` with the lazy hook stops at the call, not in a proxy."""
+    monkeypatch.setattr(sys, "breakpointhook", sys.breakpointhook)
+    monkeypatch.setenv(BREAKPOINT_ENV_VAR, "")
+    use_pdb(PdbConfig(), lazy=True)
+
+    breakpoint()  # noqa: T100
+
+    set_trace = cast("MagicMock", mock_pdb.return_value.set_trace)  # pyright: ignore[reportAny]
+    set_trace.assert_called_once_with(sys._getframe())  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
 @patch("debugpy.listen")
 @patch("debugpy.wait_for_client")
 @patch("debugpy.breakpoint")
@@ -88,6 +123,39 @@ def test_use_debugpy(
     mock_wait_for_client.assert_called_once()
 
 
+@patch("debugpy.listen")
+@patch("debugpy.wait_for_client")
+def test_use_debugpy_without_waiting(
+    mock_wait_for_client: MagicMock, mock_listen: MagicMock
+) -> None:
+    """Test that Debugpy listens without blocking if `wait_for_client` is unset."""
+    use_debugpy(DebugpyConfig(wait_for_client=False))
+    mock_listen.assert_called_once()
+    mock_wait_for_client.assert_not_called()
+
+
+@pytest.mark.skipif(not hasattr(signal, LISTEN_SIGNAL), reason="needs SIGUSR1")
+@patch("debugpy.listen")
+@patch("debugpy.wait_for_client")
+def test_use_debugpy_listen_on_signal(
+    mock_wait_for_client: MagicMock, mock_listen: MagicMock
+) -> None:
+    """Test that Debugpy starts listening on the first SIGUSR1 only, never waiting."""
+    listen_signal = cast("signal.Signals", getattr(signal, LISTEN_SIGNAL))
+    previous = signal.getsignal(listen_signal)
+    try:
+        use_debugpy(DebugpyConfig(port=5678, listen_on_signal=True))
+        mock_listen.assert_not_called()
+
+        signal.raise_signal(listen_signal)
+        signal.raise_signal(listen_signal)
+    finally:
+        _ = signal.signal(listen_signal, previous)
+
+    mock_listen.assert_called_once_with(("localhost", 5678))
+    mock_wait_for_client.assert_not_called()
+
+
 def test_inspect() -> None:
     """Test that the inspect function is installed in builtins."""
     install_inspect("i")
@@ -106,6 +174,95 @@ def test_breakpoint() -> None:
     assert hasattr(builtins, "b")
 
 
+def test_compare_lazy() -> None:
+    """Test that the lazy compare function resolves on first call."""
+    install_compare("c", lazy=True)
+    proxy = cast(object, builtins.c)  # pyright: ignore[reportAttributeAccessIssue]
+    assert isinstance(proxy, LazyCallable)
+    assert not proxy.resolved
+    _ = proxy(1, 2)
+    assert proxy.resolved
+
+
+def test_inspect_safe(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that safe inspection does not evaluate properties."""
+
+    class Record:
+        """A class with a property that must not run."""
+
+        @property
+        def expensive(self) -> int:
+            """A property with a side effect.
+
+            Raises:
+                AssertionError: Always, as it must not be evaluated.
+
+            """
+            raise AssertionError
+
+    install_inspect("i", safe=True, attribute_timeout=1.0)
+    inspect = cast("Callable[[object], None]", builtins.i)  # pyright: ignore[reportAttributeAccessIssue]
+    inspect(Record())
+
+    assert "expensive=<property>" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    ("options", "keywords"),
+    [
+        pytest.param({}, None, id="rich"),
+        pytest.param({"safe": True}, {"safe": True, "stream": False}, id="safe"),
+        pytest.param(
+            {"attribute_timeout": 1.0},
+            {"attribute_timeout": 1.0, "stream": False},
+            id="timeout",
+        ),
+        pytest.param({"stream": True}, {"stream": True}, id="stream"),
+        pytest.param(
+            {"max_members": 3}, {"max_members": 3, "stream": False}, id="max-members"
+        ),
+    ],
+)
+def test_inspect_options(
+    options: dict[str, object], keywords: dict[str, object] | None
+) -> None:
+    """Test that each inspection option on its own selects and sets up `i`."""
+    install_inspect("i", **options)  # pyright: ignore[reportArgumentType]
+    inspect = cast(object, builtins.i)  # pyright: ignore[reportAttributeAccessIssue]
+
+    if keywords is None:
+        assert not isinstance(inspect, partial)
+    else:
+        assert isinstance(inspect, partial)
+        assert keywords.items() <= inspect.keywords.items()
+
+
+@pytest.mark.parametrize("stream", [True, False])
+def test_inspect_stream(*, stream: bool) -> None:
+    """Test that streaming prints members as they are evaluated, and only then."""
+    events: list[str] = []
+
+    class Record:
+        """A class recording when its property is evaluated."""
+
+        @property
+        def value(self) -> int:
+            """A property recording its evaluation.
+
+            Returns:
+                int: Always 1.
+
+            """
+            events.append("evaluated")
+            return 1
+
+    console = MagicMock()
+    console.print.side_effect = lambda *_: events.append("printed")  # pyright: ignore[reportAny, reportUnknownLambdaType]
+    inspect_object(Record(), stream=stream, console=console)
+
+    assert (events.index("printed") < events.index("evaluated")) is stream
+
+
 def test_rich_print() -> None:
     """Test that the rich print function is installed in builtins."""
     install_rich_print("p")
@@ -131,9 +288,18 @@ def test_install_features(
 
     install_features(config.features)
 
-    mock_inspect.assert_called_once_with("i")
-    mock_rich_print.assert_called_once_with("p")
-    mock_compare.assert_called_once_with("c")
+    mock_inspect.assert_called_once_with(
+        "i",
+        lazy=False,
+        safe=False,
+        attribute_timeout=None,
+        stream=False,
+        max_members=None,
+    )
+    mock_rich_print.assert_called_once_with("p", lazy=False)
+    mock_compare.assert_called_once_with(
+        "c", lazy=False, safe=False, attribute_timeout=None
+    )
     mock_breakpoint.assert_called_once_with("b")
 
 
@@ -142,7 +308,7 @@ def test_set_debugger_pdb(mock_use_pdb: MagicMock, config: DebugDojoConfig) -> N
     """Test that the PDB debugger is set correctly."""
     config.debuggers.default = DebuggerType.PDB
     set_debugger(config.debuggers)
-    mock_use_pdb.assert_called_once_with(config.debuggers.pdb)
+    mock_use_pdb.assert_called_once_with(config.debuggers.pdb, lazy=False)
 
 
 @patch("debug_dojo._installers.install_features")
@@ -156,6 +322,75 @@ def test_install_by_config(
 ) -> None:
     """Test that the debugging tools are installed by config."""
     install_by_config(config)
-    mock_set_debugger.assert_called_once_with(config.debuggers)
-    mock_set_exceptions.assert_called_once_with(config.exceptions)
-    mock_install_features.assert_called_once_with(config.features)
+    mock_set_debugger.assert_called_once_with(config.debuggers, lazy=True)
+    mock_set_exceptions.assert_called_once_with(config.exceptions, lazy=True)
+    mock_install_features.assert_called_once_with(config.features, lazy=True)
+
+
+@patch("debug_dojo._installers.install_features")
+@patch("debug_dojo._installers.set_exceptions")
+@patch("debug_dojo._installers.set_debugger")
+def test_install_by_config_eager(
+    mock_set_debugger: MagicMock,
+    mock_set_exceptions: MagicMock,
+    mock_install_features: MagicMock,
+    config: DebugDojoConfig,
+) -> None:
+    """Test that the eager install mode disables the lazy proxies."""
+    config.install_mode = InstallMode.EAGER
+    install_by_config(config)
+    mock_set_debugger.assert_called_once_with(config.debuggers, lazy=False)
+    mock_set_exceptions.assert_called_once_with(config.exceptions, lazy=False)
+    mock_install_features.assert_called_once_with(config.features, lazy=False)
+
+
+@pytest.mark.parametrize(
+    ("install_mode", "environment"),
+    [
+        pytest.param(InstallMode.DISABLED, {}, id="config"),
+        pytest.param(InstallMode.LAZY, {BREAKPOINT_ENV_VAR: "0"}, id="environment"),
+    ],
+)
+@patch("debug_dojo._installers.install_features")
+@patch("debug_dojo._installers.set_exceptions")
+@patch("debug_dojo._installers.set_debugger")
+def test_install_by_config_disabled(  # noqa: PLR0913, PLR0917
+    mock_set_debugger: MagicMock,
+    mock_set_exceptions: MagicMock,
+    mock_install_features: MagicMock,
+    install_mode: InstallMode,
+    environment: dict[str, str],
+    config: DebugDojoConfig,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the disabled install mode installs no-op stubs only."""
+    monkeypatch.setattr(sys, "breakpointhook", sys.breakpointhook)
+    config.install_mode = install_mode
+
+    with patch.dict(os.environ, environment):
+        install_by_config(config)
+
+    mock_set_debugger.assert_not_called()
+    mock_set_exceptions.assert_not_called()
+    mock_install_features.assert_not_called()
+    for mnemonic in ("b", "c", "i", "p"):
+        stub = cast("Callable[..., object]", getattr(builtins, mnemonic))
+        assert stub(1, key=2) is None
+    assert sys.breakpointhook() is None  # noqa: T100
+
+
+def test_benchmark_noops(
+    config: DebugDojoConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a disabled tool costs no more than calling an empty function."""
+    monkeypatch.setattr(sys, "breakpointhook", sys.breakpointhook)
+    install_noops(config.features)
+
+    def empty(*_args: object, **_kwargs: object) -> None:
+        """Do nothing."""
+
+    disabled = cast("Callable[[], None]", builtins.b)  # pyright: ignore[reportAttributeAccessIssue]
+    noop_time = min(timeit.repeat(disabled, number=100_000, repeat=5))
+    empty_time = min(timeit.repeat(empty, number=100_000, repeat=5))
+
+    assert noop_time < empty_time * NOOP_OVERHEAD_FACTOR
@@ -0,0 +1,74 @@
+"""Test the memory allocation tracker."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+from debug_dojo._breakpoint import Breakpoint
+from debug_dojo._memory import MemoryTracker
+
+BLOCK_SIZE = 100_000
+BLOCKS = 10
+
+
+def _allocate() -> list[bytearray]:
+    return [bytearray(BLOCK_SIZE) for _ in range(BLOCKS)]
+
+
+ALLOCATION_SITE = f"test_memory.py:{_allocate.__code__.co_firstlineno + 1}"
+
+
+def test_growth_is_reported() -> None:
+    """Test that memory allocated in the tracked block is reported as growth."""
+    console = Console(width=200, record=True)
+
+    with MemoryTracker(console=console):
+        leak = _allocate()
+
+    text = console.export_text()
+    assert "Memory at start" in text
+    assert "Memory at exit" in text
+    assert "Growth since start" in text
+    *_, growth = (line for line in text.splitlines() if ALLOCATION_SITE in line)
+    assert "+977." in growth
+    assert len(leak) == BLOCKS
+
+
+def test_snapshot_at_breakpoint_hit() -> None:
+    """Test that every `b()` hit takes a snapshot."""
+    b = Breakpoint()
+    console = Console(width=200, record=True)
+
+    with (
+        patch.dict(os.environ, {"PYTHONBREAKPOINT": "0"}),
+        MemoryTracker(console=console),
+    ):
+        b()
+        b()
+
+    text = console.export_text()
+    assert text.count("Memory at b() at test_memory.py:") == 2  # noqa: PLR2004
+    assert "Growth since b() at test_memory.py:" in text
+
+
+def test_exception_snapshot() -> None:
+    """Test that the last snapshot is named after the exception."""
+    console = Console(width=200, record=True)
+
+    with pytest.raises(KeyError), MemoryTracker(console=console):
+        _ = dict[str, int]()["missing"]
+
+    assert "Memory at exit (KeyError)" in console.export_text()
+
+
+def test_traceback_sites() -> None:
+    """Test that allocation sites include their callers with more frames."""
+    console = Console(width=200, record=True)
+
+    with MemoryTracker(frames=2, console=console):
+        leak = _allocate()
+
+    assert f"{ALLOCATION_SITE} ← test_memory.py:" in console.export_text()
+    assert leak
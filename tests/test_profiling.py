@@ -0,0 +1,115 @@
+"""Test the sampling profiler."""
+
+import cProfile
+import json
+import timeit
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from debug_dojo._profiling import CallSort, SamplingProfiler, call_stats_table
+
+PROFILER_OVERHEAD = 1.5
+"""Allowed slowdown of a CPU-bound function while it is being profiled."""
+INTERVAL = 0.001
+MIN_SAMPLES = 5
+LEAF_CALLS = 200
+
+
+def _leaf() -> int:
+    return sum(range(20_000))
+
+
+def _work() -> int:
+    return sum(_leaf() for _ in range(LEAF_CALLS))
+
+
+def test_samples_hot_function() -> None:
+    """Test that most samples land in the function doing the work."""
+    with SamplingProfiler(interval=INTERVAL) as profiler:
+        _ = _work()
+
+    in_leaf = sum(
+        count
+        for stack, count in profiler.samples.items()
+        if stack[-1] is _leaf.__code__
+    )
+    assert profiler.total >= MIN_SAMPLES
+    assert in_leaf > profiler.total / 2
+
+
+def test_stacks_start_below_profiled_frame() -> None:
+    """Test that frames above the profiled block are not recorded."""
+    with SamplingProfiler(interval=INTERVAL) as profiler:
+        _ = _work()
+
+    lines = profiler.collapsed_stacks()
+    assert lines
+    assert all(line.startswith("_work (test_profiling.py") for line in lines)
+
+
+def test_collapsed_stacks(tmp_path: Path) -> None:
+    """Test that collapsed stacks list each stack with its number of samples."""
+    path = tmp_path / "profile.txt"
+    with SamplingProfiler(interval=INTERVAL) as profiler:
+        _ = _work()
+
+    profiler.write_collapsed(path)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == profiler.total
+    assert any(line.startswith("_work (test_profiling.py") for line in lines)
+
+
+def test_summary() -> None:
+    """Test that the summary shows the share of samples per call."""
+    with SamplingProfiler(interval=INTERVAL) as profiler:
+        _ = _work()
+    console = Console(width=120, record=True)
+
+    console.print(profiler.summary())
+
+    text = console.export_text()
+    assert f"{profiler.total} samples every 1 ms" in text
+    assert "_leaf (test_profiling.py" in text
+
+
+def test_benchmark_overhead() -> None:
+    """Test that sampling barely slows down the profiled code."""
+    plain = min(timeit.repeat(_work, number=1, repeat=3))
+
+    with SamplingProfiler():
+        profiled = min(timeit.repeat(_work, number=1, repeat=3))
+
+    assert profiled < plain * PROFILER_OVERHEAD
+
+
+def _render(table: Table) -> str:
+    console = Console(width=160, record=True)
+    console.print(table)
+    return console.export_text()
+
+
+def test_call_stats_table() -> None:
+    """Test that the call statistics show exact call counts of the top functions."""
+    with cProfile.Profile() as profile:
+        _ = _work()
+
+    text = _render(call_stats_table(profile, sort=CallSort.CALLS, limit=3))
+
+    assert "Top 3 of" in text
+    leaf = next(line for line in text.splitlines() if "_leaf (test_profiling" in line)
+    assert leaf.split()[1] == f"{LEAF_CALLS}"
+
+
+def test_call_stats_table_prefix() -> None:
+    """Test that the call statistics can be limited to a module prefix."""
+    with cProfile.Profile() as profile:
+        _ = json.dumps(list(range(10)))
+        _ = _work()
+
+    text = _render(call_stats_table(profile, prefix="json"))
+
+    assert "dumps (__init__.py" in text
+    assert "_work" not in text
@@ -0,0 +1,126 @@
+"""Test the warm server of `dojo run --warm`."""
+
+import contextlib
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from debug_dojo._server import is_supported, run_warm, serve_forever
+
+pytestmark = pytest.mark.skipif(not is_supported(), reason="needs fork")
+
+ASSETS = Path(__file__).parent / "assets"
+STARTUP_TIMEOUT_S = 20
+POLL_INTERVAL_S = 0.05
+
+
+@pytest.fixture
+def socket_path() -> Generator[Path]:
+    """Yield a socket path short enough for `AF_UNIX`.
+
+    Yields:
+        Path: A path in a fresh temporary directory.
+
+    """
+    with tempfile.TemporaryDirectory(prefix="dojo-") as directory:
+        yield Path(directory) / "dojo.sock"
+
+
+@contextlib.contextmanager
+def _serving(socket_path: Path, cwd: Path | None = None) -> Generator[Path]:
+    """Run `dojo serve` on a socket, in a working directory.
+
+    Yields:
+        Path: The socket the server listens on.
+
+    """
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "debug_dojo", "serve", "--socket", str(socket_path)],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT_S
+    while not socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL_S)
+    try:
+        yield socket_path
+    finally:
+        process.terminate()
+        _ = process.wait(STARTUP_TIMEOUT_S)
+
+
+@pytest.fixture
+def server(socket_path: Path) -> Generator[Path]:
+    """Start `dojo serve` on a socket.
+
+    Yields:
+        Path: The socket the server listens on.
+
+    """
+    with _serving(socket_path) as path:
+        yield path
+
+
+def test_no_server(socket_path: Path) -> None:
+    """Test that a warm run reports a missing server, to run in-process instead."""
+    assert run_warm(["script.py"], socket_path) is None
+
+
+def test_warm_run(
+    server: Path, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+) -> None:
+    """Test that the forked child runs in the client's directory and streams."""
+    script = tmp_path / "script.py"
+    _ = script.write_text(
+        "import os, sys\nprint(os.getcwd(), sys.argv[1:])\n", encoding="utf-8"
+    )
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(tmp_path)
+        code = run_warm([str(script), "--flag"], server)
+
+    assert code == 0
+    assert f"{tmp_path} ['--flag']" in capfd.readouterr().out
+
+
+def test_warm_run_exit_code(server: Path, tmp_path: Path) -> None:
+    """Test that the exit code of the forked child is reported."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Without a terminal, the failing frames are saved in the directory.
+        monkeypatch.chdir(tmp_path)
+        code = run_warm([str(ASSETS / "main_exception.py")], server)
+
+    assert code == 1
+
+
+def test_second_server_refused(server: Path) -> None:
+    """Test that a second server does not steal the socket of a running one."""
+    with pytest.raises(OSError, match="already listens"):
+        serve_forever(server, lambda _argv: 0)
+
+
+def test_config_added_after_start(
+    socket_path: Path, tmp_path: Path, capfd: pytest.CaptureFixture[str]
+) -> None:
+    """Test that a run picks up a `dojo.toml` created after the server started."""
+    (tmp_path / ".git").mkdir()
+    script = tmp_path / "script.py"
+    _ = script.write_text(
+        "import os\nprint(os.environ['PYTHONBREAKPOINT'])\n", encoding="utf-8"
+    )
+
+    with _serving(socket_path, cwd=tmp_path) as path:
+        _ = (tmp_path / "dojo.toml").write_text(
+            '[debuggers]\ndefault = "pdb"\n', encoding="utf-8"
+        )
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.chdir(tmp_path)
+            code = run_warm([str(script)], path)
+
+    assert code == 0
+    assert "pdb.set_trace" in capfd.readouterr().out.split()
@@ -0,0 +1,130 @@
+"""Test post-mortem snapshots and their replay."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+from rich.console import Console
+
+from debug_dojo._snapshot import (
+    MAX_FRAMES,
+    MAX_LOCALS,
+    MAX_REPR_LENGTH,
+    SnapshotBrowser,
+    load_snapshot,
+    replay_snapshot,
+    take_snapshot,
+    write_snapshot,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DEEP_RECURSION = MAX_FRAMES + 20
+LARGE_SIZE = 1_000_000
+
+
+class _BrokenRepr:
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        msg = "no repr"
+        raise RuntimeError(msg)
+
+
+def _fail(depth: int) -> None:
+    """Recurse, then fail with large and broken locals in the innermost frame.
+
+    Raises:
+        ValueError: Always.
+
+    """
+    if depth:
+        _fail(depth - 1)
+    large = list(range(LARGE_SIZE))
+    broken = _BrokenRepr()
+    msg = f"failed with {len(large)} items and {broken.__class__.__name__}"
+    raise ValueError(msg)
+
+
+def _fail_with(value: str) -> None:
+    """Fail with a message and a local holding the value.
+
+    Raises:
+        ValueError: Always.
+
+    """
+    raise ValueError(value)
+
+
+def _exception(depth: int = 0) -> ValueError:
+    with pytest.raises(ValueError, match="failed") as exc_info:
+        _fail(depth)
+    return exc_info.value
+
+
+def test_snapshot_frames() -> None:
+    """Test that the failing frames are captured with bounded locals."""
+    snapshot = take_snapshot(_exception())
+
+    innermost = snapshot.frames[-1]
+    assert snapshot.exception.startswith("ValueError: failed")
+    assert innermost.function == "_fail"
+    assert (
+        "raise ValueError(msg)"
+        in innermost.context[innermost.lineno - innermost.first_context_line]
+    )
+    assert len(innermost.locals["large"]) <= MAX_REPR_LENGTH
+    assert "_BrokenRepr" in innermost.locals["broken"]
+
+
+def test_snapshot_keeps_innermost_frames() -> None:
+    """Test that deep tracebacks keep only their innermost frames."""
+    snapshot = take_snapshot(_exception(DEEP_RECURSION))
+
+    assert len(snapshot.frames) == MAX_FRAMES
+    assert snapshot.omitted_frames > 0
+    assert all(len(frame.locals) <= MAX_LOCALS for frame in snapshot.frames)
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    """Test that a written snapshot loads back unchanged."""
+    exception = _exception()
+
+    path = write_snapshot(exception, tmp_path / "snapshots")
+
+    loaded = load_snapshot(path)
+    expected = take_snapshot(exception)
+    assert (loaded.exception, loaded.frames) == (expected.exception, expected.frames)
+
+
+def test_browser_commands() -> None:
+    """Test moving between frames and printing locals in the browser."""
+    snapshot = take_snapshot(_exception(depth=1))
+    output = io.StringIO()
+    browser = SnapshotBrowser(snapshot, Console(file=output, width=200))
+    browser.use_rawinput = False
+    browser.stdin = io.StringIO("up\nlocals\ndown\np msg\nframe 99\nquit\n")
+
+    browser.cmdloop()
+
+    rendered = output.getvalue()
+    assert "Locals of _fail" in rendered
+    assert "depth" in rendered
+    assert "'failed with" in rendered
+    assert "No such frame" in rendered
+
+
+def test_replay_escapes_markup(tmp_path: Path) -> None:
+    """Test that markup-like exception messages and locals are printed verbatim."""
+    payload = "[/x] [bold]"
+    with pytest.raises(ValueError, match="x") as exc_info:
+        _fail_with(payload)
+    path = write_snapshot(exc_info.value, tmp_path)
+    output = io.StringIO()
+
+    replay_snapshot(path, browse=False, console=Console(file=output, width=200))
+
+    rendered = output.getvalue()
+    assert f"ValueError: {payload}" in rendered
+    assert f"'{payload}'" in rendered
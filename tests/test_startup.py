@@ -0,0 +1,117 @@
+"""Test the import cost of installing debug-dojo."""
+
+import os
+import subprocess  # noqa: S404
+import sys
+import timeit
+from pathlib import Path
+
+INSTALL_IMPORT_BUDGET_US = 80_000
+"""Budget for the cumulative import time of `debug_dojo.install`, config included."""
+INSTALLERS_IMPORT_BUDGET_US = 50_000
+"""Budget for the cumulative import time of `debug_dojo._installers`."""
+
+HEAVY_MODULES = frozenset(
+    {
+        "IPython",
+        "dacite",
+        "debug_dojo._compare",
+        "ipdb",
+        "pudb",
+        "rich.console",
+        "rich.traceback",
+        "typer",
+    }
+)
+"""Modules that must not be imported until a debugging tool is first used."""
+CLI_MODULES = frozenset({"click", "rich", "typer", "typer._click"})
+"""Modules that a plain `dojo run` must not import."""
+RUN_OVERHEAD_BUDGET_S = 0.15
+"""Budget for the wall time of `dojo run noop.py` over that of `python noop.py`."""
+
+
+def _import_times(
+    statement: str, cwd: Path, environment: dict[str, str] | None = None
+) -> dict[str, int]:
+    """Run a statement under `-X importtime` and collect cumulative import times.
+
+    Returns:
+        dict[str, int]: Cumulative import time in microseconds per module name.
+
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        cwd=cwd,
+        env={**os.environ, **(environment or {})},
+        text=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_install_skips_heavy_imports(tmp_path: Path) -> None:
+    """Test that `import debug_dojo.install` defers rich and debugger imports."""
+    times = _import_times("import debug_dojo.install", tmp_path)
+
+    assert "debug_dojo.install" in times
+    assert not HEAVY_MODULES & times.keys()
+
+
+def test_install_import_budget(tmp_path: Path) -> None:
+    """Test that installing debug-dojo stays within the import budget."""
+    times = _import_times("import debug_dojo.install", tmp_path)
+
+    assert times["debug_dojo.install"] < INSTALL_IMPORT_BUDGET_US
+    assert times["debug_dojo._installers"] < INSTALLERS_IMPORT_BUDGET_US
+
+
+def test_disabled_tools_skip_heavy_imports(tmp_path: Path) -> None:
+    """Test that disabled tools can be called without importing rich or a debugger."""
+    times = _import_times(
+        "import debug_dojo.install; b(); p(1); i(1); c(1, 2); breakpoint()",
+        tmp_path,
+        {"PYTHONBREAKPOINT": "0"},
+    )
+
+    assert not HEAVY_MODULES & times.keys()
+
+
+def test_run_skips_cli_imports(tmp_path: Path) -> None:
+    """Test that a plain `dojo run` imports neither typer, click nor rich."""
+    _ = (tmp_path / "noop.py").write_text("", encoding="utf-8")
+
+    statement = "import sys; sys.argv = ['dojo', 'run', 'noop.py']; {}"
+    times = _import_times(
+        statement.format("from debug_dojo._entry import main; main()"), tmp_path
+    )
+
+    assert "debug_dojo._execution" in times
+    assert not CLI_MODULES & times.keys()
+
+
+def test_run_overhead_budget(tmp_path: Path) -> None:
+    """Test that `dojo run noop.py` stays within its startup budget."""
+    noop = tmp_path / "noop.py"
+    _ = noop.write_text("", encoding="utf-8")
+
+    def wall_time(*arguments: str) -> float:
+        return min(
+            timeit.repeat(
+                lambda: subprocess.run(  # noqa: S603
+                    [sys.executable, *arguments], check=True, cwd=tmp_path
+                ),
+                number=1,
+                repeat=3,
+            )
+        )
+
+    overhead = wall_time("-m", "debug_dojo", "run", str(noop)) - wall_time(str(noop))
+
+    assert overhead < RUN_OVERHEAD_BUDGET_S
@@ -0,0 +1,148 @@
+"""Test the usage statistics of the debugging tools, `dojo run --stats`."""
+
+import builtins
+import json
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from debug_dojo._cli import cli
+from debug_dojo._config_models import DebugDojoConfig, InstallMode
+from debug_dojo._installers import install_features
+from debug_dojo._stats import BREAKPOINT_TOOL, CallSite, ToolStats, recording
+
+if TYPE_CHECKING:
+    from debug_dojo._breakpoint import Breakpoint
+
+CALLS = 5
+SCRIPT = """\
+for index in range(5):
+    p(index)
+    b(index < 0)
+"""
+
+
+@pytest.fixture(autouse=True)
+def tools(config: DebugDojoConfig) -> Iterator[None]:
+    """Install the tools without their debugger, and clean up builtins after.
+
+    Yields:
+        None: While the tools are installed.
+
+    """
+    install_features(config.features)
+    with patch("debug_dojo._breakpoint.start_debugger"):
+        yield
+    for key in ("i", "p", "c", "b"):
+        if hasattr(builtins, key):
+            delattr(builtins, key)
+
+
+def _tool(name: str) -> Callable[..., None]:
+    """Look up a tool in builtins.
+
+    Returns:
+        Callable[..., None]: The tool.
+
+    """
+    return cast("Callable[..., None]", getattr(builtins, name))
+
+
+def _site(stats: ToolStats, tool: str) -> CallSite:
+    """Find the only call site of a tool.
+
+    Returns:
+        CallSite: The call site.
+
+    """
+    (site,) = (site for site in stats.sites.values() if site.tool == tool)
+    return site
+
+
+def test_calls_per_site(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that the calls of each tool are counted per call site."""
+    with recording(DebugDojoConfig()) as stats:
+        for index in range(CALLS):
+            _tool("p")(index)
+            _tool("b")(index < 0)
+
+    site = _site(stats, "p")
+    assert (site.file, site.calls, site.entries) == (__file__, CALLS, CALLS)
+    assert site.total_ns >= site.max_ns > 0
+    assert _site(stats, "b").calls == CALLS
+    assert _site(stats, "b").entries == 0
+    assert capsys.readouterr().out.split() == [str(index) for index in range(CALLS)]
+
+
+def test_breakpoint_entries() -> None:
+    """Test that `b` and `breakpoint()` count entries and stop in their caller."""
+    with (
+        patch("debug_dojo._stats.start_debugger") as start,
+        recording(DebugDojoConfig()) as stats,
+    ):
+        for _ in range(CALLS):
+            _tool("b")(once=True)
+        breakpoint()  # noqa: T100
+
+    assert (_site(stats, "b").calls, _site(stats, "b").entries) == (CALLS, 1)
+    assert _site(stats, BREAKPOINT_TOOL).first_entry_ns > 0
+    assert cast("MagicMock", start).call_args.args[0] is sys._getframe()  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
+
+
+def test_tools_restored() -> None:
+    """Test that the tools and the breakpoint hook are restored on exit."""
+    b, hook = _tool("b"), sys.breakpointhook
+
+    with recording(DebugDojoConfig()):
+        assert _tool("b") is not b
+        cast("Breakpoint", _tool("b")).disable()
+
+    assert _tool("b") is b
+    assert sys.breakpointhook is hook
+
+
+def test_disabled_records_nothing() -> None:
+    """Test that no-op stubs of the disabled install mode are left alone."""
+    b = _tool("b")
+
+    with recording(DebugDojoConfig(install_mode=InstallMode.DISABLED)) as stats:
+        assert _tool("b") is b
+
+    assert not stats.sites
+
+
+def test_write_and_load(tmp_path: Path) -> None:
+    """Test that written statistics are loaded back unchanged."""
+    path = tmp_path / "stats.json"
+    with recording(DebugDojoConfig()) as stats:
+        _tool("b")(False)  # noqa: FBT003
+
+    stats.write(path)
+
+    assert ToolStats.load(path) == stats
+    assert ToolStats.load(path).table().row_count == 1
+
+
+def test_run_stats_output(tmp_path: Path, runner: CliRunner) -> None:
+    """Test that `dojo run --stats-output` writes the statistics of the target."""
+    script, path = tmp_path / "script.py", tmp_path / "stats.json"
+    _ = script.write_text(SCRIPT, encoding="utf-8")
+
+    result = runner.invoke(
+        cli, ["run", "--stats-output", str(path), "--no-cache", str(script)]
+    )
+    shown = runner.invoke(cli, ["stats", str(path)])
+
+    assert result.exit_code == 0, result.output
+    sites = cast("list[dict[str, object]]", json.loads(path.read_text())["sites"])
+    assert {(site["tool"], site["calls"]) for site in sites} == {
+        ("p", CALLS),
+        ("b", CALLS),
+    }
+    assert shown.exit_code == 0
+    assert "Debugging tool calls" in shown.output
@@ -0,0 +1,157 @@
+"""Test the `_toml` module."""
+
+import timeit
+from pathlib import Path
+
+import pytest
+from tomlkit import parse
+
+from debug_dojo._toml import extract_table, read_toml_table
+
+SPEEDUP_THRESHOLD = 5.0
+"""Minimal speedup of the table reader over a full `tomlkit` parse."""
+
+DOJO_TABLE = """
+[tool.debug_dojo]
+    install_mode = "lazy"
+
+[tool.debug_dojo.debuggers]
+    default = "pudb"
+"""
+
+
+def _large_pyproject(tables: int = 500) -> str:
+    """Build a synthetic multi-thousand-line `pyproject.toml`.
+
+    Returns:
+        str: The document, with the debug-dojo table in the middle.
+
+    """
+    sections = [
+        "\n".join(
+            (
+                f"[tool.other_{index}]",
+                f'name = "tool {index}"',
+                f"level = {index}",
+                'paths = ["src", "tests"]',
+                f"flags = {{ fast = true, retries = {index} }}",
+                "",
+            )
+        )
+        for index in range(tables)
+    ]
+    sections.insert(tables // 2, DOJO_TABLE)
+    return '[project]\nname = "monorepo"\n' + "\n".join(sections)
+
+
+@pytest.fixture
+def large_pyproject(tmp_path: Path) -> Path:
+    """Write a large synthetic `pyproject.toml`.
+
+    Returns:
+        Path: The path to the written file.
+
+    """
+    path = tmp_path / "pyproject.toml"
+    _ = path.write_text(_large_pyproject(), encoding="utf-8")
+    return path
+
+
+def test_read_table(large_pyproject: Path) -> None:
+    """Test that the table matches the one parsed from the full document."""
+    expected = parse(large_pyproject.read_text(encoding="utf-8")).unwrap()
+    table = read_toml_table(large_pyproject, "tool.debug_dojo")
+
+    assert table == expected["tool"]["debug_dojo"]
+    assert table["debuggers"] == {"default": "pudb"}
+
+
+def test_read_missing_table(tmp_path: Path) -> None:
+    """Test that a missing table reads as empty."""
+    path = tmp_path / "pyproject.toml"
+    _ = path.write_text('[project]\nname = "x"\n', encoding="utf-8")
+
+    assert read_toml_table(path, "tool.debug_dojo") == {}
+
+
+def test_read_inline_table(tmp_path: Path) -> None:
+    """Test that a table without its own header falls back to a full parse."""
+    path = tmp_path / "pyproject.toml"
+    _ = path.write_text(
+        '[tool]\ndebug_dojo = { debuggers = { default = "pdb" } }\n', encoding="utf-8"
+    )
+
+    assert read_toml_table(path, "tool.debug_dojo") == {"debuggers": {"default": "pdb"}}
+
+
+HEADER_IN_STRING = """\
+[tool.other]
+notes = '''
+[tool.debug_dojo]
+install_mode = "lazy"
+[notes]
+'''
+"""
+DOTTED_KEYS = """\
+[tool]
+debug_dojo.install_mode = "lazy"
+
+[tool.debug_dojo.debuggers]
+default = "pdb"
+"""
+
+
+@pytest.mark.parametrize(
+    ("document", "expected"),
+    [
+        pytest.param(HEADER_IN_STRING, {}, id="header-in-string"),
+        pytest.param(
+            DOTTED_KEYS,
+            {"install_mode": "lazy", "debuggers": {"default": "pdb"}},
+            id="dotted-keys",
+        ),
+    ],
+)
+def test_read_full_parse_fallback(
+    tmp_path: Path, document: str, expected: dict[str, object]
+) -> None:
+    """Test that headers in strings and tables split by dotted keys are read fully."""
+    path = tmp_path / "pyproject.toml"
+    _ = path.write_text(document, encoding="utf-8")
+
+    assert extract_table(document, "tool.debug_dojo") is None
+    assert read_toml_table(path, "tool.debug_dojo") == expected
+
+
+def test_read_invalid(tmp_path: Path) -> None:
+    """Test that invalid TOML raises a ValueError."""
+    path = tmp_path / "pyproject.toml"
+    _ = path.write_text("[tool.debug_dojo]\ndefault = \n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match=r"(?i)invalid"):
+        _ = read_toml_table(path, "tool.debug_dojo")
+
+
+def test_extract_ignores_similar_names() -> None:
+    """Test that tables sharing a name prefix are not extracted."""
+    document = "[tool.debug_dojo_extra]\nx = 1\n"
+
+    assert extract_table(document, "tool.debug_dojo") is None
+
+
+def test_benchmark_large_pyproject(large_pyproject: Path) -> None:
+    """Benchmark the table reader against a full `tomlkit` parse."""
+    text = large_pyproject.read_text(encoding="utf-8")
+
+    full_parse = min(
+        timeit.repeat(lambda: parse(text).unwrap(), number=1, repeat=3),
+    )
+    table_read = min(
+        timeit.repeat(
+            lambda: read_toml_table(large_pyproject, "tool.debug_dojo"),
+            number=1,
+            repeat=3,
+        ),
+    )
+
+    assert full_parse / table_read > SPEEDUP_THRESHOLD
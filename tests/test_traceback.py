@@ -0,0 +1,140 @@
+"""Test the rich tracebacks with bounded locals."""
+
+from __future__ import annotations
+
+import io
+import timeit
+from typing import TYPE_CHECKING, ClassVar
+
+import pytest
+from rich.console import Console
+from rich.traceback import Traceback
+
+from debug_dojo._traceback import TracebackLimits, bounded_traceback
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEPTH = 30
+SHOWN_FRAMES = 10
+MAX_LOCALS = 2
+MAX_REPR_LENGTH = 40
+BUFFER_SIZE = 10_000
+ITEMS = 1_000
+BENCHMARK_SPEEDUP = 2
+"""Minimal speedup of the bounded traceback over rich's on the deep traceback."""
+
+
+class _Counted:
+    """A value counting how many times its repr is built."""
+
+    calls: ClassVar[int] = 0
+
+    def __init__(self) -> None:
+        self.items: list[int] = list(range(ITEMS))
+
+    def __repr__(self) -> str:  # pyright: ignore[reportImplicitOverride]
+        type(self).calls += 1
+        return repr(self.items)
+
+
+class _Skipped(_Counted):
+    """A subclass of a skipped type."""
+
+
+def _recurse(depth: int, make_local: Callable[[], object]) -> None:
+    """Recurse, with a large local in each frame, then fail.
+
+    Raises:
+        ValueError: At the bottom of the recursion.
+
+    """
+    local = make_local()
+    buffer = bytes(BUFFER_SIZE)
+    if depth:
+        _recurse(depth - 1, make_local)
+    msg = f"failed with {type(local).__name__} and {len(buffer)} bytes"
+    raise ValueError(msg)
+
+
+def _exception(make_local: Callable[[], object] = _Counted) -> ValueError:
+    _Counted.calls = 0
+    with pytest.raises(ValueError, match="failed") as exc_info:
+        _recurse(DEPTH, make_local)
+    return exc_info.value
+
+
+def _render(renderable: Traceback) -> str:
+    output = io.StringIO()
+    Console(file=output, width=200).print(renderable)
+    return output.getvalue()
+
+
+def _bounded(exception: BaseException, limits: TracebackLimits) -> Traceback:
+    return bounded_traceback(
+        type(exception),
+        exception,
+        exception.__traceback__,
+        show_locals=True,
+        limits=limits,
+    )
+
+
+def test_only_shown_frames_have_locals() -> None:
+    """Test that the locals of hidden frames are never represented."""
+    exception = _exception()
+
+    rendered = _render(_bounded(exception, TracebackLimits(max_frames=SHOWN_FRAMES)))
+
+    # The outermost shown frame is the test helper, which holds no counted value.
+    assert _Counted.calls == SHOWN_FRAMES - 1
+    assert "frames hidden" in rendered
+
+
+def test_locals_bounded() -> None:
+    """Test the limits on the number and length of the locals' reprs."""
+    exception = _exception()
+    limits = TracebackLimits(
+        max_frames=SHOWN_FRAMES, max_locals=MAX_LOCALS, max_repr_length=MAX_REPR_LENGTH
+    )
+
+    frame = _bounded(exception, limits).trace.stacks[0].frames[-1]
+
+    assert frame.locals is not None
+    reprs = {name: node.value_repr for name, node in frame.locals.items()}
+    assert list(reprs) == ["depth", "local", "..."]
+    assert reprs["..."] == "<2 more locals>"
+    assert all(len(text) <= MAX_REPR_LENGTH for text in reprs.values())
+
+
+def test_skipped_types() -> None:
+    """Test that values of skipped types, and their subclasses, are not represented."""
+    exception = _exception(_Skipped)
+    limits = TracebackLimits(
+        max_frames=SHOWN_FRAMES, skip_types=frozenset({"_Counted"})
+    )
+
+    rendered = _render(_bounded(exception, limits))
+
+    assert _Counted.calls == 0
+    assert "<_Skipped not shown>" in rendered
+
+
+def test_benchmark_deep_traceback() -> None:
+    """Benchmark large locals in a deep traceback against rich alone."""
+    exception = _exception()
+
+    def rich_rendered() -> None:
+        _ = _render(
+            Traceback.from_exception(
+                type(exception), exception, exception.__traceback__, show_locals=True
+            )
+        )
+
+    def bounded_rendered() -> None:
+        _ = _render(_bounded(exception, TracebackLimits()))
+
+    rich_time = min(timeit.repeat(rich_rendered, number=1, repeat=3))
+    bounded_time = min(timeit.repeat(bounded_rendered, number=1, repeat=3))
+
+    assert rich_time / bounded_time > BENCHMARK_SPEEDUP
@@ -0,0 +1,126 @@
+"""Test the watch mode of `dojo run`."""
+
+import os
+import signal
+import subprocess  # noqa: S404
+import sys
+import time
+from pathlib import Path
+from typing import IO
+from unittest.mock import patch
+
+import pytest
+
+from debug_dojo._watch import is_supported, loaded_modules, watch
+
+pytestmark = pytest.mark.skipif(not is_supported(), reason="needs fork")
+
+TIMEOUT_S = 20
+POLL_INTERVAL_S = 0.05
+SCRIPT = """\
+import helper
+
+with open("runs.log", "a") as log:
+    log.write(helper.VALUE + "\\n")
+"""
+
+
+def _wait_for_runs(log: Path, runs: int) -> list[str]:
+    """Wait until the target has logged a number of runs.
+
+    Returns:
+        list[str]: The logged lines.
+
+    """
+    deadline = time.monotonic() + TIMEOUT_S
+    while time.monotonic() < deadline:
+        lines = log.read_text("utf-8").splitlines() if log.exists() else []
+        if len(lines) >= runs:
+            return lines
+        time.sleep(POLL_INTERVAL_S)
+    return []
+
+
+def test_loaded_modules(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that project modules and third-party packages are told apart."""
+    _ = (tmp_path / "project_module.py").write_text("", encoding="utf-8")
+    monkeypatch.setattr(sys, "path", [str(tmp_path), *sys.path])
+    monkeypatch.delitem(sys.modules, "project_module", raising=False)
+    __import__("project_module")
+
+    project, third_party = loaded_modules(tmp_path)
+
+    assert project == [str((tmp_path / "project_module.py").resolve())]
+    assert "pytest" in third_party
+    assert not any(name.startswith("debug_dojo") for name in third_party)
+
+
+def _stop(_message: str) -> None:
+    """Stop watching after the first run.
+
+    Raises:
+        KeyboardInterrupt: Always.
+
+    """
+    raise KeyboardInterrupt
+
+
+@pytest.mark.parametrize("preload", [False, True])
+def test_preload_opt_in(tmp_path: Path, *, preload: bool) -> None:
+    """Test that third-party packages are only imported in the watcher on request."""
+    with (
+        patch("debug_dojo._watch._run_forked", return_value=(0, [], ["package"])),
+        patch("debug_dojo._watch._import_all") as import_all,
+        pytest.raises(KeyboardInterrupt),
+    ):
+        watch(lambda: 0, [], root=tmp_path, notify=_stop, preload=preload)
+
+    assert import_all.called is preload
+
+
+def _wait_for_status(process: subprocess.Popen[str]) -> str:
+    """Read the output of `dojo run --watch` until it waits for changes.
+
+    Returns:
+        str: The output read.
+
+    """
+    stdout: IO[str] | None = process.stdout
+    assert stdout is not None
+    lines: list[str] = []
+    while not lines or "Watching" not in lines[-1]:
+        lines.append(stdout.readline())
+        assert lines[-1], "dojo run --watch exited"
+    return "".join(lines)
+
+
+def test_rerun_on_imported_module_change(tmp_path: Path) -> None:
+    """Test that changing a module imported by the target runs it again."""
+    _ = (tmp_path / "script.py").write_text(SCRIPT, encoding="utf-8")
+    helper = tmp_path / "helper.py"
+    _ = helper.write_text("VALUE = 'first'\n", encoding="utf-8")
+    log = tmp_path / "runs.log"
+
+    process = subprocess.Popen(
+        [sys.executable, "-m", "debug_dojo", "run", "--watch", "script.py"],
+        cwd=tmp_path,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert "Watching 2 files" in _wait_for_status(process)
+        assert _wait_for_runs(log, 1) == ["first"]
+
+        _ = helper.write_text("VALUE = 'second'\n", encoding="utf-8")
+        modified = helper.stat().st_mtime_ns + 1_000_000_000
+        os.utime(helper, ns=(modified, modified))
+
+        assert "Change detected" in _wait_for_status(process)
+        assert _wait_for_runs(log, 2) == ["first", "second"]
+    finally:
+        # Interrupts the watching process only, as it waits for changes.
+        process.send_signal(signal.SIGINT)
+        output, _ = process.communicate(timeout=TIMEOUT_S)
+
+    assert process.returncode == 0
+    assert "Stopped watching." in output